@@ -0,0 +1,135 @@
+"""Asynchronous, bounded-concurrency companion to StoreClient."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+RETRY_STATUSES = {502, 503, 504}
+
+
+@dataclass
+class TimedResponse:
+    """A response together with the wall time of its final attempt and the attempts it took."""
+
+    response: requests.Response
+    elapsed: float
+    attempts: int
+
+
+class AsyncStoreClient:
+    """
+    Fan out catalog and sign-in calls against the BrowserStack demo APIs.
+
+    Requests go through one requests.Session whose connection pool is sized to
+    the concurrency limit, so HTTP/1.1 keep-alive connections are reused across
+    calls. Blocking I/O runs in a thread pool of the same size; an asyncio
+    semaphore caps the number of requests in flight. Transient failures
+    (connection errors, timeouts and 502/503/504) are retried with exponential
+    backoff.
+    """
+
+    def __init__(self, base_url: str, concurrency: int = 8, timeout: float = 15,
+                 retries: int = 2, backoff: float = 0.2,
+                 session: Optional[requests.Session] = None):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="store-client")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _limiter(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; each asyncio.run() gets its own.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def request(self, method: str, path: str, **kwargs) -> TimedResponse:
+        """
+        Send a request, retrying transient failures with exponential backoff.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the API base URL.
+            **kwargs: Extra arguments passed to requests.Session.request.
+
+        Returns:
+            TimedResponse for the final attempt. Its elapsed time covers that
+            attempt only, not time spent waiting for a concurrency slot.
+
+        Raises:
+            requests.RequestException: If every attempt failed at the transport level.
+        """
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        async with self._limiter():
+            while True:
+                attempt += 1
+                # Timed per attempt, once a slot is free: queueing behind the limit is not request time.
+                start = time.perf_counter()
+                try:
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        functools.partial(self.session.request, method, url, timeout=self.timeout, **kwargs),
+                    )
+                    if response.status_code not in RETRY_STATUSES or attempt > self.retries:
+                        elapsed = time.perf_counter() - start
+                        break
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt > self.retries:
+                        raise
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+        logger.info("%s %s -> %s in %.3fs (%s attempt(s))",
+                    method, url, response.status_code, elapsed, attempt)
+        return TimedResponse(response, elapsed, attempt)
+
+    async def list_products(self) -> TimedResponse:
+        """GET /products."""
+        return await self.request("GET", "/products")
+
+    async def sign_in(self, username: str, password: str) -> TimedResponse:
+        """POST /signin with username/password payload."""
+        payload = {"userName": username, "password": password}
+        return await self.request("POST", "/signin", json=payload)
+
+    async def sign_in_all(self, credentials: Iterable[Tuple[str, str]]) -> List[TimedResponse]:
+        """
+        Sign in every (username, password) pair concurrently.
+
+        Returns:
+            TimedResponses in the same order as the credentials.
+        """
+        return await asyncio.gather(
+            *(self.sign_in(username, password) for username, password in credentials))
+
+    async def fetch_catalog(self, times: int) -> List[TimedResponse]:
+        """Request the product catalog `times` times concurrently."""
+        return await asyncio.gather(*(self.list_products() for _ in range(times)))
+
+    def close(self):
+        """Close pooled connections and the I/O thread pool."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
@@ -0,0 +1,167 @@
+"""In-memory LRU response cache with TTL and optional disk persistence."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from utils.file_lock import atomic_write
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """The parts of a requests.Response needed to replay it later."""
+
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+    _payload: object = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResponse":
+        return cls(response.url, response.status_code, dict(response.headers), response.content)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def json(self):
+        """Return the decoded JSON body, parsed once per cached entry."""
+        if self._payload is None:
+            self._payload = json.loads(self.content)
+        return self._payload
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a requests.Response so callers cannot tell it was cached."""
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers.update(self.headers)
+        response._content = self.content  # pylint: disable=protected-access
+        response.encoding = "utf-8"
+        return response
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachedResponse":
+        return cls(data["url"], data["status_code"], data["headers"],
+                   base64.b64decode(data["content"]), data["stored_at"])
+
+
+class ResponseCache:
+    """
+    Least-recently-used cache of GET responses.
+
+    Entries younger than the TTL are served without touching the network.
+    Older entries are kept while they carry an ETag or Last-Modified validator
+    so the client can revalidate them with a conditional request; a 304 reply
+    refreshes the entry instead of downloading the body again.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 64,
+                 disk_dir: Optional[str] = None):
+        """
+        Initialise the cache.
+
+        Args:
+            ttl_seconds: Age after which an entry must be revalidated.
+            max_entries: Number of entries kept in memory before evicting the oldest.
+            disk_dir: Optional directory used to persist entries between runs.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def lookup(self, key: str) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Return the entry for a key and whether it is still fresh.
+
+        Args:
+            key: Cache key, typically "<METHOD> <URL>".
+
+        Returns:
+            Tuple of (entry or None, is_fresh).
+        """
+        entry = self._entries.get(key) or self._load(key)
+        if entry is None:
+            return None, False
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        fresh = time.time() - entry.stored_at <= self.ttl_seconds
+        if not fresh and not (entry.etag or entry.last_modified):
+            self.evict(key)
+            return None, False
+        return entry, fresh
+
+    def store(self, key: str, entry: CachedResponse):
+        """Add or replace an entry, evicting the least recently used if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._save(key, entry)
+
+    def refresh(self, key: str, entry: CachedResponse):
+        """Mark an entry as fresh again after a 304 Not Modified reply."""
+        entry.stored_at = time.time()
+        self.revalidated += 1
+        self._save(key, entry)
+
+    def evict(self, key: str):
+        """Remove an entry from memory and disk."""
+        self._entries.pop(key, None)
+        if self.disk_dir:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/revalidation counters."""
+        return {"hits": self.hits, "misses": self.misses, "revalidated": self.revalidated}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def _load(self, key: str) -> Optional[CachedResponse]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._path(key)) as handle:
+                return CachedResponse.from_dict(json.load(handle))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save(self, key: str, entry: CachedResponse):
+        if self.disk_dir:
+            atomic_write(self._path(key), json.dumps(entry.to_dict()))
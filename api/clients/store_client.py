@@ -3,35 +3,144 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 import requests
 
+from api.clients.response_cache import CachedResponse, ResponseCache
 from utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
 
+def extract_products(payload) -> List[Dict[str, object]]:
+    """Return the product list from a catalog payload, with or without a "products" wrapper."""
+    if isinstance(payload, dict) and "products" in payload:
+        return payload["products"]
+    return payload
+
+
 class StoreClient:
-    """HTTP helper that wraps the BrowserStack demo catalog and sign-in APIs."""
+    """
+    HTTP helper that wraps the BrowserStack demo catalog and sign-in APIs.
+
+    When a ResponseCache is supplied, catalog reads are served from it while
+    fresh and revalidated with conditional requests (ETag/Last-Modified) once
+    they expire.
+    """
 
-    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None, timeout: float = 15,
+                 cache: Optional[ResponseCache] = None):
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache = cache
+        self.last_response: Optional[requests.Response] = None
         self.session = session or requests.Session()
         self.session.headers.update({"Accept": "application/json"})
 
     def _request(self, method: str, path: str, **kwargs) -> requests.Response:
         url = f"{self.base_url}{path}"
-        response = self.session.request(method, url, timeout=15, **kwargs)
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
         logger.info("%s %s -> %s", method, url, response.status_code)
         return response
 
-    def list_products(self) -> requests.Response:
-        """GET /products."""
-        return self._request("GET", "/products")
+    def _cached_get(self, path: str) -> Optional[CachedResponse]:
+        """
+        GET a path through the cache.
+
+        Returns:
+            The cached entry, or None if the response was not cacheable; in
+            that case the live response is stored on `self.last_response`.
+        """
+        key = f"GET {self.base_url}{path}"
+        entry, fresh = self.cache.lookup(key)
+        if entry and fresh:
+            self.cache.hits += 1
+            return entry
+
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        response = self._request("GET", path, headers=headers)
+
+        if response.status_code == 304 and entry:
+            self.cache.hits += 1
+            self.cache.refresh(key, entry)
+            return entry
+
+        self.cache.misses += 1
+        self.last_response = response
+        if response.status_code != 200:
+            return None
+        entry = CachedResponse.from_response(response)
+        self.cache.store(key, entry)
+        return entry
+
+    def list_products(self, use_cache: bool = True) -> requests.Response:
+        """
+        GET /products.
+
+        Args:
+            use_cache: False always calls the endpoint, even when a fresh
+                cached catalog exists (health checks must reach the API).
+        """
+        if not self.cache or not use_cache:
+            return self._request("GET", "/products")
+        entry = self._cached_get("/products")
+        return entry.to_response() if entry else self.last_response
+
+    def products(self) -> List[Dict[str, object]]:
+        """
+        Return the parsed product catalog.
+
+        With a cache the payload is decoded once per cached entry rather than
+        on every call.
+
+        Raises:
+            requests.HTTPError: If the catalog could not be fetched.
+        """
+        if self.cache:
+            entry = self._cached_get("/products")
+            if entry is None:
+                self.last_response.raise_for_status()
+                return extract_products(self.last_response.json())
+            return extract_products(entry.json())
+        response = self.list_products()
+        response.raise_for_status()
+        return extract_products(response.json())
+
+    def product_price(self, title: str):
+        """
+        Return the catalog price for the product with the given title.
+
+        Raises:
+            KeyError: If no product has that title.
+        """
+        for product in self.products():
+            if product.get("title") == title:
+                return product["price"]
+        raise KeyError(f"Product '{title}' not found in catalog")
 
     def sign_in(self, username: str, password: str) -> requests.Response:
         """POST /signin with username/password payload."""
         payload = {"userName": username, "password": password}
         return self._request("POST", "/signin", json=payload)
+
+    def checkout(self, username: str, items: List[Dict[str, int]], address: Dict[str, str]) -> requests.Response:
+        """
+        POST /checkout to place an order.
+
+        Args:
+            username: Signed-in user placing the order.
+            items: Cart lines as {"id": product id, "quantity": n}.
+            address: Shipping fields (firstName, lastName, addressLine1, province, postCode).
+        """
+        payload = {"userName": username, "items": items, "address": address}
+        return self._request("POST", "/checkout", json=payload)
+
+    def orders(self) -> requests.Response:
+        """GET /orders."""
+        return self._request("GET", "/orders")
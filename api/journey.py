@@ -0,0 +1,216 @@
+"""
+Browserless replay of the storefront purchase journeys.
+
+HttpJourney implements the same methods as pages.journey.BrowserJourney.
+Instead of driving a browser it drives StoreClient:
+- sign-in goes to /signin
+- products are looked up in the session catalog
+- the order is placed through /checkout
+
+The cart and checkout form are kept in memory, so the steps of a scenario
+tagged for the HTTP backend (see the `journey` fixture) take milliseconds
+instead of a browser session. There is no rendered cart or order summary to
+read, so price and total checks assert against the server instead. Each
+cart line is priced from a live /products read that skips the response
+cache, and the placed order is checked against what /checkout charged.
+Checks that depend on rendering (layout, accessibility, modal controls)
+stay on the browser tier.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from api.clients.store_client import StoreClient, extract_products
+from utils.logger import get_logger
+from utils.test_data import ProductCatalog, expected_price_cents, format_price, to_cents
+
+CONFIRMATION_MESSAGE = "Your Order has been successfully placed."
+
+
+@dataclass
+class JourneyState:
+    """What the storefront would be showing for the current scenario."""
+
+    username: Optional[str] = None
+    cart: Dict[int, int] = field(default_factory=dict)  # product id -> quantity, in the order added
+    cart_open: bool = False
+    on_checkout: bool = False
+    address: Dict[str, str] = field(default_factory=dict)
+    order: Optional[dict] = None
+    server_prices: Optional[Dict[int, int]] = None  # product id -> cents, from a live /products read
+
+
+class HttpJourney:
+    """Storefront journey driven through the API instead of a browser."""
+
+    logger = get_logger(__name__)
+
+    def __init__(self, client: StoreClient, catalog: ProductCatalog):
+        self.client = client
+        self.catalog = catalog
+        self.state = JourneyState()
+
+    # Sign-in ---------------------------------------------------------------
+
+    def open_home(self, base_url: str):
+        """Start a fresh storefront visit; nothing is rendered, so only the state is reset."""
+        self.state = JourneyState()
+        self.logger.debug("HTTP journey started for %s", base_url)
+
+    def open_login_panel(self):
+        """The login panel is client-side only; nothing to request."""
+
+    def log_in(self, username: str, password: str):
+        """
+        Sign in through the API.
+
+        Raises:
+            AssertionError: If the API rejects the credentials.
+        """
+        response = self.client.sign_in(username, password)
+        assert response.status_code == 200, \
+            f"API login failed for {username}: {response.status_code} {response.text[:200]}"
+        self.state.username = response.json()["user"]["userName"]
+        self.logger.info("Logged in with %s via the API", username)
+
+    def log_in_as(self, username: str, password: str):
+        """Open the storefront with the persona signed in."""
+        self.open_home("")
+        self.log_in(username, password)
+
+    # Cart ------------------------------------------------------------------
+
+    def add_to_cart(self, product_name: str):
+        """Add one unit of a product; the side cart opens, as it does in the UI."""
+        product = self.catalog.by_title(product_name)
+        self.state.cart[product.id] = self.state.cart.get(product.id, 0) + 1
+        self.state.cart_open = True
+        self.logger.info("Added %s to cart", product_name)
+
+    def server_price_cents(self, product_id: int) -> int:
+        """
+        Return a product's price as the server serves it now, in cents.
+
+        /products is read once per scenario, bypassing the response cache.
+
+        Raises:
+            requests.HTTPError: If the catalog could not be fetched.
+            AssertionError: If the server no longer lists the product.
+        """
+        if self.state.server_prices is None:
+            response = self.client.list_products(use_cache=False)
+            response.raise_for_status()
+            self.state.server_prices = {
+                int(item["id"]): to_cents(item["price"]) for item in extract_products(response.json())}
+        assert product_id in self.state.server_prices, f"Product id {product_id} is not served by /products"
+        return self.state.server_prices[product_id]
+
+    def _check_line(self, product_name: str, product_price):
+        product = self.catalog.by_title(product_name)
+        assert product.id in self.state.cart, f"'{product_name}' is not in the cart"
+        expected_cents = expected_price_cents(product_price)
+        actual_cents = self.server_price_cents(product.id)
+        assert actual_cents == expected_cents, \
+            f"Expected product price '{format_price(expected_cents)}' but the server prices " \
+            f"'{product_name}' at '{format_price(actual_cents)}'"
+
+    def validate_cart_line(self, product_name: str, product_price):
+        """
+        Check a product is in the open cart at the expected price, as the server prices it.
+
+        Args:
+            product_name: Product title.
+            product_price: Expected display price ("$ 799.00") or the catalog Product.
+        """
+        assert self.state.cart_open, "Side cart is not open"
+        self._check_line(product_name, product_price)
+
+    def cart_total_cents(self, server: bool = False) -> int:
+        """Return the cart total in cents, at session catalog prices or (server=True) at live server prices."""
+        total = 0
+        for product_id, quantity in self.state.cart.items():
+            cents = self.server_price_cents(product_id) if server else self.catalog.by_id(product_id).price_cents
+            total += cents * quantity
+        return total
+
+    def _check_total(self, label: str) -> int:
+        total = self.cart_total_cents(server=True)
+        assert self.state.cart and total > 0, f"{label} is {format_price(total)}"
+        shown = self.cart_total_cents()
+        assert shown == total, \
+            f"{label} from the catalog {format_price(shown)} differs from the server's prices {format_price(total)}"
+        return total
+
+    def validate_subtotal(self):
+        """Check the cart subtotal the catalog gives equals the cart priced by the server, and is positive."""
+        total = self._check_total("Cart subtotal")
+        self.logger.info("Subtotal validation passed: %s", format_price(total))
+
+    # Checkout --------------------------------------------------------------
+
+    def proceed_to_checkout(self):
+        """Go to checkout; the UI only offers it for a signed-in user with a non-empty cart."""
+        assert self.state.cart, "Checkout is not offered for an empty cart"
+        assert self.state.username, "Checkout requires a signed-in user"
+        self.state.on_checkout = True
+        self.logger.info("Proceeding to checkout")
+
+    def verify_checkout_page(self) -> bool:
+        return self.state.on_checkout
+
+    def verify_order_line(self, product_name: str, product_price) -> bool:
+        """Check a product is in the order at the expected price, as the server prices it."""
+        assert self.state.on_checkout, "Not on the checkout page"
+        self._check_line(product_name, product_price)
+        return True
+
+    def check_order_total(self) -> bool:
+        """
+        Check the order total against the server's prices.
+
+        No summary is rendered on this tier. The total the session catalog
+        gives must equal the order lines priced by a live /products read;
+        place_order then checks what /checkout actually charges.
+        """
+        assert self.state.on_checkout, "Not on the checkout page"
+        total = self._check_total("Order total")
+        self.logger.info("Order summary total validated: %s", format_price(total))
+        return True
+
+    def fill_checkout_form(self, first_name, last_name, address, state_or_province, postcode):
+        self.state.address = {
+            "firstName": first_name,
+            "lastName": last_name,
+            "addressLine1": address,
+            "province": state_or_province,
+            "postCode": postcode,
+        }
+
+    def place_order(self):
+        """
+        Submit the order through /checkout and check the server priced it like the cart.
+
+        Raises:
+            AssertionError: If the order is rejected or its total differs from the cart.
+        """
+        assert self.state.on_checkout, "Not on the checkout page"
+        items = [{"id": product_id, "quantity": quantity} for product_id, quantity in self.state.cart.items()]
+        response = self.client.checkout(self.state.username, items, self.state.address)
+        assert response.status_code in (200, 201), \
+            f"Checkout failed: {response.status_code} {response.text[:200]}"
+        order = response.json()
+        expected = self.cart_total_cents()
+        actual = to_cents(order.get("total", 0))
+        assert actual == expected, f"Order total {format_price(actual)} differs from cart {format_price(expected)}"
+        charged = {int(line["id"]): to_cents(line["price"]) for line in order.get("items", []) if "price" in line}
+        for product_id, cents in charged.items():
+            catalog_cents = self.catalog.by_id(product_id).price_cents
+            assert cents == catalog_cents, (f"/checkout charged {format_price(cents)} for product {product_id}, "
+                                            f"the catalog lists {format_price(catalog_cents)}")
+        self.state.order = order
+        self.state.cart = {}
+        self.logger.info("Placed order %s for %s", order.get("id"), self.state.username)
+
+    def get_confirmation_message(self) -> str:
+        """Return the message the confirmation page would show, or "" if no order was placed."""
+        return CONFIRMATION_MESSAGE if self.state.order else ""
@@ -0,0 +1 @@
+"""Local stand-in for the bstackdemo UI and API."""
@@ -0,0 +1,25 @@
+"""Run the bstackdemo stand-in: python -m mock_store --port 8000."""
+
+import argparse
+import time
+
+from mock_store.server import MockStoreServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local bstackdemo stand-in.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    args = parser.parse_args()
+
+    server = MockStoreServer(args.host, args.port).start()
+    print(f"BASE_URL={server.base_url} API_BASE_URL={server.api_base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
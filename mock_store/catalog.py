@@ -0,0 +1,63 @@
+"""
+Seed data for the local bstackdemo stand-in.
+
+Product titles, prices and personas mirror the public demo site so feature
+files run unchanged against either target.
+"""
+
+PASSWORD = "testingisfun99"
+
+PERSONAS = [
+    "demouser",
+    "image_not_loading_user",
+    "existing_orders_user",
+    "fav_user",
+    "locked_user",
+]
+
+LOCKED_PERSONAS = {"locked_user"}
+
+_CATALOG = [
+    # (title, vendor, price)
+    ("iPhone 12", "Apple", 799),
+    ("iPhone 12 Mini", "Apple", 699),
+    ("iPhone 12 Pro Max", "Apple", 1099),
+    ("iPhone 12 Pro", "Apple", 999),
+    ("iPhone 11", "Apple", 699),
+    ("iPhone 11 Pro", "Apple", 999),
+    ("iPhone XS", "Apple", 549),
+    ("iPhone XR", "Apple", 499),
+    ("Galaxy S20", "Samsung", 999),
+    ("Galaxy S20+", "Samsung", 1199),
+    ("Galaxy S20 Ultra", "Samsung", 1399),
+    ("Galaxy S10", "Samsung", 899),
+    ("Galaxy S9", "Samsung", 699),
+    ("Galaxy Note 20", "Samsung", 1049),
+    ("Galaxy Note 20 Ultra", "Samsung", 1299),
+    ("Pixel 4", "Google", 899),
+    ("Pixel 3", "Google", 699),
+    ("Pixel 2", "Google", 499),
+    ("One Plus 8", "OnePlus", 699),
+    ("One Plus 8 Pro", "OnePlus", 899),
+]
+
+
+def build_products():
+    """Return the product catalog in the shape served by /api/products."""
+    products = []
+    for index, (title, vendor, price) in enumerate(_CATALOG, start=1):
+        sku = title.replace(" ", "").replace("+", "Plus") + "-device-info.png"
+        products.append({
+            "id": index,
+            "sku": sku,
+            "title": title,
+            "description": title,
+            "availableSizes": [vendor],
+            "style": "Black",
+            "price": price,
+            "installments": 9,
+            "currencyId": "USD",
+            "currencyFormat": "$",
+            "isFav": False,
+        })
+    return products
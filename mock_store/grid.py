@@ -0,0 +1,241 @@
+"""
+Minimal Selenium Grid stand-in.
+
+Implements just enough of the Grid protocol to exercise session budgeting
+without real browsers:
+- GET /status with nodes, maxSessions and per-browser slot stereotypes
+- POST /session, which fails with "session not created" when no node has a
+  free slot for the requested browser (a real Grid would queue and time out)
+- DELETE /session/<id>, plus a no-op reply for any other session command
+
+It records the peak number of concurrent sessions per node and every
+rejected request so tests can assert that callers never overbook the Grid.
+
+Run it standalone with:
+
+    python -m mock_store.grid --nodes 2 --max-sessions 2 --browsers chrome,firefox
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class GridNode:
+    """One stand-in node with `max_sessions` slots per browser."""
+
+    def __init__(self, browsers: List[str], max_sessions: int):
+        self.id = uuid.uuid4().hex
+        self.browsers = browsers
+        self.max_sessions = max_sessions
+        self.sessions: Dict[str, str] = {}
+        self.peak = 0
+
+    def status(self, port: int) -> dict:
+        busy = list(self.sessions.items())
+        slots = []
+        for browser in self.browsers:
+            for index in range(self.max_sessions):
+                session = next(((sid, b) for sid, b in busy if b == browser), None)
+                if session:
+                    busy.remove(session)
+                slots.append({
+                    "id": {"hostId": self.id, "id": f"{browser}-{index}"},
+                    "stereotype": {"browserName": browser, "platformName": "linux"},
+                    "session": {"sessionId": session[0]} if session else None,
+                })
+        return {
+            "id": self.id,
+            "uri": f"http://127.0.0.1:{port}",
+            "availability": "UP",
+            "maxSessions": self.max_sessions,
+            "slots": slots,
+        }
+
+
+class GridState:
+    """Nodes and counters shared by every request handled by one stand-in."""
+
+    def __init__(self, nodes: List[GridNode]):
+        self.lock = threading.Lock()
+        self.nodes = nodes
+        self.created = 0
+        self.rejected = 0
+        self.peak_total = 0
+
+    def open_session(self, browser: str) -> Optional[str]:
+        with self.lock:
+            # Like the real Grid's default slot selector, prefer the least loaded node.
+            for node in sorted(self.nodes, key=lambda n: len(n.sessions)):
+                if browser in node.browsers and len(node.sessions) < node.max_sessions:
+                    session_id = uuid.uuid4().hex
+                    node.sessions[session_id] = browser
+                    node.peak = max(node.peak, len(node.sessions))
+                    self.created += 1
+                    self.peak_total = max(self.peak_total, sum(len(n.sessions) for n in self.nodes))
+                    return session_id
+            self.rejected += 1
+            return None
+
+    def close_session(self, session_id: str) -> bool:
+        with self.lock:
+            for node in self.nodes:
+                if node.sessions.pop(session_id, None):
+                    return True
+            return False
+
+
+class GridHandler(BaseHTTPRequestHandler):
+    """Request handler for the Grid stand-in."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "GridStandIn/1.0"
+
+    @property
+    def state(self) -> GridState:
+        return self.server.state
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length)) if length else {}
+        except ValueError:
+            return {}
+
+    def _path(self) -> str:
+        path = self.path.split("?")[0].rstrip("/")
+        return path[len("/wd/hub"):] if path.startswith("/wd/hub") else path
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        if self._path() == "/status":
+            port = self.server.server_address[1]
+            with self.state.lock:
+                nodes = [node.status(port) for node in self.state.nodes]
+            self._send_json(HTTPStatus.OK, {"value": {
+                "ready": any(n["availability"] == "UP" for n in nodes),
+                "message": "Selenium Grid stand-in ready.",
+                "nodes": nodes,
+            }})
+        else:
+            self._send_json(HTTPStatus.OK, {"value": None})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        if self._path() != "/session":
+            self._read_json()
+            self._send_json(HTTPStatus.OK, {"value": None})
+            return
+        capabilities = self._read_json().get("capabilities", {})
+        requested = dict(capabilities.get("alwaysMatch", {}))
+        requested.update((capabilities.get("firstMatch") or [{}])[0])
+        browser = requested.get("browserName", "chrome")
+        session_id = self.state.open_session(browser)
+        if session_id is None:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"value": {
+                "error": "session not created",
+                "message": f"No free {browser} slot on the Grid stand-in",
+                "stacktrace": "",
+            }})
+            return
+        self._send_json(HTTPStatus.OK, {"value": {
+            "sessionId": session_id,
+            "capabilities": {"browserName": browser, "platformName": "linux"},
+        }})
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        parts = self._path().split("/")
+        if len(parts) == 3 and parts[1] == "session":
+            self.state.close_session(parts[2])
+        self._send_json(HTTPStatus.OK, {"value": None})
+
+
+class GridStandIn:
+    """
+    Background-thread wrapper around the Grid stand-in.
+
+    Example:
+        grid = GridStandIn(nodes=2, max_sessions=2, browsers=["chrome"]).start()
+        ... point grid_url at grid.url ...
+        grid.stop()
+    """
+
+    def __init__(self, nodes: int = 1, max_sessions: int = 4, browsers: Optional[List[str]] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialise the stand-in.
+
+        Args:
+            nodes: Number of nodes to simulate.
+            max_sessions: Concurrent sessions each node accepts.
+            browsers: Browser names every node offers.
+            host: Interface to bind.
+            port: Port to bind; 0 picks a free port.
+        """
+        browsers = browsers or ["chrome", "firefox"]
+        self.httpd = ThreadingHTTPServer((host, port), GridHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = GridState([GridNode(list(browsers), max_sessions) for _ in range(nodes)])
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def state(self) -> GridState:
+        return self.httpd.state
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "GridStandIn":
+        """Serve requests on a daemon thread and return self."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="grid-stand-in", daemon=True)
+        self._thread.start()
+        logger.info("Grid stand-in listening on %s", self.url)
+        return self
+
+    def stop(self):
+        """Shut the stand-in down and release the port."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a Selenium Grid stand-in.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=4444, help="Port to bind (default: 4444)")
+    parser.add_argument("--nodes", type=int, default=1, help="Number of nodes (default: 1)")
+    parser.add_argument("--max-sessions", type=int, default=4, help="Sessions per node (default: 4)")
+    parser.add_argument("--browsers", default="chrome,firefox", help="Comma-separated browser names")
+    args = parser.parse_args()
+
+    grid = GridStandIn(args.nodes, args.max_sessions, args.browsers.split(","), args.host, args.port).start()
+    print(f"GRID_URL={grid.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        grid.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+HTTP server for the local bstackdemo stand-in.
+
+Serves a single-page app that renders the same DOM ids and classes the page
+objects rely on, plus the `/api/products` and `/api/signin` endpoints used by
+StoreClient. All state lives in memory, so runs are deterministic and need no
+network access.
+
+Run it standalone with:
+
+    python -m mock_store --port 8000
+
+or let the test suite start one per worker with `mock_server: true`.
+"""
+
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import socket
+import threading
+import uuid
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlparse
+
+from mock_store.catalog import LOCKED_PERSONAS, PASSWORD, PERSONAS, build_products
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+
+# Client-side routes that all render the single-page app.
+APP_ROUTES = {"/", "/signin", "/checkout", "/confirmation", "/orders", "/offers", "/favourites"}
+
+IMAGE_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="200" height="200">'
+    '<rect width="200" height="200" fill="#ececec"/>'
+    '<text x="100" y="105" font-size="14" text-anchor="middle">{label}</text></svg>'
+)
+
+
+class StoreState:
+    """In-memory data shared by every request handled by one server."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.products = build_products()
+        body = json.dumps({"products": self.products}).encode()
+        self.products_body = body
+        self.products_etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        self.products_modified = formatdate(usegmt=True)
+        self.orders = []
+
+
+class MockStoreHandler(BaseHTTPRequestHandler):
+    """Request handler for the stand-in UI and API."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "MockStore/1.0"
+
+    @property
+    def state(self) -> StoreState:
+        return self.server.state
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    # Responses -------------------------------------------------------------
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload, headers: Optional[dict] = None):
+        self._send(status, json.dumps(payload).encode(), "application/json", headers)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    # Routing ---------------------------------------------------------------
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        path = urlparse(self.path).path
+        if path == "/api/products":
+            self._get_products()
+        elif path == "/api/orders":
+            with self.state.lock:
+                self._send_json(HTTPStatus.OK, {"orders": list(self.state.orders)})
+        elif path.startswith("/static/images/"):
+            label = os.path.splitext(os.path.basename(path))[0].replace("-device-info", "")
+            self._send(HTTPStatus.OK, IMAGE_TEMPLATE.format(label=label).encode(), "image/svg+xml")
+        elif path.startswith("/static/"):
+            self._get_static(path[len("/static/"):])
+        elif path in APP_ROUTES:
+            self._get_app()
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"errorMessage": "Not found"})
+
+    do_HEAD = do_GET
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        path = urlparse(self.path).path
+        if path == "/api/signin":
+            self._post_signin(self._read_json())
+        elif path == "/api/checkout":
+            self._post_checkout(self._read_json())
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"errorMessage": "Not found"})
+
+    # Handlers --------------------------------------------------------------
+
+    def _get_products(self):
+        state = self.state
+        headers = {
+            "ETag": state.products_etag,
+            "Last-Modified": state.products_modified,
+            "Cache-Control": "no-cache",
+        }
+        if self.headers.get("If-None-Match") == state.products_etag or \
+                self.headers.get("If-Modified-Since") == state.products_modified:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(HTTPStatus.OK, state.products_body, "application/json", headers)
+
+    def _post_signin(self, payload: dict):
+        username = payload.get("userName")
+        password = payload.get("password")
+        if username not in PERSONAS:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"errorMessage": "Invalid Username"})
+        elif password != PASSWORD:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"errorMessage": "Invalid Password"})
+        elif username in LOCKED_PERSONAS:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY,
+                            {"errorMessage": "Your account has been locked."})
+        else:
+            self._send_json(HTTPStatus.OK, {"user": {"userName": username}, "jwt": uuid.uuid4().hex})
+
+    def _post_checkout(self, payload: dict):
+        by_id = {product["id"]: product for product in self.state.products}
+        items = payload.get("items") or []
+        if not payload.get("userName") or not items:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"errorMessage": "Cart is empty"})
+            return
+        try:
+            lines = [
+                {"id": item["id"], "title": by_id[item["id"]]["title"],
+                 "price": by_id[item["id"]]["price"], "quantity": int(item.get("quantity", 1))}
+                for item in items
+            ]
+        except (KeyError, TypeError, ValueError):
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"errorMessage": "Unknown product"})
+            return
+        order = {
+            "id": uuid.uuid4().hex[:8],
+            "userName": payload["userName"],
+            "items": lines,
+            "total": sum(line["price"] * line["quantity"] for line in lines),
+            "address": payload.get("address") or {},
+        }
+        with self.state.lock:
+            self.state.orders.append(order)
+        self._send_json(HTTPStatus.CREATED, order)
+
+    def _get_app(self):
+        with open(os.path.join(STATIC_DIR, "index.html"), encoding="utf-8") as handle:
+            page = handle.read()
+        bootstrap = json.dumps({"personas": PERSONAS, "passwords": [PASSWORD]})
+        self._send(HTTPStatus.OK, page.replace("__BOOTSTRAP__", bootstrap).encode(),
+                   "text/html; charset=utf-8")
+
+    def _get_static(self, name: str):
+        path = os.path.normpath(os.path.join(STATIC_DIR, name))
+        if not path.startswith(STATIC_DIR) or not os.path.isfile(path):
+            self._send_json(HTTPStatus.NOT_FOUND, {"errorMessage": "Not found"})
+            return
+        with open(path, "rb") as handle:
+            body = handle.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self._send(HTTPStatus.OK, body, content_type)
+
+
+class MockStoreServer:
+    """
+    Background-thread wrapper around the stand-in HTTP server.
+
+    Example:
+        server = MockStoreServer().start()
+        ... use server.base_url / server.api_base_url ...
+        server.stop()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialise the server.
+
+        Args:
+            host: Interface to bind; use 0.0.0.0 when a remote Grid browser must reach it.
+            port: Port to bind; 0 picks a free port.
+        """
+        self.httpd = ThreadingHTTPServer((host, port), MockStoreHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = StoreState()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        if host in ("0.0.0.0", "::"):
+            host = socket.gethostname()
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base_url(self) -> str:
+        return f"{self.base_url}/api"
+
+    def start(self) -> "MockStoreServer":
+        """Serve requests on a daemon thread and return self."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-store", daemon=True)
+        self._thread.start()
+        logger.info("Mock store listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        """Shut the server down and release the port."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,301 @@
+/*
+ * Single-page stand-in for bstackdemo.
+ *
+ * Renders the DOM ids/classes used by the page objects (LoginPage, ProductPage,
+ * CartPage, CheckoutPage, ConfirmationPage). The logged-in user lives in
+ * sessionStorage and the cart in memory, like the real site.
+ */
+(function () {
+  "use strict";
+
+  var bootstrap = window.__MOCK_STORE__ || {personas: [], passwords: []};
+  var state = {
+    products: [],
+    cart: [],
+    cartOpen: false,
+    open: null,
+    selected: {username: null, password: null},
+    error: null
+  };
+
+  function currentUser() {
+    return window.sessionStorage.getItem("username");
+  }
+
+  function money(value) {
+    return value.toFixed(2);
+  }
+
+  function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, function (c) {
+      return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+    });
+  }
+
+  function navigate(path) {
+    window.history.pushState({}, "", path);
+    state.open = null;
+    state.error = null;
+    render();
+  }
+
+  function productById(id) {
+    return state.products.filter(function (p) { return p.id === id; })[0];
+  }
+
+  function imageFor(product) {
+    if (currentUser() === "image_not_loading_user") {
+      return "";
+    }
+    return "/static/images/" + product.sku;
+  }
+
+  // Views -----------------------------------------------------------------
+
+  function header() {
+    var user = currentUser();
+    var account = user
+      ? '<span class="username">' + escapeHtml(user) + '</span><a id="logout"><span>Logout</span></a>'
+      : '<a id="signin" href="/signin" data-link>Sign In</a>';
+    return '<nav class="navbar"><a class="Navbar_logo" href="/" data-link>StackDemo</a>' +
+      '<div class="navbar-links"><a id="offers" href="/offers" data-link>Offers</a>' +
+      '<a id="orders" href="/orders" data-link>Orders</a>' +
+      '<a id="favourites" href="/favourites" data-link>Favourites</a>' + account + '</div></nav>';
+  }
+
+  function shelf() {
+    return '<main><div class="shelf-container">' + state.products.map(function (p) {
+      return '<div class="shelf-item" id="' + p.id + '">' +
+        '<div class="shelf-item__thumb"><img alt="' + escapeHtml(p.title) + '" src="' + imageFor(p) + '"></div>' +
+        '<p class="shelf-item__title">' + escapeHtml(p.title) + '</p>' +
+        '<div class="shelf-item__price"><div class="val"><small>$</small><b>' + p.price + '</b><span>.00</span></div></div>' +
+        '<div class="shelf-item__buy-btn" data-add="' + p.id + '">Add to cart</div>' +
+        '</div>';
+    }).join("") + '</div></main>' + floatCart();
+  }
+
+  function cartTotal() {
+    return state.cart.reduce(function (sum, line) {
+      return sum + productById(line.id).price * line.quantity;
+    }, 0);
+  }
+
+  function floatCart() {
+    var quantity = state.cart.reduce(function (sum, line) { return sum + line.quantity; }, 0);
+    if (!state.cartOpen) {
+      return '<div class="float-cart"><span class="bag bag--float-cart-closed">' +
+        '<span class="bag__quantity">' + quantity + '</span></span></div>';
+    }
+    var items = state.cart.map(function (line) {
+      var p = productById(line.id);
+      return '<div class="shelf-item">' +
+        '<div class="shelf-item__thumb"><img alt="' + escapeHtml(p.title) + '" src="' + imageFor(p) + '"></div>' +
+        '<div class="shelf-item__details"><p class="title">' + escapeHtml(p.title) + '</p>' +
+        '<p class="desc">' + escapeHtml(p.availableSizes[0]) + '<br>Quantity: ' + line.quantity + '</p></div>' +
+        '<div class="shelf-item__price"><p>$ ' + money(p.price) + '</p></div>' +
+        '</div>';
+    }).join("");
+    var empty = state.cart.length === 0
+      ? '<p class="shelf-empty">Add some products in the bag<br>:)</p>'
+      : "";
+    return '<div class="float-cart float-cart--open">' +
+      '<div class="float-cart__close-btn">X</div>' +
+      '<div class="float-cart__content">' +
+      '<div class="float-cart__header"><span class="bag"><span class="bag__quantity">' + quantity +
+      '</span></span><span class="header-title">Bag</span></div>' +
+      '<div class="float-cart__shelf-container">' + items + empty + '</div>' +
+      '<div class="float-cart__footer"><div class="sub">SUBTOTAL</div>' +
+      '<div class="sub-price"><p class="sub-price__val">$ ' + money(cartTotal()) + '</p></div>' +
+      '<div class="buy-btn">' + (state.cart.length ? "Checkout" : "Continue Shopping") + '</div>' +
+      '</div></div></div>';
+  }
+
+  function select(name, placeholder, options) {
+    var value = state.selected[name];
+    var menu = state.open === name
+      ? '<div class="select__menu">' + options.map(function (option) {
+          return '<div class="select__option" data-select="' + name + '" data-value="' +
+            escapeHtml(option) + '">' + escapeHtml(option) + '</div>';
+        }).join("") + '</div>'
+      : "";
+    return '<div id="' + name + '" class="select">' +
+      '<div class="select__control" data-toggle="' + name + '">' +
+      '<div class="select__value">' + escapeHtml(value || placeholder) + '</div></div>' + menu + '</div>';
+  }
+
+  function signin() {
+    return '<form class="signin-form" onsubmit="return false">' +
+      '<div class="flex justify-center"><span class="Navbar_logo">StackDemo</span></div>' +
+      (state.error ? '<h3 class="api-error">' + escapeHtml(state.error) + '</h3>' : "") +
+      select("username", "Select Username", bootstrap.personas) +
+      select("password", "Select Password", bootstrap.passwords) +
+      '<button id="login-btn" type="button">Log In</button></form>';
+  }
+
+  function checkout() {
+    var lines = state.cart.map(function (line) {
+      var p = productById(line.id);
+      return '<li class="productList-item"><div class="product">' +
+        '<figure class="product-column product-figure"><img alt="" src="' + imageFor(p) + '" width="40"></figure>' +
+        '<div class="product-column product-body">' +
+        '<h5 class="product-title optimizedCheckout-contentPrimary">' + escapeHtml(p.title) + '</h5>' +
+        '<ul class="product-options"><li class="product-option">' + line.quantity + ' x</li></ul></div>' +
+        '<div class="product-column product-actions">' +
+        '<div class="product-price optimizedCheckout-contentPrimary">$' + p.price * line.quantity + '</div>' +
+        '</div></div></li>';
+    }).join("");
+    var field = function (id, label) {
+      return '<label for="' + id + '">' + label + '</label><input id="' + id + '" type="text">';
+    };
+    return '<div class="checkout"><form class="checkout-form" onsubmit="return false">' +
+      '<div><legend data-test="shipping-address-heading">Shipping Address</legend></div>' +
+      field("firstNameInput", "First Name") + field("lastNameInput", "Last Name") +
+      field("addressLine1Input", "Address") + field("provinceInput", "State/Province") +
+      field("postCodeInput", "Postal Code") +
+      '<button id="checkout-shipping-continue" type="button">Submit</button></form>' +
+      '<aside class="order-summary"><section class="cart-section optimizedCheckout-orderSummary-cartSection">' +
+      '<h3>' + state.cart.length + ' Items</h3><ul class="productList">' + lines + '</ul></section>' +
+      '<section class="cart-section"><div class="cart-priceItem">' +
+      '<span class="cart-priceItem-label">Total</span>' +
+      '<span class="cart-priceItem-value">$' + money(cartTotal()) + '</span></div></section></aside></div>';
+  }
+
+  function confirmation() {
+    return '<div class="confirmation"><legend id="confirmation-message">' +
+      'Your Order has been successfully placed.</legend></div>';
+  }
+
+  function render() {
+    var path = window.location.pathname;
+    var body;
+    if (path === "/signin") {
+      body = signin();
+    } else if (path === "/checkout") {
+      body = currentUser() ? checkout() : signin();
+    } else if (path === "/confirmation") {
+      body = confirmation();
+    } else {
+      body = shelf();
+    }
+    document.getElementById("__next").innerHTML = header() + body;
+  }
+
+  // Actions ---------------------------------------------------------------
+
+  function postJson(url, payload) {
+    return window.fetch(url, {
+      method: "POST",
+      headers: {"Content-Type": "application/json"},
+      body: JSON.stringify(payload)
+    }).then(function (response) {
+      return response.json().then(function (data) {
+        return {ok: response.ok, data: data};
+      });
+    });
+  }
+
+  function login() {
+    postJson("/api/signin", {
+      userName: state.selected.username || "",
+      password: state.selected.password || ""
+    }).then(function (result) {
+      if (!result.ok) {
+        state.error = result.data.errorMessage;
+        render();
+        return;
+      }
+      window.sessionStorage.setItem("username", result.data.user.userName);
+      state.selected = {username: null, password: null};
+      navigate("/?signin=true");
+    });
+  }
+
+  function placeOrder() {
+    var value = function (id) { return document.getElementById(id).value; };
+    postJson("/api/checkout", {
+      userName: currentUser(),
+      items: state.cart,
+      address: {
+        firstName: value("firstNameInput"),
+        lastName: value("lastNameInput"),
+        addressLine1: value("addressLine1Input"),
+        province: value("provinceInput"),
+        postCode: value("postCodeInput")
+      }
+    }).then(function (result) {
+      if (result.ok) {
+        state.cart = [];
+        navigate("/confirmation");
+      }
+    });
+  }
+
+  function addToCart(id) {
+    var line = state.cart.filter(function (l) { return l.id === id; })[0];
+    if (line) {
+      line.quantity += 1;
+    } else {
+      state.cart.push({id: id, quantity: 1});
+    }
+    state.cartOpen = true;
+    render();
+  }
+
+  document.addEventListener("click", function (event) {
+    var target = event.target;
+    var link = target.closest("[data-link]");
+    if (link) {
+      event.preventDefault();
+      navigate(link.getAttribute("href"));
+      return;
+    }
+    var toggle = target.closest("[data-toggle]");
+    if (toggle) {
+      var name = toggle.getAttribute("data-toggle");
+      state.open = state.open === name ? null : name;
+      render();
+      return;
+    }
+    var option = target.closest("[data-select]");
+    if (option) {
+      state.selected[option.getAttribute("data-select")] = option.getAttribute("data-value");
+      state.open = null;
+      render();
+      return;
+    }
+    if (target.closest("[data-add]")) {
+      addToCart(parseInt(target.closest("[data-add]").getAttribute("data-add"), 10));
+    } else if (target.closest(".bag--float-cart-closed")) {
+      state.cartOpen = true;
+      render();
+    } else if (target.closest(".float-cart__close-btn")) {
+      state.cartOpen = false;
+      render();
+    } else if (target.closest(".buy-btn")) {
+      state.cartOpen = false;
+      if (!state.cart.length) {
+        render();
+      } else {
+        navigate(currentUser() ? "/checkout" : "/signin?checkout=true");
+      }
+    } else if (target.closest("#login-btn")) {
+      login();
+    } else if (target.closest("#logout")) {
+      window.sessionStorage.removeItem("username");
+      state.cart = [];
+      navigate("/");
+    } else if (target.closest("#checkout-shipping-continue")) {
+      placeOrder();
+    }
+  });
+
+  window.addEventListener("popstate", render);
+
+  window.fetch("/api/products").then(function (response) {
+    return response.json();
+  }).then(function (data) {
+    state.products = data.products;
+    render();
+  });
+  render();
+})();
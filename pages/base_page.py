@@ -5,50 +5,226 @@ This module provides simple helper methods for interacting with the browser
 in a safe and consistent way. It keeps low-level WebDriver calls in one place.
 """
 
+import time
+
 from selenium.common import (
     TimeoutException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
     ElementNotInteractableException,
 )
+from typing import Dict, Iterable, List, Optional
+
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from utils.dom_waits import ABSENT, CLICKABLE, PRESENT, TEXT, VISIBLE, event_wait
+from utils.load_profiles import READY_SCRIPT, active_profile, stats as load_stats
 from utils.logger import get_logger
+from utils.page_snapshot import PageSnapshot, cached_snapshot, invalidate_snapshot, take_snapshot
+from utils.retries import backoff_delay, element_retries
+from utils.timing import timed, timed_action
+from utils.waits import measure_action, measure_wait, no_implicit_wait, wait_state
 
 
 class ElementInteractionError(Exception):
     """Raised when Selenium fails to interact with an element."""
 
 
+# Reads text and attributes for every match of a CSS or XPath locator in a
+# single round trip. Text mirrors WebElement.text (rendered innerText).
+READ_ALL_SCRIPT = """
+const [strategy, value, attributes] = arguments;
+let nodes = [];
+if (strategy === 'xpath') {
+    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+} else {
+    nodes = Array.from(document.querySelectorAll(value));
+}
+return nodes.map((node) => {
+    const row = {text: (node.innerText || '').trim()};
+    attributes.forEach((name) => { row[name] = node.getAttribute(name); });
+    return row;
+});
+"""
+
+
+# Sets the value of each field through the element's native value setter, so
+# frameworks that track input values (React) see the change, then fires the
+# input and change events a user's typing would. Returns whether each field
+# was found.
+FILL_FORM_SCRIPT = """
+const find = (strategy, value) => strategy === 'xpath'
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+return arguments[0].map(([strategy, value, text]) => {
+    const el = find(strategy, value);
+    if (!el) return false;
+    const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+    el.focus();
+    if (descriptor && descriptor.set) descriptor.set.call(el, text); else el.value = text;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    return true;
+});
+"""
+
+# Reads the current value of each field (null when it is missing).
+READ_VALUES_SCRIPT = """
+const find = (strategy, value) => strategy === 'xpath'
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+return arguments[0].map(([strategy, value]) => {
+    const el = find(strategy, value);
+    return el ? el.value : null;
+});
+"""
+
+
+def to_script_locator(locator):
+    """
+    Convert a (By, value) locator into an equivalent CSS or XPath locator.
+
+    Args:
+        locator: Tuple of (By, locator_string).
+
+    Returns:
+        Tuple of ("css selector" | "xpath", value) usable from JavaScript.
+
+    Raises:
+        ValueError: If the strategy has no CSS/XPath equivalent.
+    """
+    by, value = locator
+    if by in (By.CSS_SELECTOR, By.XPATH):
+        return by, value
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    raise ValueError(f"Locator strategy '{by}' cannot be read in bulk")
+
+
+def text_equals(locator, expected: str):
+    """Polling condition: the element is visible and its trimmed text equals `expected`."""
+    def condition(driver):
+        try:
+            element = driver.find_element(*locator)
+            return element if element.is_displayed() and element.text.strip() == expected else False
+        except StaleElementReferenceException:
+            return False
+    return condition
+
+
+# WebDriverWait conditions used when a wait cannot run in the page.
+POLLED_CONDITIONS = {
+    PRESENT: EC.presence_of_element_located,
+    VISIBLE: EC.visibility_of_element_located,
+    CLICKABLE: EC.element_to_be_clickable,
+    ABSENT: EC.invisibility_of_element_located,
+}
+
+
 class BasePage:
     """
     Common functionality shared by all page objects.
 
     Each page object holds a reference to the WebDriver instance and a
-    WebDriverWait helper to perform synchronised actions on the UI.
+    WebDriverWait helper to perform synchronised actions on the UI. Every
+    helper accepts an optional per-call timeout; time spent waiting and acting
+    is accumulated in the session's WaitState (see utils.waits), and each
+    public helper is recorded as an "action" by utils.timing. Element waits
+    run inside the page where possible (see utils.dom_waits), and the
+    WebDriverWait helper is their polling fallback. Read-only checks can be
+    answered from a cached page snapshot (see `read_snapshot`), which every
+    action invalidates.
     """
     logger = get_logger(__name__)
 
-    def __init__(self, driver, timeout: int = 5, poll_frequency: float = 0.2):
+    def __init__(self, driver, timeout: Optional[float] = None, poll_frequency: float = 0.2):
         """
         Initialise the page object.
 
         Args:
             driver: Selenium WebDriver instance controlling the browser.
-            timeout: Default timeout (in seconds) for explicit waits.
+            timeout: Default timeout (in seconds) for explicit waits. Falls back
+                     to the session's configured `explicit_wait`.
+            poll_frequency: Interval (in seconds) between polls when a wait
+                            falls back to WebDriverWait.
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout, poll_frequency)
+        self.timeout = timeout if timeout is not None else wait_state(driver).explicit_wait
+        self.poll_frequency = poll_frequency
+        self.wait = WebDriverWait(driver, self.timeout, poll_frequency)
+
+    def _until(self, condition, timeout: Optional[float] = None):
+        """Wait for the condition, using a one-off timeout when given."""
+        wait = self.wait if timeout is None else WebDriverWait(
+            self.driver, timeout, self.poll_frequency)
+        with measure_wait(self.driver), timed("action", "wait"):
+            return wait.until(condition)
+
+    def _await(self, locator, condition: str, timeout: Optional[float] = None, expected: Optional[str] = None):
+        """
+        Wait for the element's condition, in the page when possible.
+
+        Args:
+            locator: Tuple of (By, locator_string) describing the element.
+            condition: PRESENT, VISIBLE, CLICKABLE, ABSENT or TEXT (see utils.dom_waits).
+            timeout: Optional timeout overriding the page default.
+            expected: Text the element must show, for TEXT.
 
+        Returns:
+            The element, or True for ABSENT.
+
+        Raises:
+            TimeoutException: If the condition does not hold within the timeout.
+        """
+        seconds = self.timeout if timeout is None else timeout
+        try:
+            script_locator = to_script_locator(locator)
+        except ValueError:
+            script_locator = None
+        if script_locator:
+            start = time.perf_counter()
+            with measure_wait(self.driver), timed("action", "wait"):
+                result = event_wait(self.driver, script_locator, condition, seconds, self.poll_frequency, expected)
+            if result is not None:
+                if not result.matched:
+                    raise TimeoutException(f"{self._format_locator(locator)} not {condition} after {seconds}s")
+                return True if condition == ABSENT else result.element
+            # The script failed part-way (e.g. the page navigated); poll for the rest of the timeout.
+            seconds = max(seconds - (time.perf_counter() - start), 0)
+        polled = text_equals(locator, expected) if condition == TEXT else POLLED_CONDITIONS[condition](locator)
+        return self._until(polled, seconds)
+
+    @timed_action
     def open(self, url: str):
         """
-        Navigate the browser to the given URL.
+        Navigate the browser to the given URL and wait until it is ready.
+
+        The session's load profile (see utils.load_profiles) decides which
+        `document.readyState` values count as ready. The app root must also
+        have rendered, so eager page loads are safe to interact with. The
+        bytes transferred and the time until ready are recorded for the load
+        profile report.
 
         Args:
             url: Absolute URL to open in the browser.
         """
-        self.driver.get(url)
+        invalidate_snapshot(self.driver)
+        profile = active_profile(self.driver)
+        start = time.perf_counter()
+        with measure_action(self.driver):
+            self.driver.get(url)
+        loaded = self._until(lambda d: d.execute_script(READY_SCRIPT, list(profile.ready_states)))
+        load_stats.record(profile, url, time.perf_counter() - start, loaded["bytes"], loaded["requests"])
 
     def _format_locator(self, locator):
         if isinstance(locator, (list, tuple)) and len(locator) == 2:
@@ -56,21 +232,34 @@ class BasePage:
             return f"{by}={value}"
         return str(locator)
 
-    def click(self, locator, retries: int = 3):
+    @timed_action
+    def click(self, locator, retries: int = 3, timeout: Optional[float] = None):
         """
         Click an element once it becomes clickable.
 
         Args:
             locator: Tuple of (By, locator_string) describing the element.
+            retries: Number of retries on intercepted/stale/non-interactable errors.
+                     The delay before each retry doubles, starting at the
+                     session's `click_retry_backoff`.
+            timeout: Optional timeout overriding the page default.
 
         Returns:
             The WebElement that was clicked.
         """
+        invalidate_snapshot(self.driver)
+        with measure_action(self.driver):
+            return self._click(locator, retries, timeout)
+
+    def _click(self, locator, retries: int, timeout: Optional[float]):
         attempt = 0
+        first_failure = None
         while True:
             try:
-                element = self.wait.until(EC.element_to_be_clickable(locator))
+                element = self._await(locator, CLICKABLE, timeout)
                 element.click()
+                if first_failure is not None:
+                    element_retries.record(self._format_locator(locator), time.perf_counter() - first_failure)
                 return element
             except (
                 ElementClickInterceptedException,
@@ -78,69 +267,165 @@ class BasePage:
                 ElementNotInteractableException,
             ) as exc:
                 attempt += 1
+                if first_failure is None:
+                    first_failure = time.perf_counter()
                 if attempt > retries:
+                    element_retries.record(self._format_locator(locator), time.perf_counter() - first_failure)
                     message = f"Failed to click element {self._format_locator(locator)} after {retries} retries: {exc.__class__.__name__}"
                     self.logger.error(message)
                     raise ElementInteractionError(message) from exc
-                self.logger.warning("Retrying click for %s (%s)", self._format_locator(
-                    locator), exc.__class__.__name__)
+                delay = backoff_delay(attempt, wait_state(self.driver).retry_backoff)
+                self.logger.warning("Retrying click for %s in %.2fs (%s)", self._format_locator(
+                    locator), delay, exc.__class__.__name__)
+                with measure_wait(self.driver):
+                    time.sleep(delay)
             except TimeoutException as exc:
                 message = f"Failed to click element {self._format_locator(locator)}: {exc.__class__.__name__}"
                 self.logger.error(message)
                 raise ElementInteractionError(message) from exc
 
-    def type(self, locator, text: str):
+    @timed_action
+    def type(self, locator, text: str, timeout: Optional[float] = None):
         """
         Clear an input field and type the given text into it.
 
         Args:
             locator: Tuple of (By, locator_string) describing the element.
             text: Text to send to the element.
+            timeout: Optional timeout overriding the page default.
         """
+        invalidate_snapshot(self.driver)
         try:
-            element = self.wait.until(
-                EC.visibility_of_element_located(locator))
-            element.clear()
-            element.send_keys(text)
+            with measure_action(self.driver):
+                element = self._await(locator, VISIBLE, timeout)
+                element.clear()
+                element.send_keys(text)
         except (StaleElementReferenceException, TimeoutException) as exc:
             message = f"Failed to type into element {self._format_locator(locator)}: {exc.__class__.__name__}"
             self.logger.error(message)
             raise ElementInteractionError(message) from exc
 
-    def get_text(self, locator) -> str:
+    @timed_action
+    def fill_form(self, values: Dict[tuple, str], container=None, keyboard: Iterable[tuple] = (),
+                  timeout: Optional[float] = None):
+        """
+        Fill several form fields with a handful of WebDriver calls.
+
+        Waits once for the form, sets every field in a single script call
+        (native value setter plus input/change events), types the `keyboard`
+        fields with native key presses, then checks every value in a single
+        read-back. A scripted field whose value did not stick is typed
+        natively and checked again. Filling the five checkout fields takes
+        three calls instead of at least fifteen.
+
+        Args:
+            values: Mapping of (By, locator_string) to the text the field should hold.
+            container: Locator of the form to wait for; defaults to the first field.
+            keyboard: Fields that need real key presses (autocomplete, input masks).
+                      Fields whose locator has no CSS/XPath form are always typed.
+            timeout: Optional timeout overriding the page default.
+
+        Raises:
+            ElementInteractionError: If the form does not appear, a field is
+                missing, or a field does not hold its value afterwards.
+        """
+        invalidate_snapshot(self.driver)
+        values = {field: str(text) for field, text in values.items()}
+        form = container or next(iter(values))
+        keyboard = set(keyboard)
+        typed = [field for field in values if field in keyboard or not self._scriptable(field)]
+        scripted = [field for field in values if field not in typed]
+        try:
+            with measure_action(self.driver):
+                self._await(form, VISIBLE, timeout)
+                if scripted:
+                    found = self.driver.execute_script(
+                        FILL_FORM_SCRIPT, [[*to_script_locator(field), values[field]] for field in scripted])
+                    missing = [self._format_locator(field) for field, ok in zip(scripted, found) if not ok]
+                    if missing:
+                        raise ElementInteractionError(f"Form fields not found: {', '.join(missing)}")
+                for field in typed:
+                    self._send_keys(field, values[field])
+                wrong = self._unmatched_fields(values)
+                retyped = [field for field in wrong if field in scripted]
+                if retyped:
+                    self.logger.debug("Scripted value did not stick for %s; typing instead",
+                                      ", ".join(self._format_locator(field) for field in retyped))
+                    for field in retyped:
+                        self._send_keys(field, values[field])
+                    wrong = self._unmatched_fields(values)
+        except (StaleElementReferenceException, TimeoutException) as exc:
+            message = f"Failed to fill form {self._format_locator(form)}: {exc.__class__.__name__}"
+            self.logger.error(message)
+            raise ElementInteractionError(message) from exc
+        if wrong:
+            message = "Form fields did not keep their values: " + ", ".join(
+                f"{self._format_locator(field)}={actual!r}" for field, actual in wrong.items())
+            self.logger.error(message)
+            raise ElementInteractionError(message)
+
+    @staticmethod
+    def _scriptable(locator) -> bool:
+        try:
+            to_script_locator(locator)
+            return True
+        except ValueError:
+            return False
+
+    def _send_keys(self, locator, text: str):
+        element = self.driver.find_element(*locator)
+        element.clear()
+        element.send_keys(text)
+
+    def _unmatched_fields(self, values: Dict[tuple, str]) -> Dict[tuple, Optional[str]]:
+        """Read every field back (one call for the scriptable ones); return those whose value differs."""
+        fields = list(values)
+        scriptable = [field for field in fields if self._scriptable(field)]
+        actual = dict(zip(scriptable, self.driver.execute_script(
+            READ_VALUES_SCRIPT, [list(to_script_locator(field)) for field in scriptable]))) if scriptable else {}
+        for field in fields:
+            if field not in actual:
+                actual[field] = self.driver.find_element(*field).get_attribute("value")
+        return {field: actual[field] for field in fields if actual[field] != values[field]}
+
+    @timed_action
+    def get_text(self, locator, timeout: Optional[float] = None) -> str:
         """
         Return the visible text for the given element.
 
         Args:
             locator: Tuple of (By, locator_string) describing the element.
+            timeout: Optional timeout overriding the page default.
 
         Returns:
             The text content of the element.
         """
         try:
-            element = self.wait.until(
-                EC.visibility_of_element_located(locator))
-            return element.text
+            with measure_action(self.driver):
+                element = self._await(locator, VISIBLE, timeout)
+                return element.text
         except (StaleElementReferenceException, TimeoutException) as exc:
             message = f"Failed to read text from element {self._format_locator(locator)}: {exc.__class__.__name__}"
             self.logger.error(message)
             raise ElementInteractionError(message) from exc
 
-    def get_attribute(self, locator, attribute: str) -> str:
+    @timed_action
+    def get_attribute(self, locator, attribute: str, timeout: Optional[float] = None) -> str:
         """
         Return the value of the given attribute for the given element.
 
         Args:
             locator: Tuple of (By, locator_string) describing the element.
             attribute: Name of the attribute to retrieve.
+            timeout: Optional timeout overriding the page default.
 
         Returns:
             The value of the attribute.
         """
         try:
-            element = self.wait.until(
-                EC.visibility_of_element_located(locator))
-            return element.get_attribute(attribute)
+            with measure_action(self.driver):
+                element = self._await(locator, VISIBLE, timeout)
+                return element.get_attribute(attribute)
         except (StaleElementReferenceException, TimeoutException) as exc:
             message = (
                 f"Failed to read attribute '{attribute}' from element "
@@ -149,33 +434,165 @@ class BasePage:
             self.logger.error(message)
             raise ElementInteractionError(message) from exc
 
-    def element_visible(self, locator) -> bool:
+    @timed_action
+    def element_visible(self, locator, timeout: Optional[float] = None) -> bool:
         """
-        Return True if the element exists on the page.
+        Return True if the element becomes visible within the timeout.
+
+        The implicit wait is suspended while polling so each poll fails fast.
 
         Args:
             locator: Tuple of (By, locator_string) describing the element.
+            timeout: Optional timeout overriding the page default.
 
         Returns:
-            True if the element exists, otherwise False.
+            True if the element is visible, otherwise False.
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            with no_implicit_wait(self.driver):
+                self._await(locator, VISIBLE, timeout)
             return True
         except TimeoutException:
             return False
 
-    def find_elements(self, locator):
+    @timed_action
+    def element_has_text(self, locator, text: str, timeout: Optional[float] = None) -> bool:
+        """
+        Return True if the element becomes visible showing exactly the given text.
+
+        Args:
+            locator: Tuple of (By, locator_string) describing the element.
+            text: Expected text, compared after trimming whitespace.
+            timeout: Optional timeout overriding the page default.
+
+        Returns:
+            True if the element shows the text within the timeout, otherwise False.
+        """
+        try:
+            with no_implicit_wait(self.driver):
+                self._await(locator, TEXT, timeout, expected=text)
+            return True
+        except TimeoutException:
+            return False
+
+    @timed_action
+    def element_absent(self, locator, timeout: float = 0) -> bool:
+        """
+        Return True if the element is missing or hidden.
+
+        With the default timeout of 0 this is a single fast-fail check of the
+        current page state; a positive timeout waits for the element to go away.
+
+        Args:
+            locator: Tuple of (By, locator_string) describing the element.
+            timeout: Seconds to wait for the element to disappear.
+
+        Returns:
+            True if the element is not visible, otherwise False.
+        """
+        try:
+            with no_implicit_wait(self.driver):
+                self._await(locator, ABSENT, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    @timed_action
+    def find_elements(self, locator, timeout: Optional[float] = None):
         """
         Return a list of elements matching the given locator.
 
         Args:
             locator: Tuple of (By, locator_string) describing the elements.
+            timeout: Optional timeout overriding the page default.
 
         Returns:
             List of WebElement objects.
         """
-        return self.wait.until(EC.presence_of_all_elements_located(locator))
+        return self._until(EC.presence_of_all_elements_located(locator), timeout)
+
+    @timed_action
+    def read_all(self, locator, attributes: Iterable[str] = (),
+                 timeout: Optional[float] = None) -> List[Dict[str, Optional[str]]]:
+        """
+        Read text and attributes for every element matching the locator at once.
+
+        A single JavaScript snapshot is taken per poll, so the wait and the
+        read share one round trip once the elements are present.
+
+        Args:
+            locator: Tuple of (By, locator_string) describing the elements.
+            attributes: Attribute names to read alongside the text.
+            timeout: Optional timeout overriding the page default.
+
+        Returns:
+            One dict per element, in document order, with a "text" key plus
+            one key per requested attribute.
+        """
+        strategy, value = to_script_locator(locator)
+        names = list(attributes)
+        try:
+            with measure_action(self.driver):
+                return self._until(
+                    lambda driver: driver.execute_script(READ_ALL_SCRIPT, strategy, value, names) or False,
+                    timeout,
+                )
+        except TimeoutException as exc:
+            message = f"Failed to read elements {self._format_locator(locator)}: {exc.__class__.__name__}"
+            self.logger.error(message)
+            raise ElementInteractionError(message) from exc
+
+    def read_texts(self, locator, timeout: Optional[float] = None) -> List[str]:
+        """
+        Return the visible text of every element matching the locator.
+
+        Args:
+            locator: Tuple of (By, locator_string) describing the elements.
+            timeout: Optional timeout overriding the page default.
+
+        Returns:
+            List of text values in document order.
+        """
+        return [row["text"] for row in self.read_all(locator, timeout=timeout)]
+
+    @timed_action
+    def read_snapshot(self, ready=None, timeout: Optional[float] = None) -> PageSnapshot:
+        """
+        Return a parsed snapshot of the page for read-only checks.
+
+        The cached snapshot is reused until an action invalidates it, so a run
+        of checks against the same page costs one round trip. It is only
+        reused if it shows every `ready` element visible. Otherwise the page
+        is given up to the timeout for the missing ones to appear, and a new
+        snapshot is taken. Checks on the snapshot then report anything still
+        missing.
+
+        Args:
+            ready: Optional locator, or sequence of locators, of elements the
+                   check reads, e.g. the cart line being validated. Elements
+                   that render a moment after the rest of the page are then
+                   waited for instead of read too early.
+            timeout: Optional timeout overriding the page default, shared by
+                     all `ready` elements.
+
+        Returns:
+            A PageSnapshot (see utils.page_snapshot).
+        """
+        required = [] if ready is None else [ready] if isinstance(ready[0], str) else list(ready)
+        snapshot = cached_snapshot(self.driver)
+        missing = required if snapshot is None else [item for item in required if not snapshot.visible(item)]
+        if snapshot is not None and not missing:
+            return snapshot
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        for item in missing:
+            try:
+                with no_implicit_wait(self.driver):
+                    self._await(item, VISIBLE, max(deadline - time.monotonic(), 0))
+            except TimeoutException:
+                self.logger.debug("%s did not appear; snapshotting the page as it is", self._format_locator(item))
+                break
+        with measure_action(self.driver):
+            return take_snapshot(self.driver)
 
     def get_current_url(self) -> str:
         """
@@ -186,18 +603,21 @@ class BasePage:
         """
         return self.driver.current_url
 
-    def element_present(self, locator):
+    @timed_action
+    def element_present(self, locator, timeout: Optional[float] = None):
         """
         Return True if the element is present on the page.
 
         Args:
             locator: Tuple of (By, locator_string) describing the element.
+            timeout: Optional timeout overriding the page default.
 
         Returns:
             True if the element is present, otherwise False.
         """
         try:
-            self.wait.until(EC.presence_of_element_located(locator))
+            with no_implicit_wait(self.driver):
+                self._await(locator, PRESENT, timeout)
             return True
         except TimeoutException:
             return False
@@ -1,39 +1,63 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import locator, template
 from utils.logger import get_logger
+from utils.test_data import expected_price_cents, format_price, to_cents
 
 class CartPage(BasePage):
     logger = get_logger(__name__)
 
-    SIDE_CART_BUTTON = (By.CSS_SELECTOR, ".bag--float-cart-closed")
-    CHECKOUT_BUTTON = (By.XPATH, "//div[text()='Checkout']")
-    CONTINUE_SHOPPING_BUTTON = (By.XPATH, "//div[text()='Continue Shopping']")
-    SIDE_CART_CLOSE_BUTTON = (By.CSS_SELECTOR, "div[class='float-cart__close-btn']")
-    SIDE_CART_SUBTOTAL = (By.CSS_SELECTOR, ".float-cart__footer .sub-price__val")
+    SIDE_CART_BUTTON = locator("cart.side_cart_button", By.CSS_SELECTOR, ".bag--float-cart-closed")
+    CHECKOUT_BUTTON = locator("cart.checkout_button", By.XPATH, "//div[text()='Checkout']")
+    CONTINUE_SHOPPING_BUTTON = locator("cart.continue_shopping_button", By.XPATH, "//div[text()='Continue Shopping']")
+    SIDE_CART_CLOSE_BUTTON = locator("cart.close_button", By.CSS_SELECTOR, "div[class='float-cart__close-btn']")
+    SIDE_CART_SUBTOTAL = locator("cart.subtotal", By.CSS_SELECTOR, ".float-cart__footer .sub-price__val")
+    SIDE_CART_ITEM_PRICES = locator(
+        "cart.item_prices", By.XPATH,
+        "//div[@class='float-cart__shelf-container']//p/../following-sibling::div[@class='shelf-item__price']/p",
+        css="div[class='float-cart__shelf-container'] div[class='shelf-item__price'] > p")
+    SIDE_CART_ITEM_TITLE = template("cart.item_title", By.XPATH,
+                                    "//div[@class='float-cart__shelf-container']//p[text()={product_name}]",
+                                    product_name="iPhone 12")
+    SIDE_CART_ITEM_PRICE = template(
+        "cart.item_price", By.XPATH,
+        "//div[@class='float-cart__shelf-container']//p[text()={product_name}]"
+        "/../following-sibling::div[@class='shelf-item__price']/p",
+        product_name="iPhone 12")
 
     def validate_side_cart(self, product_name, product_price):
-        self.element_visible(self.SIDE_CART_CLOSE_BUTTON)
-        actual_product_name = self.get_text((By.XPATH, f"//div[@class='float-cart__shelf-container']//p[text()='{product_name}']"))
+        """
+        Check a product and its price in the side cart.
+
+        Args:
+            product_name: Product title.
+            product_price: Expected display price ("$ 799.00") or the catalog Product.
+        """
+        # Lines of the open cart are checked against one snapshot; it is retaken
+        # (after waiting) only if it does not show this line yet
+        title = self.SIDE_CART_ITEM_TITLE(product_name=product_name)
+        price = self.SIDE_CART_ITEM_PRICE(product_name=product_name)
+        snapshot = self.read_snapshot(ready=(self.SIDE_CART_CLOSE_BUTTON, title, price))
+        actual_product_name = snapshot.text(title)
         assert actual_product_name == product_name, f"Expected product name '{product_name}' but got '{actual_product_name}'"
-        actual_product_price = self.get_text((By.XPATH, f"//div[@class='float-cart__shelf-container']//p[text()='{product_name}']/../following-sibling::div[@class='shelf-item__price']/p"))
-        assert actual_product_price == product_price, f"Expected product price '{product_price}' but got '{actual_product_price}'"
+        actual_product_price = snapshot.text(price)
+        assert actual_product_price is not None, f"No price shown for '{product_name}' in the side cart"
+        expected_cents = expected_price_cents(product_price)
+        assert to_cents(actual_product_price) == expected_cents, \
+            f"Expected product price '{format_price(expected_cents)}' but got '{actual_product_price}'"
 
     def validate_subtotal(self):
-        price_elements = self.find_elements((By.XPATH,
-                                             "//div[@class='float-cart__shelf-container']//p/../following-sibling::div[@class='shelf-item__price']/p"))
-
-        calculated_total = 0.0
-        for element in price_elements:
-            price_text = element.text
-            price_value = float(price_text.replace('$ ', '').strip())
-            calculated_total += price_value
+        # All item prices are read in one round trip instead of one per element;
+        # sums are exact in cents
+        price_texts = self.read_texts(self.SIDE_CART_ITEM_PRICES)
+        calculated_total = sum(to_cents(price_text) for price_text in price_texts)
 
         # Get displayed subtotal and compare
-        displayed_subtotal = self.get_text(self.SIDE_CART_SUBTOTAL)
-        displayed_value = float(displayed_subtotal.replace('$ ', '').strip())
+        displayed_subtotal = to_cents(self.get_text(self.SIDE_CART_SUBTOTAL))
 
-        assert calculated_total == displayed_value, f"Calculated total ${calculated_total} doesn't match displayed ${displayed_value}"
-        self.logger.info(f"Subtotal validation passed: ${calculated_total}")
+        assert calculated_total == displayed_subtotal, \
+            f"Calculated total {format_price(calculated_total)} doesn't match displayed {format_price(displayed_subtotal)}"
+        self.logger.info("Subtotal validation passed: %s", format_price(calculated_total))
 
     def proceed_to_checkout(self):
         self.click(self.CHECKOUT_BUTTON)
@@ -47,10 +71,7 @@ class CartPage(BasePage):
         self.element_visible(self.CONTINUE_SHOPPING_BUTTON)
 
     def check_absence_of_side_cart_close_btn(self):
-        if not self.element_visible(self.SIDE_CART_CLOSE_BUTTON):
-            return True
-        else:
-            return False
+        return self.element_absent(self.SIDE_CART_CLOSE_BUTTON)
 
     def close_side_cart(self):
         self.click(self.SIDE_CART_CLOSE_BUTTON)
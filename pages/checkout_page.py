@@ -1,19 +1,30 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import locator, template
 from utils.logger import get_logger
+from utils.test_data import expected_price_cents, format_price, to_cents
 
 class CheckoutPage(BasePage):
 
     logger = get_logger(__name__)
 
-    SHIPPING_ADDRESS_HEADING = (By.XPATH, "//div/legend[@data-test='shipping-address-heading']")
-    FIRST_NAME_FIELD = (By.ID, "firstNameInput")
-    LAST_NAME_FIELD = (By.ID, "lastNameInput")
-    ADDRESS_FIELD = (By.ID, "addressLine1Input")
-    STATE_FIELD = (By.ID, "provinceInput")
-    POSTCODE_FIELD = (By.ID, "postCodeInput")
-    SUBMIT_BUTTON = (By.ID, "checkout-shipping-continue")
-    TOTAL_AMOUNT = (By.XPATH, "//span[@class='cart-priceItem-value']")
+    SHIPPING_ADDRESS_HEADING = locator("checkout.shipping_address_heading", By.XPATH,
+                                       "//div/legend[@data-test='shipping-address-heading']")
+    FIRST_NAME_FIELD = locator("checkout.first_name", By.ID, "firstNameInput")
+    LAST_NAME_FIELD = locator("checkout.last_name", By.ID, "lastNameInput")
+    ADDRESS_FIELD = locator("checkout.address", By.ID, "addressLine1Input")
+    STATE_FIELD = locator("checkout.state", By.ID, "provinceInput")
+    POSTCODE_FIELD = locator("checkout.postcode", By.ID, "postCodeInput")
+    SHIPPING_FORM = locator("checkout.form", By.CSS_SELECTOR, "form.checkout-form")
+    SUBMIT_BUTTON = locator("checkout.submit_button", By.ID, "checkout-shipping-continue")
+    TOTAL_AMOUNT = locator("checkout.total", By.XPATH, "//span[@class='cart-priceItem-value']")
+    ORDER_SUMMARY_ITEM_PRICES = locator("checkout.item_prices", By.CSS_SELECTOR,
+                                        "section.cart-section ul li.productList-item .product-price")
+    ORDER_SUMMARY_ITEM_TITLE = template("checkout.item_title", By.XPATH,
+                                        "//h5[normalize-space()={product_name}]", product_name="iPhone 12")
+    ORDER_SUMMARY_ITEM_PRICE = template("checkout.item_price", By.XPATH,
+                                        "//h5[normalize-space()={product_name}]/parent::div/following-sibling::div/div",
+                                        product_name="iPhone 12")
 
 
     def verify_checkout_page(self):
@@ -23,44 +34,49 @@ class CheckoutPage(BasePage):
             return False
 
     def verify_product_in_order_summary(self, product_name, product_price):
-        actual_product_name = self.get_text((By.XPATH, f"//h5[normalize-space()='{product_name}']"))
+        """
+        Check a product and its price in the order summary.
+
+        Args:
+            product_name: Product title.
+            product_price: Expected display price ("$ 799.00") or the catalog Product.
+        """
+        actual_product_name = self.get_text(self.ORDER_SUMMARY_ITEM_TITLE(product_name=product_name))
         assert actual_product_name == product_name, f"Expected product name '{product_name}' but got '{actual_product_name}'"
-        print(f"(//div[@class='product-price optimizedCheckout-contentPrimary'][ancestor::div//h5[normalize-space()='{product_name}']])[1]")
-        actual_product_price = self.get_text((By.XPATH, f"//h5[normalize-space()='{product_name}']/parent::div/following-sibling::div/div"))
-        print(actual_product_price)
-        product_price = product_price.replace(' ', '').replace('.00', '')
-        assert actual_product_price == product_price, f"Expected product price '{product_price}' but got '{actual_product_price}'"
-        self.logger.info(f"Product '{product_name}' with price '{product_price}' found in order summary")
+        actual_product_price = self.get_text(self.ORDER_SUMMARY_ITEM_PRICE(product_name=product_name))
+        expected_cents = expected_price_cents(product_price)
+        assert to_cents(actual_product_price) == expected_cents, \
+            f"Expected product price '{format_price(expected_cents)}' but got '{actual_product_price}'"
+        self.logger.info("Product '%s' with price '%s' found in order summary", product_name, actual_product_price)
         return True
 
 
     def fill_checkout_form(self, first_name, last_name, address, state_or_province, postcode):
-        self.type(self.FIRST_NAME_FIELD, first_name)
-        self.type(self.LAST_NAME_FIELD, last_name)
-        self.type(self.ADDRESS_FIELD, address)
-        self.type(self.STATE_FIELD, state_or_province)
-        self.type(self.POSTCODE_FIELD, postcode)
+        """Fill the shipping details in one pass (see BasePage.fill_form)."""
+        self.fill_form({
+            self.FIRST_NAME_FIELD: first_name,
+            self.LAST_NAME_FIELD: last_name,
+            self.ADDRESS_FIELD: address,
+            self.STATE_FIELD: state_or_province,
+            self.POSTCODE_FIELD: postcode,
+        }, container=self.SHIPPING_FORM)
 
     def place_order(self):
         self.click(self.SUBMIT_BUTTON)
 
 
     def check_order_summary_total(self):
-        num_items = len(self.find_elements((By.CSS_SELECTOR, "section.cart-section ul li.productList-item")))
-        total = 0.0
-        for i in range(num_items):
-            price_text = self.get_text((By.CSS_SELECTOR, f"section.cart-section ul li.productList-item:nth-child({i+1}) .product-price"))
-            price = float(price_text.replace('$', '').strip())
+        # Every line item price is read in a single round trip; sums are exact in cents
+        price_texts = self.read_texts(self.ORDER_SUMMARY_ITEM_PRICES)
+        total = 0
+        for i, price_text in enumerate(price_texts):
+            price = to_cents(price_text)
             total += price
-            self.logger.info(f"Item {i+1} price: {price}")
+            self.logger.debug("Item %d price: %s", i + 1, format_price(price))
 
-        displayed_total = float(self.get_text(self.TOTAL_AMOUNT).replace('$', '').replace('.00', '').strip())
-        self.logger.info(f"Displayed total: {displayed_total}")
-        assert total == displayed_total, f"Total mismatch: expected {total}, got {displayed_total}"
-        self.logger.info(f"Order summary total validated: ${total}")
+        displayed_total = to_cents(self.get_text(self.TOTAL_AMOUNT))
+        self.logger.info("Displayed total: %s", format_price(displayed_total))
+        assert total == displayed_total, \
+            f"Total mismatch: expected {format_price(total)}, got {format_price(displayed_total)}"
+        self.logger.info("Order summary total validated: %s", format_price(total))
         return True
-
-
-
-
-
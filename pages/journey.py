@@ -0,0 +1,98 @@
+"""
+Storefront journey driven through the page objects.
+
+BrowserJourney gives the shared purchase steps one interface over the page
+objects. api.journey.HttpJourney implements the same methods over the API,
+and the `journey` fixture picks one of the two for each scenario.
+"""
+
+from utils.auth_cache import AuthStateCache, capture_auth_state, restore_auth_state
+from .cart_page import CartPage
+from .checkout_page import CheckoutPage
+from .confirmation_page import ConfirmationPage
+from .login_page import LoginPage
+from .product_page import ProductPage
+
+
+class BrowserJourney:
+    """Storefront journey driven through a WebDriver session."""
+
+    def __init__(self, driver, base_url: str, auth_cache: AuthStateCache):
+        self.driver = driver
+        self.base_url = base_url
+        self.auth_cache = auth_cache
+        self.login_page = LoginPage(driver)
+        self.cart_page = CartPage(driver)
+        self.checkout_page = CheckoutPage(driver)
+        self.logger = self.login_page.logger
+
+    def open_home(self, base_url: str):
+        self.login_page.open_home(base_url)
+
+    def open_login_panel(self):
+        self.login_page.open_login_panel()
+
+    def log_in(self, username: str, password: str):
+        self.login_page.login_with_valid_credentials(username, password)
+
+    def log_in_as(self, username: str, password: str):
+        """
+        Open the homepage with the persona already logged in.
+
+        The UI login runs once per persona per worker; afterwards the captured
+        cookies and web storage are injected instead. A snapshot that no longer
+        authenticates is dropped and the UI login is repeated.
+        """
+        page = self.login_page
+        page.open_home(self.base_url)
+
+        snapshot = self.auth_cache.get(username)
+        if snapshot:
+            restore_auth_state(self.driver, snapshot)
+            self.driver.refresh()
+            if page.is_logged_in_as(username):
+                page.logger.info("Restored cached session for %s", username)
+                return
+            page.logger.warning("Cached session for %s was rejected; logging in again", username)
+            self.auth_cache.invalidate(username)
+
+        page.open_login_panel()
+        page.login_with_valid_credentials(username, password)
+        assert page.is_logged_in_as(username), f"UI login failed for {username}"
+        self.auth_cache.store(username, capture_auth_state(self.driver))
+
+    def add_to_cart(self, product_name: str):
+        ProductPage(self.driver).add_product_to_cart(product_name)
+
+    def validate_cart_line(self, product_name: str, product_price):
+        self.cart_page.validate_side_cart(product_name, product_price)
+
+    def validate_subtotal(self):
+        self.cart_page.validate_subtotal()
+
+    def proceed_to_checkout(self):
+        self.cart_page.proceed_to_checkout()
+
+    def verify_checkout_page(self) -> bool:
+        return self.checkout_page.verify_checkout_page()
+
+    def verify_order_line(self, product_name: str, product_price) -> bool:
+        return self.checkout_page.verify_product_in_order_summary(product_name, product_price)
+
+    def check_order_total(self) -> bool:
+        return self.checkout_page.check_order_summary_total()
+
+    def fill_checkout_form(self, first_name, last_name, address, state_or_province, postcode):
+        self.checkout_page.fill_checkout_form(
+            first_name=first_name,
+            last_name=last_name,
+            address=address,
+            state_or_province=state_or_province,
+            postcode=postcode,
+        )
+
+    def place_order(self):
+        self.checkout_page.place_order()
+
+    def get_confirmation_message(self) -> str:
+        return ConfirmationPage(self.driver).get_confirmation_message()
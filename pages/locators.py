@@ -0,0 +1,194 @@
+"""
+Central registry of page-object locators.
+
+Page objects declare every locator once, at class level, through `locator()`
+or `template()`. Declarations are compiled when the module is imported:
+- XPath expressions that have an exact CSS equivalent (tag, id, class and
+  attribute predicates joined by `/` or `//`) are rewritten to CSS, which
+  browsers resolve faster
+- parameterised locators are stored as templates whose arguments are quoted
+  safely for XPath/CSS; each distinct set of arguments is compiled once and
+  memoised
+
+Every declaration is also kept in REGISTRY under a dotted name
+("cart.checkout_button") so utils.locator_benchmark can time them all against
+saved DOM snapshots.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+
+Locator = Tuple[str, str]
+
+_STEP = re.compile(r"(//|/)([A-Za-z][\w-]*|\*)((?:\[[^\[\]]+\])*)")
+_PREDICATE = re.compile(r"\[([^\[\]]+)\]")
+_ATTR_EQUALS = re.compile(r"""^@([\w-]+)\s*=\s*(?:'([^']*)'|"([^"]*)")$""")
+_ATTR_CONTAINS = re.compile(r"""^contains\(\s*@([\w-]+)\s*,\s*(?:'([^']*)'|"([^"]*)")\s*\)$""")
+_ATTR_EXISTS = re.compile(r"^@([\w-]+)$")
+
+
+def xpath_literal(value: str) -> str:
+    """Quote a value as an XPath string literal, even if it contains both quote types."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def css_string(value: str) -> str:
+    """Quote a value as a CSS string."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _css_predicate(predicate: str) -> Optional[str]:
+    predicate = predicate.strip()
+    match = _ATTR_EQUALS.match(predicate)
+    if match:
+        name, value = match.group(1), match.group(2) if match.group(2) is not None else match.group(3)
+        return f"[{name}={css_string(value)}]"
+    match = _ATTR_CONTAINS.match(predicate)
+    if match:
+        name, value = match.group(1), match.group(2) if match.group(2) is not None else match.group(3)
+        return f"[{name}*={css_string(value)}]"
+    match = _ATTR_EXISTS.match(predicate)
+    if match:
+        return f"[{match.group(1)}]"
+    return None
+
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Translate an XPath expression into an equivalent CSS selector.
+
+    Only the subset with exact CSS semantics is translated: `//` and `/` steps
+    over element names or `*`, with `@attr='value'`, `contains(@attr, 'value')`
+    and `@attr` predicates. Text matching, axes, positions and functions have
+    no CSS equivalent.
+
+    Args:
+        xpath: XPath expression starting with `//`.
+
+    Returns:
+        The CSS selector, or None if the expression cannot be translated.
+    """
+    if not xpath.startswith("//"):
+        return None
+    parts = []
+    position = 0
+    for match in _STEP.finditer(xpath):
+        if match.start() != position:
+            return None
+        separator, tag, predicates = match.groups()
+        selector = "" if tag == "*" else tag
+        for predicate in _PREDICATE.findall(predicates):
+            css = _css_predicate(predicate)
+            if css is None:
+                return None
+            selector += css
+        if parts:
+            parts.append(" > " if separator == "/" else " ")
+        parts.append(selector or "*")
+        position = match.end()
+    if position != len(xpath) or not parts:
+        return None
+    return "".join(parts)
+
+
+def compile_locator(by: str, value: str) -> Locator:
+    """Return the fastest equivalent form of a locator, preferring CSS over XPath."""
+    if by == By.XPATH:
+        css = xpath_to_css(value)
+        if css is not None:
+            return By.CSS_SELECTOR, css
+    return by, value
+
+
+@dataclass
+class LocatorTemplate:
+    """
+    A locator with named placeholders, e.g. "//p[text()={product_name}]".
+
+    Placeholders are filled with quoted literals, so arguments containing
+    quotes cannot break the expression. Calling the template returns a
+    (By, value) tuple; results are memoised per argument set.
+    """
+
+    name: str
+    by: str
+    pattern: str
+    example: Dict[str, str] = field(default_factory=dict)
+    _compiled: Dict[tuple, Locator] = field(default_factory=dict, repr=False)
+
+    def __call__(self, **params) -> Locator:
+        key = tuple(sorted(params.items()))
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            quote = xpath_literal if self.by == By.XPATH else css_string
+            value = self.pattern.format(**{name: quote(str(arg)) for name, arg in params.items()})
+            compiled = self._compiled[key] = compile_locator(self.by, value)
+        return compiled
+
+    def source(self, **params) -> Locator:
+        """Return the uncompiled locator, as declared, for the given arguments."""
+        quote = xpath_literal if self.by == By.XPATH else css_string
+        return self.by, self.pattern.format(**{name: quote(str(arg)) for name, arg in params.items()})
+
+
+@dataclass(frozen=True)
+class StaticLocator:
+    """A declared locator and the form it was compiled to."""
+
+    name: str
+    source: Locator
+    compiled: Locator
+
+
+REGISTRY: Dict[str, object] = {}
+
+
+def _register(name: str, entry):
+    if name in REGISTRY:
+        raise ValueError(f"Locator '{name}' is already registered")
+    REGISTRY[name] = entry
+
+
+def locator(name: str, by: str, value: str, css: Optional[str] = None) -> Locator:
+    """
+    Declare a static locator and return its compiled (By, value) tuple.
+
+    Args:
+        name: Dotted registry name, e.g. "login.sign_in_button".
+        by: Selenium strategy of the declared locator.
+        value: Locator expression.
+        css: Hand-written CSS equivalent for expressions outside the
+             automatic translation; the benchmark checks both match the
+             same elements.
+    """
+    compiled = (By.CSS_SELECTOR, css) if css else compile_locator(by, value)
+    entry = StaticLocator(name, (by, value), compiled)
+    _register(name, entry)
+    return entry.compiled
+
+
+def template(name: str, by: str, pattern: str, **example) -> LocatorTemplate:
+    """
+    Declare a parameterised locator.
+
+    Args:
+        name: Dotted registry name, e.g. "product.add_button".
+        by: Selenium strategy of the locator.
+        pattern: Expression with `{placeholder}` fields for quoted arguments.
+        **example: Sample arguments used when benchmarking the template.
+
+    Returns:
+        A LocatorTemplate; call it with the placeholder values.
+    """
+    entry = LocatorTemplate(name, by, pattern, example)
+    _register(name, entry)
+    return entry
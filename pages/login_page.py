@@ -8,6 +8,7 @@ object hides those details behind simple methods so that tests read clearly.
 from selenium.webdriver.common.by import By
 from utils.logger import get_logger
 from .base_page import BasePage
+from .locators import locator, template
 
 
 class LoginPage(BasePage):
@@ -16,14 +17,19 @@ class LoginPage(BasePage):
     """
     logger = get_logger(__name__)
 
-    SIGN_IN_BUTTON = (By.ID, "signin")
-    LOGOUT_LINK = (By.XPATH, "//span[contains(text(), 'Logout')]")
-    HEADER_LOGO = (By.XPATH, "//div[contains(@class,'justify-center')]")
-    USERNAME_DROPDOWN = (By.XPATH, "//div[contains(text(),'Select Username')]")
-    PASSWORD_DROPDOWN = (By.XPATH, "//div[contains(text(),'Select Password')]")
-    LOGIN_BUTTON = (By.ID, "login-btn")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, ".api-error")
-    USER_GREETING = (By.CSS_SELECTOR, ".username")
+    SIGN_IN_BUTTON = locator("login.sign_in_button", By.ID, "signin")
+    LOGOUT_LINK = locator("login.logout_link", By.XPATH, "//span[contains(text(), 'Logout')]")
+    HEADER_LOGO = locator("login.header_logo", By.XPATH, "//div[contains(@class,'justify-center')]")
+    USERNAME_DROPDOWN = locator("login.username_dropdown", By.XPATH, "//div[contains(text(),'Select Username')]")
+    PASSWORD_DROPDOWN = locator("login.password_dropdown", By.XPATH, "//div[contains(text(),'Select Password')]")
+    LOGIN_BUTTON = locator("login.login_button", By.ID, "login-btn")
+    LOGIN_FORM = locator("login.form", By.CSS_SELECTOR, "form")
+    ERROR_MESSAGE = locator("login.error_message", By.CSS_SELECTOR, ".api-error")
+    USER_GREETING = locator("login.user_greeting", By.CSS_SELECTOR, ".username")
+    USERNAME_OPTION = template("login.username_option", By.XPATH,
+                               "//div[@id='username']//div[contains(text(),{username})]", username="demouser")
+    PASSWORD_OPTION = template("login.password_option", By.XPATH,
+                               "//div[@id='password']//div[contains(text(),{password})]", password="testingisfun99")
 
     def open_home(self, base_url: str):
         """Open the bstackdemo homepage."""
@@ -39,21 +45,13 @@ class LoginPage(BasePage):
 
     def select_username(self, username: str):
         """Select a username from the dropdown based on visible text."""
-        option = (
-            By.XPATH,
-            f"//div[@id='username']//div[contains(text(),'{username}')]",
-        )
         self.click(self.USERNAME_DROPDOWN)
-        self.click(option)
+        self.click(self.USERNAME_OPTION(username=username))
 
     def select_password(self, password: str):
         """Select a password from the dropdown based on visible text."""
-        option = (
-            By.XPATH,
-            f"//div[@id='password']//div[contains(text(),'{password}')]",
-        )
         self.click(self.PASSWORD_DROPDOWN)
-        self.click(option)
+        self.click(self.PASSWORD_OPTION(password=password))
 
     def login_with_valid_credentials(self, username: str, password: str):
         """
@@ -66,12 +64,16 @@ class LoginPage(BasePage):
         self.select_username(username)
         self.select_password(password)
         self.click(self.LOGIN_BUTTON)
-        self.logger.info(f"Logged in with {username}")
+        self.logger.info("Logged in with %s", username)
 
     def get_logged_in_username(self) -> str:
         """Return the username shown in the header once logged in."""
         return self.get_text(self.USER_GREETING)
 
+    def is_logged_in_as(self, username: str) -> bool:
+        """Return True if the header shows the given user as logged in."""
+        return self.element_has_text(self.USER_GREETING, username)
+
     def login_without_credentials(self):
         """Perform login without providing any credentials."""
         self.click(self.LOGIN_BUTTON)
@@ -97,6 +99,8 @@ class LoginPage(BasePage):
             self.PASSWORD_DROPDOWN,
             self.LOGIN_BUTTON,
         ]
-        results = [self.element_visible(locator) for locator in locators]
+        # Wait for any control the snapshot does not show yet, then check them all on one snapshot
+        snapshot = self.read_snapshot(ready=locators)
+        results = [snapshot.visible(locator) for locator in locators]
         self.logger.info("Login UI controls visibility: %s", results)
         return all(results)
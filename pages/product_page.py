@@ -4,19 +4,27 @@ from selenium.webdriver.common.by import By
 from utils.logger import get_logger
 from .base_page import BasePage
 from .cart_page import CartPage
+from .locators import locator, template
 
 
 class ProductPage(BasePage):
 
     logger = get_logger(__name__)
 
+    PRODUCT_TILES = locator("product.tiles", By.XPATH, "//div[@class='shelf-item']")
+    PRODUCT_TILE = template("product.tile", By.XPATH,
+                            "//div[@class='shelf-item'][./p[text()={product_name}]]", product_name="iPhone 12")
+    ADD_TO_CART_BUTTON = template(
+        "product.add_to_cart_button", By.XPATH,
+        "//div[@class='shelf-item']/p[text()={product_name}]/following-sibling::div[text()='Add to cart']",
+        product_name="iPhone 12")
+
     def validate_product_listing_page(self):
         """
         Verify that the product listing page is open.
         """
         # Verify that the product listing page is open
-        assert self.element_visible(
-            (By.XPATH, "//div[@class='shelf-item']")), "Product listing page is not open"
+        assert self.element_visible(self.PRODUCT_TILES), "Product listing page is not open"
 
     def add_product_to_cart(self, product_name: str):
         """
@@ -25,15 +33,9 @@ class ProductPage(BasePage):
         Args:
             product_name: Visible name of the product (e.g. "iPhone 12").
         """
-        product_tile = (
-            By.XPATH,
-            f"//div[@class='shelf-item'][./p[text()='{product_name}']]"
-        )
+        product_tile = self.PRODUCT_TILE(product_name=product_name)
         # The add-to-cart button relative to that tile
-        add_button = (
-            By.XPATH,
-            f"//div[@class='shelf-item']/p[text()='{product_name}']//following-sibling::div[text()='Add to cart']"
-        )
+        add_button = self.ADD_TO_CART_BUTTON(product_name=product_name)
         cartPage = CartPage(self.driver)
 
         if cartPage.check_absence_of_side_cart_close_btn():
@@ -44,4 +46,4 @@ class ProductPage(BasePage):
             self.click(product_tile)
             self.click(add_button)
 
-        self.logger.info(f"Added {product_name} to cart")
+        self.logger.info("Added %s to cart", product_name)
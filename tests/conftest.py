@@ -7,38 +7,53 @@ debugging and reporting.
 """
 
 import os
-from datetime import datetime
 
 import pytest
-import yaml
 
 from utils.driver_factory import get_driver
+from utils.auth_cache import AuthStateCache
+from utils.config import load_config
+from utils.driver_pool import DriverPool
+from utils.load_profiles import apply_profile, resolve_profile
+from api.clients.async_store_client import AsyncStoreClient
+from api.journey import HttpJourney
+from api.clients.response_cache import ResponseCache
 from api.clients.store_client import StoreClient
+from mock_store.server import MockStoreServer
+from pages.journey import BrowserJourney
+from utils.logger import get_logger
+from utils.matrix import load_environments
+from utils.test_data import ProductCatalog
+from utils.timing import instrument_driver
+from utils.waits import apply_wait_policy, wait_state
+
+logger = get_logger(__name__)
+
+BROWSER_BACKEND = "browser"
+HTTP_BACKEND = "http"
 
 pytest_plugins = [
     "tests.step_definitions.common_steps",
     "tests.step_definitions.api_steps",
+    "tests.step_definitions.matrix_steps",
+    "tests.step_definitions.impact_steps",
+    "tests.step_definitions.retries_steps",
+    "tests.plugins.run_id",
+    "tests.plugins.parallel",
+    "tests.plugins.timing",
+    "tests.plugins.history",
+    "tests.plugins.artefacts",
+    "tests.plugins.accessibility",
+    "tests.plugins.load_profiles",
+    "tests.plugins.impact",
+    "tests.plugins.retries",
+    "tests.plugins.logs",
+    "tests.plugins.results",
 ]
 
-# Sample BrowserStack Platform, OS version and browser combinations
-BROWSERSTACK_ENVIRONMENTS = [
-    {
-        "browser_name": "chrome",
-        "browser_version": "latest",
-        "os_name": "Windows",
-        "os_version": "10",
-        "session_name": "Chrome on Win 10"
-    },
-    {
-        "browser_name": "firefox",
-        "browser_version": "latest",
-        "os_name": "OS X",
-        "os_version": "Ventura",
-        "session_name": "Firefox on Mac"
-    }
-    # can be extended as per requirement
-]
-
+# BrowserStack/Grid capability sets (see utils.matrix); the matrix runner
+# fans the suite out over all of them concurrently.
+BROWSERSTACK_ENVIRONMENTS = load_environments(load_config())
 
 @pytest.fixture(params=BROWSERSTACK_ENVIRONMENTS, scope="session")
 def browserstack_config(request):
@@ -81,55 +96,155 @@ def config():
     Load the test configuration from config.yaml.
 
     The configuration is shared across the entire test session and contains
-    basic runtime settings such as base URL, browser and run mode.
+    basic runtime settings such as base URL, browser and run mode. Environment
+    variables override individual keys (see utils.config.ENV_OVERRIDES).
+
+    When `mock_server` is enabled a local bstackdemo stand-in is started for
+    the worker and `base_url`/`api_base_url` point at it.
 
-    Returns:
+    Yields:
         Dictionary loaded from the YAML configuration file.
     """
-    with open("config/config.yaml") as f:
-        config_data = yaml.safe_load(f)
-
-    # Allow environment variables to override key runtime settings so Docker/CI
-    # pipelines can change behaviour without editing the YAML file.
-    overrides = {
-        "base_url": os.getenv("BASE_URL"),
-        "browser": os.getenv("BROWSER"),
-        "run_mode": os.getenv("RUN_MODE"),
-        "grid_url": os.getenv("GRID_URL"),
-        "implicit_wait": os.getenv("IMPLICIT_WAIT"),
-        "api_base_url": os.getenv("API_BASE_URL"),
-    }
-
-    for key, value in overrides.items():
-        if value is None:
-            continue
-        if key == "implicit_wait":
-            config_data[key] = int(value)
-        else:
-            config_data[key] = value
+    config_data = load_config()
+    server = None
+    if config_data.get("mock_server"):
+        server = MockStoreServer(host=config_data.get("mock_server_host") or "127.0.0.1").start()
+        config_data["base_url"] = server.base_url
+        config_data["api_base_url"] = server.api_base_url
+
+    yield config_data
 
-    return config_data
+    if server:
+        server.stop()
 
 
 @pytest.fixture(scope="session")
 def store_client(config):
-    """Provide a REST client for BrowserStack demo APIs."""
+    """
+    Provide a REST client for BrowserStack demo APIs.
+
+    With `api_cache` enabled, catalog reads go through an LRU/TTL response
+    cache (optionally persisted to `api_cache_dir`) and the hit/miss counters
+    are logged when the session ends.
+    """
+    base_url = config.get("api_base_url")
+    if not base_url:
+        raise RuntimeError("api_base_url missing from config/config.yaml")
+    cache = None
+    if config.get("api_cache"):
+        cache = ResponseCache(
+            ttl_seconds=config.get("api_cache_ttl", 300),
+            disk_dir=config.get("api_cache_dir") or None,
+        )
+    yield StoreClient(base_url, timeout=config.get("api_timeout", 15), cache=cache)
+    if cache:
+        logger.info("API response cache: %s", cache.stats())
+
+
+@pytest.fixture(scope="session")
+def catalog(store_client):
+    """Provide the product catalog, fetched once per worker and indexed by title and id."""
+    return ProductCatalog.from_client(store_client)
+
+
+@pytest.fixture(scope="session")
+def catalog_examples(config, catalog):
+    """Provide the rows behind generated catalog Examples (see `catalog_examples`/`catalog_seed`)."""
+    return catalog.examples(config.get("catalog_examples", 20), seed=config.get("catalog_seed", 0))
+
+
+@pytest.fixture(scope="session")
+def async_store_client(config):
+    """Provide a connection-pooled, bounded-concurrency client for API fan-out checks."""
     base_url = config.get("api_base_url")
     if not base_url:
         raise RuntimeError("api_base_url missing from config/config.yaml")
-    return StoreClient(base_url)
+    client = AsyncStoreClient(
+        base_url,
+        concurrency=config.get("api_concurrency", 8),
+        timeout=config.get("api_timeout", 15),
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def auth_cache(config):
+    """Provide the per-worker cache of logged-in browser state by persona."""
+    return AuthStateCache(ttl_seconds=config.get("auth_cache_ttl", 900))
+
+
+def scenario_backend(node, config: dict) -> str:
+    """
+    Return the backend a scenario's journey steps run on.
+
+    @browser (rendering-dependent checks) always gets a browser, @http always
+    runs over the API, and otherwise scenarios carrying any tag listed in
+    `http_backend_tags` run over the API.
+    """
+    if node.get_closest_marker(BROWSER_BACKEND):
+        return BROWSER_BACKEND
+    if node.get_closest_marker(HTTP_BACKEND):
+        return HTTP_BACKEND
+    tags = {tag.strip() for tag in (config.get("http_backend_tags") or "").split(",") if tag.strip()}
+    if any(node.get_closest_marker(tag) for tag in tags):
+        return HTTP_BACKEND
+    return BROWSER_BACKEND
 
 
 @pytest.fixture
-def driver(config, request):
+def journey(config, request):
+    """
+    Provide the storefront journey the shared purchase steps drive.
+
+    Scenarios on the HTTP backend (see scenario_backend) replay the journey
+    over StoreClient and never start a browser; all others drive the page
+    objects through the `driver` fixture.
+    """
+    if scenario_backend(request.node, config) == HTTP_BACKEND:
+        return HttpJourney(request.getfixturevalue("store_client"), request.getfixturevalue("catalog"))
+    return BrowserJourney(request.getfixturevalue("driver"), config["base_url"],
+                          request.getfixturevalue("auth_cache"))
+
+
+@pytest.fixture(scope="session")
+def driver_pool(config):
+    """
+    Provide a worker-local pool of warm browser sessions.
+
+    Only used when `driver_pool` is enabled in the configuration. Each xdist
+    worker gets its own pool because session fixtures are per process.
+    """
+    pool = DriverPool(
+        factory=lambda: get_driver(config),
+        max_uses=config.get("driver_pool_max_uses", 20),
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(config, request, artefacts):
     """
     Provide a WebDriver instance to each test and handle clean-up.
 
     The fixture:
-    - creates a WebDriver using the driver factory
-    - applies implicit wait settings
-    - captures a screenshot if the test fails
-    - quits the browser when the test is finished
+    - fails at once if the scenario runs on the HTTP backend (see `journey`),
+      since a browser step there would check nothing the journey drives
+    - creates a WebDriver using the driver factory, or checks out a warm
+      session from the driver pool when `driver_pool` is enabled (never for
+      a rerun of a failed scenario)
+    - applies the page-load profile: the configured `load_profile`, or full
+      loads for scenarios tagged @full_load; a pooled session that cannot
+      switch profile (no CDP) is handed back and a new one is started
+    - applies the configured wait policy (explicit-only by default)
+    - records how long the test spent waiting versus acting, and the wall
+      time of every WebDriver command for the step timing report
+    - captures a screenshot, the page source and browser logs if the test
+      fails; only the grab happens here, encoding and writing run on the
+      artefact pipeline's background threads
+    - quits the browser (or resets and returns it to the pool) when the test
+      is finished
 
     Args:
         config: Session-level configuration dictionary.
@@ -138,19 +253,62 @@ def driver(config, request):
     Yields:
         A Selenium WebDriver instance for use in tests.
     """
-    driver = get_driver(config)
-    driver.implicitly_wait(config.get("implicit_wait", 10))
+    if scenario_backend(request.node, config) == HTTP_BACKEND:
+        pytest.fail(f"{request.node.name} runs on the HTTP backend but a step needs a browser; "
+                    "tag the scenario @browser", pytrace=False)
+    profile = resolve_profile(config, full_load=request.node.get_closest_marker("full_load") is not None)
+    # Reruns (see tests.plugins.retries) always get a fresh session.
+    rerun = getattr(request.node, "retry_attempt", 0)
+    pool = request.getfixturevalue("driver_pool") if config.get("driver_pool") and not rerun else None
+    pooled = None
+    if pool:
+        pooled = pool.acquire()
+        if apply_profile(pooled.driver, profile):
+            driver = pooled.driver
+            request.node.user_properties.append(
+                ("driver_checkout_seconds", round(pool.last_checkout_seconds, 3)))
+        else:
+            pool.release(pooled)
+            pooled = None
+    if pooled is None:
+        driver = get_driver(config, profile)
+        apply_profile(driver, profile)
+    instrument_driver(driver)
+    apply_wait_policy(driver, config)
+    waits = wait_state(driver)
+    waits.reset_counters()
 
     yield driver
 
-    # Screenshot on failure
+    request.node.user_properties.append(("wait_seconds", round(waits.wait_seconds, 3)))
+    request.node.user_properties.append(("action_seconds", round(waits.action_seconds, 3)))
+    request.node.user_properties.append(("in_page_waits", waits.in_page_waits))
+    request.node.user_properties.append(("poll_fallbacks", waits.poll_fallbacks))
+    request.node.user_properties.append(("round_trips_saved", waits.round_trips_saved))
+    logger.info("%s spent %.3fs waiting and %.3fs acting; in-page waits saved ~%d round trip(s)",
+                request.node.name, waits.wait_seconds, waits.action_seconds, waits.round_trips_saved)
+
+    # Artefacts on failure
     report = getattr(request.node, "rep_call", None)
     if report and report.failed:
-        os.makedirs("reports/screenshots", exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"reports/screenshots/{request.node.name}_{timestamp}.png"
-        driver.save_screenshot(filename)
-        screenshot_relative_path = f"screenshots/{request.node.name}_{timestamp}.png"
-        report.screenshot_path = screenshot_relative_path
-
-    driver.quit()
+        paths = artefacts.capture(driver, request.node.name)
+        for kind, path in paths.items():
+            # Picked up from the teardown report by the result stream (tests/plugins/results.py)
+            request.node.user_properties.append(("artefact", {"label": kind, "path": path}))
+        if "screenshot" in paths:
+            # Linked from reports/report.html, so keep the path relative to reports/
+            report.screenshot_path = os.path.relpath(paths["screenshot"], "reports").replace(os.sep, "/")
+
+    if pooled:
+        pool.release(pooled)
+        request.node.user_properties.append(
+            ("driver_reset_seconds", round(pool.last_reset_seconds, 3)))
+        logger.info(
+            "Pooled driver for %s: checkout %.3fs, reset %.3fs (use %s)",
+            request.node.name,
+            pool.last_checkout_seconds,
+            pool.last_reset_seconds,
+            pooled.uses,
+        )
+    else:
+        driver.quit()
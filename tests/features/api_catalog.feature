@@ -13,6 +13,12 @@ Feature: BrowserStack Demo catalog API
     And the response should contain at least 1 products
     And each product item should include the fields "title, price, description"
 
+  @api @api_catalog @catalog_sweep
+  Scenario: Generated catalog examples resolve to exactly priced products
+    Given a generated catalog example
+    Then the example product should resolve to the same entry by title and by id
+    And the example price should match the catalog API to the cent
+
   @api @api_login
   Scenario Outline: Valid persona credentials can authenticate via the API
     When I authenticate via the API as "<username>" with password "<password>"
@@ -22,3 +28,20 @@ Feature: BrowserStack Demo catalog API
       | username  | password       |
       | demouser  | testingisfun99 |
       | fav_user  | testingisfun99 |
+
+  @api @api_login
+  Scenario: All personas can authenticate concurrently
+    When I authenticate the following personas via the API concurrently
+      | username               | password       |
+      | demouser               | testingisfun99 |
+      | image_not_loading_user | testingisfun99 |
+      | existing_orders_user   | testingisfun99 |
+      | fav_user               | testingisfun99 |
+    Then every persona sign-in should return status 200
+
+  @api @api_client
+  Scenario: Concurrent API calls stay within the limit and are timed per attempt
+    Given a local API stub that answers after 0.2 seconds
+    When the catalog is fetched 6 times with a concurrency limit of 2
+    Then the stub should never have served more than 2 requests at once
+    And each fan-out request should be timed without its wait for a free slot
@@ -0,0 +1,32 @@
+Feature: Impact-based test selection
+  As a developer in test
+  I want --impact-select to run every scenario a change can affect
+  So that a pull request never skips a scenario it broke
+
+  Background:
+    Given a scratch git copy of the page objects, step definitions and features
+
+  @impact
+  Scenario: A change to a module-level page helper selects the scenarios using compiled locators
+    When a line is added inside "xpath_to_css" in "pages/locators.py"
+    Then the change should map to the symbol "pages/locators.py::xpath_to_css"
+    And impact selection should pick "checkout.feature::User cannot check out with an empty cart"
+    And impact selection should pick "login.feature::Login modal displays core UI controls"
+    And impact selection should not pick "api_catalog.feature::Product catalog endpoint returns data"
+
+  @impact
+  Scenario: A change to a page method selects only the scenarios that reach it
+    When a line is added inside "CheckoutPage.fill_checkout_form" in "pages/checkout_page.py"
+    Then impact selection should pick "checkout.feature::User can add one product to cart, validate cart, complete checkout and place the order"
+    And impact selection should not pick "checkout.feature::User cannot check out with an empty cart"
+
+  @impact
+  Scenario: A changed step-module fixture the static pass does not model forces a full run
+    When a line is added inside "api_context" in "tests/step_definitions/api_steps.py"
+    Then impact selection should be a full run because "the static index does not model it"
+
+  @impact
+  Scenario: Selection falls back to a full run until an index has been stored
+    Given no dependency index has been stored yet
+    When a line is added inside "CheckoutPage.fill_checkout_form" in "pages/checkout_page.py"
+    Then impact selection should be a full run because "no dependency index yet"
@@ -1,3 +1,5 @@
+# Every scenario here checks what the login modal renders, so none can run on the HTTP backend.
+@browser
 Feature: Login
   As a user
   I want to validate correct and incorrect login attempts
@@ -23,6 +25,11 @@ Feature: Login
       | demouser               | testingisfun99 | demouser               |
       | existing_orders_user   | testingisfun99 | existing_orders_user   |
       | fav_user               | testingisfun99 | fav_user               |
+
+    # Image rendering is part of what this persona checks, so load every resource.
+    @full_load
+    Examples:
+      | username               | password       | expected_header        |
       | image_not_loading_user | testingisfun99 | image_not_loading_user |
 
   @regression @login @login_invalid
@@ -34,3 +41,8 @@ Feature: Login
 @login @login_accessibility
   Scenario: Login page should pass accessibility checks
     Then the page should pass accessibility checks
+
+@login @login_accessibility
+  Scenario: Login form should stay accessible after a failed login
+    When I try log in without entering credentials
+    Then the login form should pass accessibility checks
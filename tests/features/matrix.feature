@@ -0,0 +1,14 @@
+Feature: Capability matrix on a Selenium Grid
+  As a developer in test
+  I want matrix runs to share the Grid within a session budget
+  So that every capability set runs concurrently without overbooking nodes
+
+  @matrix
+  Scenario: Matrix sessions queue for free Grid slots instead of failing
+    Given a Grid stand-in with 2 nodes offering "chrome, firefox" with 2 sessions each
+    When session slots are planned with a budget of 3 and at most 1 session per node
+    Then the planned limits should be "budget=2, chrome=2, firefox=2"
+    When 6 sessions per matrix environment are opened concurrently
+    Then every matrix session should have been created
+    And no Grid node should have run more than 1 session at once
+    And the Grid stand-in should not have rejected any session
@@ -0,0 +1,48 @@
+Feature: Scenario reruns and the quarantine lane
+  As a developer in test
+  I want failed scenarios rerun at the end of the session and reported once
+  So that a transient failure does not break the build and a real one is never reported as a pass
+
+  Background:
+    Given a scratch suite run with the retries plugin
+
+  @retries
+  Scenario: A scenario that fails once passes on its rerun
+    Given a scratch test "flaky" that fails once and then passes
+    And a scratch test "stable" that passes
+    When the scratch suite runs with 1 retry, a budget of 10 and 2 xdist workers
+    Then the scratch suite should exit with status 0
+    And "flaky" should have run 2 times
+    And the JUnit report should list "flaky" once as "passed" on retry attempt 1
+    And the JUnit report should list "stable" once as "passed" on retry attempt 0
+    And the flakiness scores should record "flaky" as "flaky"
+
+  @retries
+  Scenario: A scenario that always fails is reported as one failure after its reruns
+    Given a scratch test "broken" that always fails
+    When the scratch suite runs with 2 retries, a budget of 10 and 2 xdist workers
+    Then the scratch suite should exit with status 1
+    And "broken" should have run 3 times
+    And the JUnit report should list "broken" once as "failed" on retry attempt 2
+    And the flakiness scores should record "broken" as "failed"
+
+  @retries
+  Scenario: Failures beyond the retry budget are not rerun
+    Given a scratch test "first" that fails once and then passes
+    And a scratch test "second" that fails once and then passes
+    When the scratch suite runs with 1 retry, a budget of 1 and 0 xdist workers
+    Then the scratch suite should exit with status 1
+    And "first" should have run 2 times
+    And "second" should have run 1 time
+    And the JUnit report should list "first" once as "passed" on retry attempt 1
+    And the JUnit report should list "second" once as "failed" on retry attempt 0
+
+  @retries
+  Scenario: A quarantined scenario runs last and its failure does not fail the build
+    Given a scratch test "quarantined" that always fails
+    And a scratch test "stable" that passes
+    And "quarantined" has scored 0.9 flakiness over 5 runs
+    When the scratch suite runs with 0 retries, a budget of 10 and 0 xdist workers
+    Then the scratch suite should exit with status 0
+    And "quarantined" should have run last
+    And the JUnit report should list "quarantined" once as "skipped" on retry attempt 0
@@ -5,10 +5,10 @@ Feature: Visual and UX validation backlog
 
   # Planned scenarios (kept as comments until automated)
 
-  # @todo @footer Scenario: Footer links are consistent across pages
+  # @todo @footer @full_load Scenario: Footer links are consistent across pages
   #   Then Trademark, Privacy Policy, Read More and Subscribe to Newsletter links should work
   #   And the delivery illustration should be visible
   #
-  # @todo @images Scenario: Placeholder images are replaced with loaded images
+  # @todo @images @full_load Scenario: Placeholder images are replaced with loaded images
   #   Given I log in as "image_not_loading_user"
   #   Then no product card should fall back to a placeholder image
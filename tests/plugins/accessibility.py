@@ -0,0 +1,72 @@
+"""
+Aggregated accessibility report.
+
+Provides the session-scoped `accessibility` engine (see utils.accessibility)
+used by the accessibility steps. Each worker keeps its own DOM-hash cache and
+deduplicated report. At the end of the run xdist workers send their reports
+to the controller through `workeroutput`, and the controller writes a single
+reports/accessibility/report.json. Each violation appears once per rule and
+element, listing every test, page and scope that hit it.
+"""
+
+import json
+import os
+
+import pytest
+
+from utils.accessibility import AccessibilityEngine, AccessibilityReport, report_path
+from utils.file_lock import atomic_write
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def pytest_configure(config):
+    config.accessibility_report = AccessibilityReport()
+
+
+@pytest.fixture(scope="session")
+def accessibility(config, request):
+    """Provide the worker's accessibility engine; violations land in the run report."""
+    tags = [tag.strip() for tag in (config.get("accessibility_tags") or "").split(",") if tag.strip()]
+    options = {"runOnly": {"type": "tag", "values": tags}} if tags else {}
+    return AccessibilityEngine(request.config.accessibility_report, options)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Fold a finished worker's report into the controller's."""
+    data = getattr(node, "workeroutput", {}).get("accessibility")
+    if data:
+        node.config.accessibility_report.merge(data)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    report = config.accessibility_report
+    if hasattr(config, "workerinput"):
+        config.workeroutput["accessibility"] = report.to_dict()
+        return
+    if not any(report.stats.values()):
+        return
+    data = report.to_dict()
+    path = report_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    atomic_write(path, json.dumps(data, indent=2))
+    logger.info("Accessibility: %d unique violation(s) across %d rule(s) (%s); report at %s",
+                len(data["violations"]), len(data["rules"]), data["stats"], path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Summarise the deduplicated accessibility violations in the HTML report."""
+    report = session.config.accessibility_report
+    if not report.violations:
+        return
+    data = report.to_dict()
+    postfix.append(
+        f"<p>Accessibility: {len(data['violations'])} unique violation(s) across "
+        f"{len(data['rules'])} rule(s) ({', '.join(data['rules'])}); see {report_path()}</p>"
+    )
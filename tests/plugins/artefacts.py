@@ -0,0 +1,43 @@
+"""
+Failure and per-step artefact capture.
+
+Provides the session-scoped `artefacts` pipeline (see utils.artefacts) used by
+the `driver` fixture on failure and by the accessibility step. With
+`artefacts_every_step` enabled a screenshot is also queued after every
+pytest-bdd step that uses a browser; those captures are best effort and are
+dropped rather than slowing the test down when the writers fall behind.
+"""
+
+import pytest
+
+from utils.artefacts import ArtefactPipeline
+
+
+@pytest.fixture(scope="session")
+def artefacts(config, report_dir):
+    """Provide the worker's artefact pipeline; pending writes are flushed at session end."""
+    pipeline = ArtefactPipeline(
+        report_dir,
+        workers=config.get("artefact_workers", 2),
+        queue_size=config.get("artefact_queue_size", 64),
+        image_format=(config.get("artefact_format") or "png").lower(),
+    )
+    yield pipeline
+    pipeline.close()
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    if "driver" not in request.fixturenames or not request.getfixturevalue("config").get("artefacts_every_step"):
+        return
+    index = getattr(request.node, "artefact_step", 0) + 1
+    request.node.artefact_step = index
+    paths = request.getfixturevalue("artefacts").capture(
+        request.getfixturevalue("driver"),
+        f"{request.node.name}_{index:02d}_{step.name}",
+        kinds=("screenshot",),
+        subdir="steps",
+        best_effort=True,
+    )
+    if "screenshot" in paths:
+        request.node.user_properties.append(
+            ("artefact", {"label": f"step {index}: {step.name}", "path": paths["screenshot"]}))
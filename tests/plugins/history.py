@@ -0,0 +1,49 @@
+"""
+Run history.
+
+After the timing plugin has merged a run's samples (see
+tests/plugins/timing.py), the controller records them in the SQLite run
+history (`history_db`, see utils.run_history). Each scenario's duration and
+every step, BasePage action and WebDriver command sample is stored with the
+commit, browser and run mode, so later runs can be checked for p95
+regressions:
+
+    python -m utils.run_history compare
+"""
+
+import sqlite3
+
+from utils.config import load_config
+from utils.logger import get_logger
+from utils.run_history import DEFAULT_DB, SCENARIO, RunHistory, git_commit
+
+
+logger = get_logger(__name__)
+
+
+def pytest_sessionfinish(session):
+    """Record the merged run; runs after the timing plugin's tryfirst sessionfinish."""
+    config = session.config
+    run = getattr(config, "timing_run", None)
+    if hasattr(config, "workerinput") or not run or not run["tests"]:
+        return
+    settings = load_config()
+    environment = settings.get("matrix_environment") or {}
+    samples = dict(run["samples"])
+    samples[SCENARIO] = {nodeid: [test["duration"]] for nodeid, test in run["tests"].items()}
+    path = settings.get("history_db") or DEFAULT_DB
+    try:
+        with RunHistory(path) as history:
+            history.record_run(
+                run["run_id"],
+                samples,
+                commit=git_commit(),
+                browser=(environment.get("browser_name") or settings.get("browser") or "").lower(),
+                run_mode=settings.get("run_mode", "local"),
+                tests=len(run["tests"]),
+                keep=int(settings.get("history_keep_runs") or 0),
+            )
+    except sqlite3.Error as exc:
+        logger.warning("Could not record the run in %s: %s", path, exc)
+        return
+    logger.info("Run %s recorded in %s", run["run_id"], path)
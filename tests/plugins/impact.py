@@ -0,0 +1,207 @@
+"""
+Impact-based test selection.
+
+Options:
+- `--impact-select`: run only the scenarios impacted by the diff against
+  `--impact-base` (default: `impact_base`, origin/main), falling back to
+  the full suite whenever the impact cannot be bounded
+- `--impact-trace`: record which repository functions and fixtures each
+  scenario actually runs, refining the dependency index
+
+The index (see utils.impact) is stored in reports/impact_index.json. Its
+static layer is rebuilt from the collected scenarios on every run that uses
+either option, and its traced layer is updated by traced runs. Under xdist
+every worker computes the same selection, and workers send their traces to
+the controller through `workeroutput`.
+"""
+
+import inspect
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+from utils.config import load_config
+from utils.file_lock import atomic_write, locked
+from utils.impact import (
+    INDEX_VERSION,
+    CallTracer,
+    changed_since,
+    indexed_symbols,
+    load_index,
+    rel,
+    select,
+    selection_index,
+    static_dependencies,
+)
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_INDEX = os.path.join("reports", "impact_index.json")
+
+
+def scenario_key(item) -> str:
+    """Return "<feature path>::<scenario name>" for a pytest-bdd item, or "" for other tests."""
+    scenario = getattr(getattr(item, "obj", None), "__scenario__", None)
+    if scenario is None:
+        return ""
+    return f"{rel(scenario.feature.filename, ROOT)}::{scenario.name}"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact")
+    group.addoption("--impact-select", action="store_true",
+                    help="Run only scenarios impacted by changes since --impact-base.")
+    group.addoption("--impact-base", default=None,
+                    help="Git ref to diff against (default: impact_base from config, else origin/main).")
+    group.addoption("--impact-trace", action="store_true",
+                    help="Record the code each scenario runs to refine the impact index.")
+    group.addoption("--impact-index", default=os.getenv("IMPACT_INDEX", DEFAULT_INDEX),
+                    help="JSON file holding the scenario dependency index.")
+
+
+def pytest_configure(config):
+    config.impact_enabled = config.getoption("--impact-select") or config.getoption("--impact-trace")
+    config.impact_static = {}
+    config.impact_traced = {}
+    config.impact_summary = ""
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    if not config.impact_enabled:
+        return
+    scenarios: Dict[str, List[Tuple[str, str]]] = {}
+    files: Dict[str, Set[str]] = {}
+    for item in items:
+        key = scenario_key(item)
+        if key:
+            scenario = item.obj.__scenario__
+            scenarios[key] = [(step.type, step.name) for step in scenario.steps]
+            files.setdefault(key, set()).update({rel(scenario.feature.filename, ROOT), rel(str(item.path), ROOT)})
+    config.impact_static = static_dependencies(ROOT, scenarios)
+    if not config.getoption("--impact-select"):
+        return
+
+    index = selection_index(load_index(config.getoption("--impact-index")), config.impact_static)
+    base = config.getoption("--impact-base") or load_config().get("impact_base") or "origin/main"
+    try:
+        changes = changed_since(ROOT, base)
+    except (subprocess.CalledProcessError, FileNotFoundError) as exc:
+        config.impact_summary = f"Impact selection: full run (git diff against {base} failed: {exc})"
+        return
+    selection = select(index, changes, files, indexed_symbols(ROOT))
+    if selection.full_run:
+        config.impact_summary = f"Impact selection: full run ({selection.reason})"
+        return
+
+    kept, deselected = [], []
+    for item in items:
+        key = scenario_key(item)
+        (kept if not key or key in selection.selected else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = kept
+    config.impact_summary = f"Impact selection against {base}: {selection.reason}, {len(kept)} test(s) kept"
+
+
+def _fixture_symbols(item) -> Set[str]:
+    """Return the repository fixture (and step) functions the test resolved."""
+    symbols = set()
+    # pytest keeps dynamically requested fixtures (pytest-bdd steps) only on the request.
+    fixture_defs = getattr(getattr(item, "_request", None), "_fixture_defs", {})  # pylint: disable=protected-access
+    for fixturedef in fixture_defs.values():
+        func = inspect.unwrap(getattr(fixturedef, "func", None) or (lambda: None))
+        code = getattr(func, "__code__", None)
+        if code is None:
+            continue
+        path = os.path.abspath(code.co_filename)
+        if path.startswith(ROOT + os.sep) and "site-packages" not in path:
+            symbols.add(f"{rel(path, ROOT)}::{getattr(code, 'co_qualname', code.co_name)}")
+    return symbols
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    config = item.config
+    key = scenario_key(item)
+    if not key or not config.getoption("--impact-trace"):
+        yield
+        return
+    tracer = CallTracer(ROOT)
+    item.impact_tracer = tracer
+    yield
+    config.impact_traced.setdefault(key, set()).update(tracer.calls)
+
+
+def _traced_phase(item):
+    tracer = getattr(item, "impact_tracer", None)
+    if tracer is not None:
+        sys.setprofile(tracer)
+    return tracer
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    tracer = _traced_phase(item)
+    yield
+    if tracer is not None:
+        sys.setprofile(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    tracer = _traced_phase(item)
+    yield
+    if tracer is not None:
+        sys.setprofile(None)
+        tracer.calls |= _fixture_symbols(item)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Fold a worker's static index, traces and selection summary into the controller's."""
+    output = getattr(node, "workeroutput", {})
+    config = node.config
+    config.impact_static.update(output.get("impact_static", {}))
+    for key, symbols in output.get("impact_traced", {}).items():
+        config.impact_traced.setdefault(key, set()).update(symbols)
+    config.impact_summary = config.impact_summary or output.get("impact_summary", "")
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not config.impact_enabled:
+        return
+    if hasattr(config, "workerinput"):
+        # The controller does not collect under xdist, so workers report everything.
+        config.workeroutput.update(
+            impact_static=config.impact_static,
+            impact_traced={key: sorted(symbols) for key, symbols in config.impact_traced.items()},
+            impact_summary=config.impact_summary,
+        )
+        return
+    path = config.getoption("--impact-index")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with locked(path):
+        index = load_index(path)
+        traced = dict(index.get("traced", {}))
+        traced.update({key: sorted(symbols) for key, symbols in config.impact_traced.items()})
+        index = {
+            "version": INDEX_VERSION,
+            "static": dict(index.get("static", {}), **config.impact_static),
+            "traced": traced,
+        }
+        atomic_write(path, json.dumps(index, indent=1, sort_keys=True))
+    logger.info("Impact index updated at %s (%d scenario(s) traced this run)", path, len(config.impact_traced))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if config.impact_summary:
+        terminalreporter.write_line(config.impact_summary)
@@ -0,0 +1,92 @@
+"""
+Page-load profile report.
+
+BasePage.open records every navigation: the profile, the path, the bytes
+transferred and the time until ready (see utils.load_profiles). At the end
+of the run, xdist workers send their navigations to the controller through
+`workeroutput`. The controller then:
+- folds full-profile navigations into a per-path baseline
+- writes reports/load_profiles.json with the baseline and, per profile, the
+  mean bytes and seconds and the bytes and seconds saved per navigation
+  compared with the baseline
+
+The baseline is kept between runs, so scenarios tagged @full_load (or a run
+with LOAD_PROFILE=full) keep it current.
+"""
+
+import json
+import os
+
+import pytest
+
+from utils.file_lock import atomic_write, locked
+from utils.load_profiles import stats, summarise_navigations, update_baseline
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+REPORT_FILE = os.path.join("reports", "load_profiles.json")
+
+
+def load_report(path: str) -> dict:
+    """Return the stored report, or an empty one."""
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def pytest_configure(config):
+    config.load_profile_summary = {}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect a finished worker's navigations."""
+    navigations = getattr(node, "workeroutput", {}).get("load_profile_navigations")
+    if navigations:
+        stats.navigations.extend(navigations)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["load_profile_navigations"] = stats.navigations
+        return
+    if not stats.navigations:
+        return
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    with locked(REPORT_FILE):
+        baseline = update_baseline(load_report(REPORT_FILE).get("baseline", {}), stats.navigations)
+        summary = summarise_navigations(stats.navigations, baseline)
+        atomic_write(REPORT_FILE, json.dumps({"baseline": baseline, "last_run": summary}, indent=2, sort_keys=True))
+    config.load_profile_summary = summary
+    for name, row in summary.items():
+        logger.info("Load profile %s: %s", name, row)
+
+
+def _saved(value, scale: float, digits: int) -> str:
+    return "-" if value is None else f"{value / scale:.{digits}f}"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Show the bytes and time each load profile saved per navigation."""
+    rows = session.config.load_profile_summary
+    if not rows:
+        return
+    body = "".join(
+        f"<tr><td>{name}</td><td>{row['navigations']}</td><td>{row['mean_bytes'] / 1024:.0f}</td>"
+        f"<td>{row['mean_seconds']:.2f}</td><td>{_saved(row['bytes_saved_per_navigation'], 1024, 0)}</td>"
+        f"<td>{_saved(row['seconds_saved_per_navigation'], 1, 2)}</td></tr>"
+        for name, row in sorted(rows.items())
+    )
+    postfix.append(
+        "<h2>Page-load profiles</h2>"
+        "<table><thead><tr><th>Profile</th><th>Navigations</th><th>Mean KiB</th><th>Mean s</th>"
+        "<th>KiB saved/nav</th><th>s saved/nav</th></tr></thead>"
+        f"<tbody>{body}</tbody></table>"
+    )
@@ -0,0 +1,93 @@
+"""
+Structured run log.
+
+Every process (the controller and each xdist worker) writes its framework
+log records as JSON lines to reports/logs/<run_id>/<worker>.jsonl through
+the off-thread pipeline in utils.logger. Each record is stamped with the
+test that was running. At the end of the session the controller merges the
+part files into reports/logs/run-<run_id>.jsonl, ordered by timestamp. The
+result is one log for the whole run however many workers took part. The
+run id is the one shared by every plugin (see tests/plugins/run_id.py).
+
+Levels and sampling come from `log_level`, `log_levels` and
+`log_debug_sample` (see utils.logger.configure_logging).
+"""
+
+import heapq
+import json
+import os
+
+import pytest
+
+from utils.config import load_config
+from utils.logger import close_log_file, configure_logging, get_logger, open_log_file, set_log_context
+
+
+logger = get_logger(__name__)
+
+LOGS_DIR = os.path.join("reports", "logs")
+
+
+def _read_lines(path: str):
+    with open(path, encoding="utf8") as handle:
+        for line in handle:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            yield (entry.get("ts", 0), entry.get("worker", ""), entry.get("seq", 0)), line
+
+
+def merge_logs(parts, path: str) -> int:
+    """
+    Merge per-process JSON-lines logs into one file ordered by timestamp.
+
+    Each part is already in order, so this is a streaming k-way merge.
+
+    Returns:
+        Number of records written.
+    """
+    count = 0
+    with open(path, "w", encoding="utf8") as out:
+        for _, line in heapq.merge(*(_read_lines(part) for part in parts), key=lambda row: row[0]):
+            out.write(line if line.endswith("\n") else line + "\n")
+            count += 1
+    return count
+
+
+def pytest_configure(config):
+    configure_logging(load_config())
+    if config.option.collectonly:
+        return
+    worker = config.workerinput.get("workerid", "gw") if hasattr(config, "workerinput") else "main"
+    open_log_file(os.path.join(LOGS_DIR, config.run_id, f"{worker}.jsonl"), worker)
+
+
+def pytest_runtest_logstart(nodeid, location):
+    set_log_context(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    set_log_context(None)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Flush this process's log; the controller then merges every part."""
+    config = session.config
+    close_log_file()
+    if hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    parts_dir = os.path.join(LOGS_DIR, config.run_id)
+    if not os.path.isdir(parts_dir):
+        return
+    parts = [os.path.join(parts_dir, name) for name in sorted(os.listdir(parts_dir)) if name.endswith(".jsonl")]
+    run_path = os.path.join(LOGS_DIR, f"run-{config.run_id}.jsonl")
+    count = merge_logs(parts, run_path)
+    for part in parts:
+        os.remove(part)
+    os.rmdir(parts_dir)
+    if not count:
+        os.remove(run_path)
+        return
+    logger.info("Merged %d log record(s) from %d process(es) into %s", count, len(parts), run_path)
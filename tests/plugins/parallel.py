@@ -0,0 +1,158 @@
+"""
+Parallel execution profile for pytest-xdist.
+
+This plugin:
+- sizes `-n auto` to the available CPU cores, capped by free Selenium Grid
+  slots when running against a Grid
+- gives every worker its own report directory (reports/<worker_id>/)
+- orders scenarios longest-first using durations recorded by previous runs,
+  so long e2e outlines start early instead of becoming the tail on one worker
+
+Durations are kept in a small JSON timing database shared by all workers.
+"""
+
+import json
+import os
+from typing import Dict
+
+import pytest
+import requests
+
+from utils.config import load_config
+from utils.file_lock import atomic_write, locked
+from utils.logger import get_logger
+from utils.matrix import fetch_grid_status
+
+
+logger = get_logger(__name__)
+
+REPORTS_DIR = "reports"
+DEFAULT_DURATIONS_DB = os.path.join(REPORTS_DIR, "durations.json")
+
+# Weight of the newest run when smoothing recorded durations.
+SMOOTHING = 0.5
+
+
+def worker_id() -> str:
+    """Return the xdist worker id, or "main" when running without xdist."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def grid_free_slots(grid_url: str) -> int:
+    """
+    Return the number of session slots offered by a Selenium Grid, or 0 if unknown.
+
+    Args:
+        grid_url: Grid endpoint, with or without the legacy /wd/hub suffix.
+    """
+    try:
+        status = fetch_grid_status(grid_url)
+    except (requests.RequestException, ValueError):
+        return 0
+    nodes = status.get("nodes", [])
+    return sum(
+        1 for node in nodes for slot in node.get("slots", []) if not slot.get("session")
+    )
+
+
+def load_durations(path: str) -> Dict[str, float]:
+    """Return recorded durations keyed by node id, or an empty dict."""
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("parallel")
+    group.addoption(
+        "--durations-db",
+        default=os.getenv("DURATIONS_DB", DEFAULT_DURATIONS_DB),
+        help="JSON file holding per-scenario durations used for longest-first scheduling.",
+    )
+    group.addoption(
+        "--no-duration-order",
+        action="store_true",
+        help="Keep collection order instead of scheduling longest scenarios first.",
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Size `-n auto` to CPU cores, or to free Grid slots for remote runs."""
+    settings = load_config()
+    if settings.get("parallel_workers"):
+        return int(settings["parallel_workers"])
+
+    cores = os.cpu_count() or 1
+    run_mode = (settings.get("run_mode") or "local").lower()
+    if run_mode == "grid":
+        slots = grid_free_slots(settings.get("grid_url") or os.getenv("GRID_URL", ""))
+        if slots:
+            logger.info("Sizing xdist to %s free Grid slots", slots)
+            return slots
+    if run_mode == "browserstack":
+        return int(settings.get("browserstack_parallel_sessions", 1))
+    return cores
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Order items longest-first by their recorded durations."""
+    if config.getoption("--no-duration-order"):
+        return
+    durations = load_durations(config.getoption("--durations-db"))
+    if not durations:
+        return
+    # Unknown scenarios are assumed to be average so new tests are not starved.
+    default = sum(durations.values()) / len(durations)
+    # sort() is stable, so every xdist worker derives the same order.
+    items.sort(key=lambda item: durations.get(item.nodeid, default), reverse=True)
+
+
+@pytest.fixture(scope="session")
+def report_dir():
+    """
+    Return the report directory reserved for the current xdist worker.
+
+    Without xdist this is the top-level reports directory.
+    """
+    worker = worker_id()
+    path = REPORTS_DIR if worker == "main" else os.path.join(REPORTS_DIR, worker)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class DurationRecorder:
+    """Collect per-scenario durations and merge them into the timing database."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.durations: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome == "rerun":
+            # Failed attempts that were rerun (see tests.plugins.retries) would inflate the estimate.
+            return
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.durations or hasattr(session.config, "workerinput"):
+            return
+        with locked(self.path):
+            recorded = load_durations(self.path)
+            for nodeid, duration in self.durations.items():
+                previous = recorded.get(nodeid)
+                recorded[nodeid] = round(
+                    duration if previous is None
+                    else SMOOTHING * duration + (1 - SMOOTHING) * previous, 3)
+            atomic_write(self.path, json.dumps(recorded, indent=2, sort_keys=True))
+
+
+def pytest_configure(config):
+    # Only the controller (or a non-distributed run) writes the database; it
+    # receives every worker's reports.
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            DurationRecorder(config.getoption("--durations-db")), "duration-recorder")
@@ -0,0 +1,70 @@
+"""
+Streaming result report.
+
+The process that receives every test report (the controller under xdist)
+appends each finished test to reports/results/<run_id>/results.jsonl as it
+arrives, with artefacts referenced by path (see utils.result_store). Only
+one process writes, so parallel runs need no locking. Nothing accumulates
+in memory while the suite runs.
+
+At the end of the session the stream is split into pages of
+`report_page_size` results for the static viewer. Open
+reports/results/index.html, which forwards to the latest run. Only the
+newest `report_keep_runs` run directories are kept, along with the
+artefacts they reference. A rerun test has one row per attempt but counts
+once towards the total.
+"""
+
+import os
+
+import pytest
+
+from utils.config import load_config
+from utils.logger import get_logger
+from utils.result_store import PAGE_SIZE, RESULTS_DIR, ResultWriter, build_viewer, prune_artefacts, prune_runs
+
+
+logger = get_logger(__name__)
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    settings = load_config()
+    config.pluginmanager.register(
+        ResultStream(config.run_id, int(settings.get("report_page_size") or PAGE_SIZE),
+                     int(settings.get("report_keep_runs") or 0)), "result-stream")
+
+
+class ResultStream:
+    """Write every test result the moment its teardown is reported."""
+
+    def __init__(self, run_id: str, page_size: int, keep_runs: int = 0):
+        self.page_size = page_size
+        self.keep_runs = keep_runs
+        self.run_id = run_id
+        self.writer = ResultWriter(os.path.join(RESULTS_DIR, self.run_id))
+        self.viewer = None
+
+    def pytest_runtest_logreport(self, report):
+        self.writer.add(report)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        self.writer.close()
+        if not self.writer.written:
+            return
+        self.viewer = build_viewer(self.writer.run_dir, self.writer.summary(self.run_id), self.page_size)
+        logger.info("%d result(s) written to %s", self.writer.written, self.viewer)
+        if self.keep_runs <= 0:
+            return
+        pruned = prune_runs(RESULTS_DIR, self.keep_runs, self.run_id)
+        removed = prune_artefacts(RESULTS_DIR)
+        if pruned or removed:
+            logger.info("Deleted %d old result report(s) from %s and %d unreferenced artefact(s)",
+                        pruned, RESULTS_DIR, removed)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.viewer:
+            reruns = f", {self.writer.reruns} rerun(s)" if self.writer.reruns else ""
+            terminalreporter.write_line(f"Result report: {self.viewer} ({self.writer.tests} tests{reruns})")
@@ -0,0 +1,289 @@
+"""
+Scenario reruns, the quarantine lane and the retry cost report.
+
+A failed scenario is not rerun on the spot. It is queued and rerun once the
+whole session has been worked through, on a fresh driver (the driver pool is
+bypassed). A transient Grid or network hiccup therefore costs one scenario
+rerun instead of a rerun of the suite. Failed attempts are reported as
+"rerun", and only the last attempt counts towards the exit status and
+appears in the JUnit XML (with its `retry_attempt` property). Under xdist
+each worker reruns its own failures once the controller has no more work
+for it.
+
+Limits:
+- `retries`: reruns per scenario
+- `retry_budget`: scenarios a worker may rerun per session; more failures
+  than that points at an outage that reruns will not fix
+
+Every scenario outcome feeds the flakiness scores in reports/flakiness.json
+(see utils.retries). Scenarios whose score reaches `quarantine_threshold`
+over at least `quarantine_min_runs` runs get the `quarantine` marker. They
+run last, as a separate lane (select it with `-m quarantine`, or leave it
+out with `-m "not quarantine"`), and their failures are reported as xfail,
+so they do not break the build.
+
+The controller writes reports/retries.json with the reruns, the scenarios
+they recovered, the time they cost as a share of the run, and the
+element-level click retries.
+"""
+
+import json
+import os
+from typing import Dict
+
+import pytest
+from _pytest.junitxml import xml_key
+from _pytest.runner import runtestprotocol
+
+from utils.config import load_config
+from utils.file_lock import atomic_write, locked
+from utils.logger import get_logger
+from utils.retries import FAILED, FLAKY, PASSED, FlakinessStore, element_retries
+
+
+logger = get_logger(__name__)
+
+RERUN = "rerun"
+QUARANTINED = "quarantined"
+REPORT_FILE = os.path.join("reports", "retries.json")
+DEFAULT_FLAKINESS_DB = os.path.join("reports", "flakiness.json")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("retries")
+    group.addoption("--retries", type=int, default=None,
+                    help="Reruns per failed scenario at the end of the session (default: retries from config).")
+    group.addoption("--flakiness-db", default=os.getenv("FLAKINESS_DB", DEFAULT_FLAKINESS_DB),
+                    help="JSON file holding per-scenario flakiness scores.")
+
+
+def pytest_configure(config):
+    settings = load_config()
+    retries = config.getoption("--retries")
+    config.retry_count = max(int(settings.get("retries", 1) if retries is None else retries), 0)
+    config.retry_budget = int(settings.get("retry_budget", 10))
+    config.retry_queue = []
+    config.retry_queued = 0
+    config.retry_summary = {}
+    store = FlakinessStore.load(config.getoption("--flakiness-db"))
+    config.flakiness_store = store
+    config.quarantined = store.quarantined(
+        float(settings.get("quarantine_threshold", 0.3)), int(settings.get("quarantine_min_runs", 5)))
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(RetryLedger(config), "retry-ledger")
+
+
+def pytest_itemcollected(item):
+    # Marked while collecting, so `-m quarantine` can select the lane.
+    if item.nodeid in item.config.quarantined:
+        score = item.config.flakiness_store.records[item.nodeid].score
+        item.add_marker(pytest.mark.quarantine(score=score))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection_modifyitems(config, items):
+    yield
+    # After every other ordering (e.g. longest-first): the quarantine lane runs last.
+    items.sort(key=lambda item: item.get_closest_marker("quarantine") is not None)
+
+
+def pytest_report_teststatus(report):
+    if report.outcome == RERUN:
+        return RERUN, "R", ("RERUN", {"yellow": True})
+    return None
+
+
+def _failed(report) -> bool:
+    return report.failed and report.when in ("setup", "call")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Run the scenario once and decide what its failure means.
+
+    A failure is logged as "rerun" and the item queued when reruns and budget
+    remain. Otherwise it is final, and for a quarantined scenario it is
+    reported as xfail.
+    """
+    config = item.config
+    attempt = getattr(item, "retry_attempt", 0)
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    reports = runtestprotocol(item, nextitem=nextitem, log=False)
+    failed = any(_failed(report) for report in reports)
+    retry = failed and attempt < config.retry_count and (attempt or config.retry_queued < config.retry_budget)
+    marker = item.get_closest_marker("quarantine")
+    for report in reports:
+        report.user_properties.append(("retry_attempt", attempt))
+        if retry and _failed(report):
+            report.outcome = RERUN
+        elif marker and _failed(report):
+            report.outcome = "skipped"
+            report.wasxfail = f"{QUARANTINED} (flakiness {marker.kwargs.get('score', 0):.2f})"
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    if retry:
+        config.retry_queued += not attempt
+        item.retry_attempt = attempt + 1
+        config.retry_queue.append(item)
+    elif failed and attempt < config.retry_count:
+        logger.warning("Retry budget of %d scenario(s) used up; not rerunning %s", config.retry_budget, item.nodeid)
+    return True
+
+
+def _point_worker_at(session, item):
+    """
+    Tell xdist's worker which item the next reports belong to.
+
+    The worker checks every report against the item it last ran, and reruns
+    happen outside its loop.
+    """
+    for plugin in session.config.pluginmanager.get_plugins():
+        if hasattr(plugin, "item_index") and hasattr(plugin, "sendevent"):
+            plugin.item_index = session.items.index(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtestloop(session):
+    outcome = yield
+    if outcome.excinfo is not None:
+        return
+    config = session.config
+    # Each pass reruns the failures of the previous one; nextitem chains the
+    # queue so session fixtures are set up once per pass.
+    while config.retry_queue and not (session.shouldfail or session.shouldstop):
+        queue, config.retry_queue = config.retry_queue, []
+        logger.info("Rerunning %d failed scenario(s) on fresh drivers", len(queue))
+        for index, item in enumerate(queue):
+            nextitem = queue[index + 1] if index + 1 < len(queue) else None
+            if hasattr(config, "workerinput"):
+                _point_worker_at(session, item)
+            config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+            if session.shouldfail or session.shouldstop:
+                break
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect a finished worker's element-level retry counts."""
+    stats = getattr(node, "workeroutput", {}).get("element_retries")
+    if stats:
+        element_retries.merge(stats)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["element_retries"] = element_retries.to_dict()
+
+
+class RetryLedger:
+    """Follow every scenario's attempts on the process that receives all reports."""
+
+    def __init__(self, config):
+        self.config = config
+        self.scenarios: Dict[str, dict] = {}
+        self.test_seconds = 0.0
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logreport(self, report):
+        self.test_seconds += report.duration
+        entry = self.scenarios.setdefault(
+            report.nodeid, {"attempts": 0, "rerun_seconds": 0.0, "reruns": 0, "rerun_attempt": -1, "outcome": None})
+        attempt = dict(report.user_properties).get("retry_attempt", 0)
+        entry["attempts"] = max(entry["attempts"], attempt + 1)
+        if attempt:
+            entry["rerun_seconds"] += report.duration
+        if report.outcome == RERUN:
+            entry["reruns"] += 1
+            entry["rerun_attempt"] = attempt
+        elif report.when == "call" or (report.when == "setup" and not report.passed):
+            wasxfail = getattr(report, "wasxfail", "")
+            entry["outcome"] = FAILED if report.failed or wasxfail.startswith(QUARANTINED) else report.outcome
+        if report.when == "teardown" and entry["rerun_attempt"] == attempt:
+            self._drop_junit_testcase(report)
+
+    def _drop_junit_testcase(self, report):
+        """
+        Keep a rerun attempt out of the JUnit XML.
+
+        JUnit has no outcome for "rerun", so junitxml would write the attempt
+        as a testcase without a failure, i.e. a pass. Runs before junitxml
+        closes the attempt's testcase on its teardown report; the closed
+        testcase is then no longer in the list junitxml writes.
+        """
+        xml = self.config.stash.get(xml_key, None)
+        if xml is None:
+            return
+        reporter = xml.node_reporter(report)
+        xml.node_reporters_ordered = [item for item in xml.node_reporters_ordered if item is not reporter]
+
+    def _classify(self, entry: dict):
+        if entry["outcome"] == FAILED:
+            return FAILED
+        if entry["outcome"] == PASSED:
+            return FLAKY if entry["reruns"] else PASSED
+        return None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        config = self.config
+        if not self.scenarios:
+            return
+        path = config.getoption("--flakiness-db")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with locked(path):
+            store = FlakinessStore.load(path)
+            for nodeid, entry in self.scenarios.items():
+                outcome = self._classify(entry)
+                if outcome:
+                    store.record(nodeid, outcome)
+            atomic_write(path, store.to_json())
+
+        retried = {nodeid: entry for nodeid, entry in self.scenarios.items() if entry["reruns"]}
+        rerun_seconds = sum(entry["rerun_seconds"] for entry in retried.values())
+        summary = {
+            "reruns": sum(entry["reruns"] for entry in retried.values()),
+            "recovered": sorted(n for n, e in retried.items() if e["outcome"] == PASSED),
+            "still_failing": sorted(n for n, e in retried.items() if e["outcome"] != PASSED),
+            "rerun_seconds": round(rerun_seconds, 3),
+            "test_seconds": round(self.test_seconds, 3),
+            "rerun_share": round(rerun_seconds / self.test_seconds, 4) if self.test_seconds else 0.0,
+            "element_retries": element_retries.retries,
+            "element_retry_seconds": round(element_retries.seconds, 3),
+            "element_retries_by_locator": element_retries.by_locator,
+            "quarantined": {nodeid: store.records[nodeid].score for nodeid in sorted(config.quarantined)
+                            if nodeid in store.records},
+            "flakiest": [{"nodeid": nodeid, "score": record.score, "runs": record.runs}
+                         for nodeid, record in store.top()],
+        }
+        os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+        atomic_write(REPORT_FILE, json.dumps(summary, indent=2, sort_keys=True))
+        config.retry_summary = summary
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = self.config.retry_summary
+        if not summary or not (summary["reruns"] or summary["element_retries"] or summary["quarantined"]):
+            return
+        terminalreporter.write_line(
+            f"Retries: {summary['reruns']} rerun(s), {len(summary['recovered'])} recovered, "
+            f"{summary['rerun_seconds']:.1f}s ({summary['rerun_share']:.1%} of test time); "
+            f"{summary['element_retries']} click retries ({summary['element_retry_seconds']:.1f}s); "
+            f"{len(summary['quarantined'])} scenario(s) quarantined"
+        )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_summary(self, prefix, summary, postfix, session):
+        """Show what retries cost and which scenarios they recovered."""
+        data = self.config.retry_summary
+        if not data or not (data["reruns"] or data["element_retries"] or data["quarantined"]):
+            return
+        recovered = "".join(f"<li>{nodeid}</li>" for nodeid in data["recovered"])
+        postfix.append(
+            "<h2>Retries</h2>"
+            f"<p>{data['reruns']} scenario rerun(s) took {data['rerun_seconds']:.1f}s "
+            f"({data['rerun_share']:.1%} of test time) and recovered {len(data['recovered'])}. "
+            f"{data['element_retries']} click retries took {data['element_retry_seconds']:.1f}s. "
+            f"{len(data['quarantined'])} scenario(s) are quarantined.</p>"
+            + (f"<ul>{recovered}</ul>" if recovered else "")
+        )
@@ -0,0 +1,34 @@
+"""
+Shared run id.
+
+One id names everything a test run writes: the merged log
+(reports/logs/run-<run_id>.jsonl), the timing file
+(reports/timings/run-<run_id>.json), the result report
+(reports/results/<run_id>/) and the run-history entry. The controller
+creates it when pytest is configured and hands it to every xdist worker,
+so all processes and plugins agree on it. Plugins read `config.run_id`.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+
+def new_run_id() -> str:
+    """Return a sortable, unique run id, e.g. 20240501-142233-1a2b3c."""
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        config.run_id = config.workerinput.get("run_id")
+    else:
+        config.run_id = new_run_id()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the controller's run id with every xdist worker."""
+    node.workerinput["run_id"] = node.config.run_id
@@ -0,0 +1,177 @@
+"""
+Step-level timing report.
+
+This plugin records the wall time of every pytest-bdd step, every BasePage
+action and every WebDriver command (see utils.timing) and writes:
+- reports/timings/run-<run_id>.json: all samples of one run, per test
+- reports/timings/history.json: recent step durations across runs
+- a "Slowest steps" table (p50/p95/max per step text) in the HTML report
+
+The merged run is kept on `config.timing_run` for the run-history plugin.
+
+Under xdist each worker writes a part file and the controller merges them,
+so one run always produces a single timing file.
+"""
+
+import html
+import json
+import os
+import time
+from typing import Dict, List
+
+import pytest
+
+from utils.config import load_config
+from utils.file_lock import atomic_write, locked
+from utils.logger import get_logger
+from utils.timing import KINDS, recorder, summarise
+
+
+logger = get_logger(__name__)
+
+TIMINGS_DIR = os.path.join("reports", "timings")
+HISTORY_FILE = os.path.join(TIMINGS_DIR, "history.json")
+
+# Samples kept per step text in the cross-run history.
+HISTORY_SAMPLES = 200
+# Rows shown in the HTML "Slowest steps" table.
+SLOWEST_STEPS = 10
+
+_step_starts: Dict[int, float] = {}
+
+
+def step_text(step) -> str:
+    """Return the text a step is aggregated under, e.g. 'When I add "iPhone 12" to the cart'."""
+    return f"{step.type.capitalize()} {step.name}"
+
+
+def load_json(path: str) -> dict:
+    """Return the JSON object stored at path, or an empty dict."""
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def merge_snapshots(parts: List[dict]) -> dict:
+    """Combine per-worker recorder snapshots into one run."""
+    merged = {"samples": {kind: {} for kind in KINDS}, "tests": {}}
+    for part in parts:
+        for kind, names in part.get("samples", {}).items():
+            for name, values in names.items():
+                merged["samples"].setdefault(kind, {}).setdefault(name, []).extend(values)
+        merged["tests"].update(part.get("tests", {}))
+    return merged
+
+
+def step_summary(samples: Dict[str, List[float]]) -> List[dict]:
+    """Return p50/p95/max per step text, slowest p95 first."""
+    rows = [dict(step=name, **summarise(values)) for name, values in samples.items() if values]
+    return sorted(rows, key=lambda row: row["p95"], reverse=True)
+
+
+def update_history(path: str, steps: Dict[str, List[float]]) -> Dict[str, List[float]]:
+    """Append this run's step samples to the cross-run history and return it."""
+    with locked(path):
+        history = load_json(path)
+        for name, values in steps.items():
+            history[name] = (history.get(name, []) + [round(v, 4) for v in values])[-HISTORY_SAMPLES:]
+        atomic_write(path, json.dumps(history, indent=2, sort_keys=True))
+    return history
+
+
+def pytest_configure(config):
+    settings = load_config()
+    recorder.enabled = bool(settings.get("timing", True))
+    config.timing_summary = []
+    config.timing_run = None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    recorder.start_test(item.nodeid)
+
+
+def pytest_runtest_logreport(report):
+    test = recorder.tests.get(report.nodeid)
+    if test is not None:
+        test["duration"] += report.duration
+
+
+def pytest_bdd_before_step(request, feature, scenario, step, step_func):
+    _step_starts[id(step)] = time.perf_counter()
+
+
+def _finish_step(step):
+    start = _step_starts.pop(id(step), None)
+    if start is not None:
+        recorder.record("step", step_text(step), time.perf_counter() - start)
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    _finish_step(step)
+
+
+def pytest_bdd_step_error(request, feature, scenario, step, step_func, step_func_args, exception):
+    _finish_step(step)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Write this process's samples; the controller also merges and summarises."""
+    config = session.config
+    if not recorder.enabled:
+        return
+    run_id = config.run_id
+    parts_dir = os.path.join(TIMINGS_DIR, run_id)
+
+    if hasattr(config, "workerinput"):
+        if not recorder.tests:
+            return
+        os.makedirs(parts_dir, exist_ok=True)
+        worker = config.workerinput.get("workerid", "gw")
+        atomic_write(os.path.join(parts_dir, f"{worker}.json"), json.dumps(recorder.snapshot()))
+        return
+
+    parts = [recorder.snapshot()] if recorder.tests else []
+    if os.path.isdir(parts_dir):
+        for name in sorted(os.listdir(parts_dir)):
+            parts.append(load_json(os.path.join(parts_dir, name)))
+            os.remove(os.path.join(parts_dir, name))
+        os.rmdir(parts_dir)
+    run = merge_snapshots(parts)
+    if not run["tests"]:
+        return
+
+    os.makedirs(TIMINGS_DIR, exist_ok=True)
+    run.update(run_id=run_id, summary={
+        kind: {name: summarise(values) for name, values in run["samples"].get(kind, {}).items()}
+        for kind in KINDS
+    })
+    run_path = os.path.join(TIMINGS_DIR, f"run-{run_id}.json")
+    atomic_write(run_path, json.dumps(run, indent=2))
+    config.timing_run = run
+
+    history = update_history(HISTORY_FILE, run["samples"].get("step", {}))
+    config.timing_summary = step_summary(history)
+    logger.info("Step timings written to %s", run_path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Add a 'Slowest steps' table built from the cross-run history."""
+    rows = session.config.timing_summary[:SLOWEST_STEPS]
+    if not rows:
+        return
+    body = "".join(
+        f"<tr><td>{html.escape(row['step'])}</td><td>{row['count']}</td><td>{row['p50']:.2f}</td>"
+        f"<td>{row['p95']:.2f}</td><td>{row['max']:.2f}</td></tr>"
+        for row in rows
+    )
+    postfix.append(
+        "<h2>Slowest steps</h2>"
+        "<table><thead><tr><th>Step</th><th>Samples</th><th>p50 (s)</th>"
+        "<th>p95 (s)</th><th>Max (s)</th></tr></thead>"
+        f"<tbody>{body}</tbody></table>"
+    )
@@ -1,20 +1,78 @@
 """Step definitions for BrowserStack Demo API scenarios."""
 
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Dict, List
 
 import pytest
 from pytest_bdd import given, when, then, parsers
 
-from api.clients.store_client import StoreClient
+from api.clients.async_store_client import AsyncStoreClient
+from api.clients.store_client import StoreClient, extract_products
 from utils.logger import get_logger
+from utils.test_data import ProductCatalog, format_price, to_cents
 
 logger = get_logger(__name__)
 
 
+class SlowApiStub:
+    """
+    Local /products stub that answers after a fixed delay.
+
+    It records the peak number of requests it served at once, so fan-out
+    steps can check the client's concurrency limit without a live API.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.served = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                with stub.lock:
+                    stub.in_flight += 1
+                    stub.peak = max(stub.peak, stub.in_flight)
+                time.sleep(stub.delay)
+                with stub.lock:
+                    stub.in_flight -= 1
+                    stub.served += 1
+                body = json.dumps({"products": []}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
 @pytest.fixture
 def api_context() -> Dict[str, object]:
-    """Mutable context shared across API steps."""
-    return {}
+    """Mutable context shared across API steps; stops a local API stub afterwards."""
+    context = {}
+    yield context
+    if context.get("stub"):
+        context["stub"].stop()
 
 
 @given("the BrowserStack Demo API is reachable")
@@ -28,13 +86,10 @@ def api_availability(config, api_context):
 
 @when("I request the product catalog")
 def request_product_catalog(api_context, store_client: StoreClient):
-    response = store_client.list_products()
+    # A health check: never answer it from the response cache.
+    response = store_client.list_products(use_cache=False)
     api_context["response"] = response
-    payload = response.json()
-    if isinstance(payload, dict) and "products" in payload:
-        products = payload["products"]
-    else:
-        products = payload
+    products = extract_products(response.json())
     api_context["products"] = products
     logger.info(
         "Retrieved %s products from the catalog API",
@@ -50,6 +105,35 @@ def authenticate_user(api_context, store_client: StoreClient, username: str, pas
     logger.info("Attempted API login for user %s with status %s", username, response.status_code)
 
 
+@when("I authenticate the following personas via the API concurrently")
+def authenticate_personas_concurrently(api_context, async_store_client: AsyncStoreClient, datatable):
+    header, *rows = datatable
+    credentials = [dict(zip(header, row)) for row in rows]
+    start = time.perf_counter()
+    results = asyncio.run(async_store_client.sign_in_all(
+        (entry["username"], entry["password"]) for entry in credentials))
+    elapsed = time.perf_counter() - start
+    api_context["persona_results"] = dict(zip((entry["username"] for entry in credentials), results))
+    logger.info(
+        "Authenticated %s personas in %.3fs (slowest request %.3fs)",
+        len(results),
+        elapsed,
+        max((result.elapsed for result in results), default=0.0),
+    )
+
+
+@then(parsers.parse("every persona sign-in should return status {status:d}"))
+def assert_persona_statuses(api_context, status: int):
+    results = api_context.get("persona_results")
+    assert results, "No persona sign-in results captured in context"
+    failures = {
+        username: result.response.status_code
+        for username, result in results.items()
+        if result.response.status_code != status
+    }
+    assert not failures, f"Expected {status} for every persona, got {failures}"
+
+
 @then(parsers.parse("the API response status should be {status:d}"))
 def assert_status(api_context, status: int):
     response = api_context.get("response")
@@ -80,3 +164,64 @@ def assert_product_fields(api_context, fields: str):
         fields,
         len(products),
     )
+
+
+@given("a generated catalog example")
+def generated_catalog_example(api_context, request, catalog_examples):
+    """Pick the catalog row for this parametrised test (see test_api_steps.py)."""
+    index = request.getfixturevalue("catalog_example")
+    api_context["example"] = catalog_examples[index]
+    logger.info("Catalog example %s: %s", index, api_context["example"])
+
+
+@then("the example product should resolve to the same entry by title and by id")
+def assert_example_indexed(api_context, catalog: ProductCatalog):
+    example = api_context["example"]
+    assert catalog.by_title(example.title) is catalog.by_id(example.id), \
+        f"Title and id indexes disagree for {example}"
+
+
+@then("the example price should match the catalog API to the cent")
+def assert_example_price(api_context, store_client: StoreClient):
+    example = api_context["example"]
+    raw = next((item for item in store_client.products() if int(item["id"]) == example.id), None)
+    assert raw is not None, f"Product id {example.id} is missing from the catalog API"
+    assert example.price_cents > 0, f"Non-positive price for {example}"
+    assert to_cents(raw["price"]) == example.price_cents, \
+        f"Indexed price {format_price(example.price_cents)} differs from API price {raw['price']!r}"
+
+
+@given(parsers.parse("a local API stub that answers after {delay:f} seconds"))
+def local_api_stub(api_context, delay: float):
+    api_context["stub"] = SlowApiStub(delay)
+
+
+@when(parsers.parse("the catalog is fetched {times:d} times with a concurrency limit of {limit:d}"))
+def fan_out_against_stub(api_context, times: int, limit: int):
+    client = AsyncStoreClient(api_context["stub"].url, concurrency=limit, timeout=10, retries=0)
+    try:
+        start = time.perf_counter()
+        api_context["fan_out_results"] = asyncio.run(client.fetch_catalog(times))
+        api_context["fan_out_elapsed"] = time.perf_counter() - start
+    finally:
+        client.close()
+    logger.info("Fetched the stub catalog %s times in %.3fs", times, api_context["fan_out_elapsed"])
+
+
+@then(parsers.parse("the stub should never have served more than {limit:d} requests at once"))
+def assert_stub_peak(api_context, limit: int):
+    stub = api_context["stub"]
+    assert stub.served == len(api_context["fan_out_results"]), \
+        f"Stub served {stub.served} requests for {len(api_context['fan_out_results'])} calls"
+    assert stub.peak <= limit, f"Stub saw {stub.peak} requests in flight, above the limit of {limit}"
+
+
+@then("each fan-out request should be timed without its wait for a free slot")
+def assert_per_request_timing(api_context):
+    results = api_context["fan_out_results"]
+    delay = api_context["stub"].delay
+    slowest = max(result.elapsed for result in results)
+    # Queued requests waited several delays for a slot; their own attempt took about one.
+    assert slowest < 2 * delay, \
+        f"Slowest request reported {slowest:.3f}s for a {delay}s stub; queueing time leaked into it"
+    assert api_context["fan_out_elapsed"] >= 2 * delay, "Requests were not queued behind the limit"
@@ -1,32 +1,36 @@
 import os
-from pathlib import Path
 
-from axe_selenium_python import Axe
 from pytest_bdd import given, when, then, parsers
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
-from pages.confirmation_page import ConfirmationPage
 from pages.login_page import LoginPage
-from pages.product_page import ProductPage
+from utils.accessibility import report_path
+from utils.test_data import format_price
 
 
 @given("I am on the bstackdemo homepage")
-def open_home(driver, config):
+def open_home(journey, config):
     """Navigate to the application home page."""
-    LoginPage(driver).open_home(config["base_url"])
+    journey.open_home(config["base_url"])
+
+
+@given(parsers.parse('I am logged in as "{username}"'))
+def logged_in_as(journey, config, username):
+    """Start the scenario on the homepage with the persona already logged in."""
+    journey.log_in_as(username, config["persona_password"])
 
 
 @given("I click on Sign In link")
 @when("I click on Sign In link")
-def click_sign_in(driver):
+def click_sign_in(journey):
     """Open the login modal from the home page header."""
-    LoginPage(driver).open_login_panel()
+    journey.open_login_panel()
 
 
 @when(parsers.parse('I log in with valid username "{username}" and password "{password}"'))
-def login_with_credentials(driver, username, password):
+def login_with_credentials(journey, username, password):
     """Log in using the provided username and password."""
-    LoginPage(driver).login_with_valid_credentials(username, password)
+    journey.log_in(username, password)
 
 
 @when("I try log in without entering credentials")
@@ -42,9 +46,9 @@ def verify_login_ui_controls(driver):
 
 
 @when(parsers.parse('I add "{product_name}" to the cart'))
-def add_product_to_cart(driver, product_name):
+def add_product_to_cart(journey, product_name):
     """Add a product to the cart from the product page."""
-    ProductPage(driver).add_product_to_cart(product_name)
+    journey.add_to_cart(product_name)
 
 
 @then(parsers.parse('I see the side cart opens automatically with added "{product_name}" along with its "{product_price}"'))
@@ -53,29 +57,35 @@ def validate_side_cart(driver, product_name, product_price):
     page = CartPage(driver)
     page.validate_side_cart(product_name, product_price)
     page.logger.info(
-        f"Side cart opened with {product_name} and {product_price}")
+        "Side cart opened with %s and %s", product_name, product_price)
+
+
+@then(parsers.parse('I see the side cart opens automatically with added "{product_name}" at its catalog price'))
+def validate_side_cart_catalog_price(journey, catalog, product_name):
+    """Check the side cart item against the price published in the product catalog."""
+    product = catalog.by_title(product_name)
+    journey.validate_cart_line(product_name, product)
+    journey.logger.info("Side cart opened with %s at catalog price %s", product_name, format_price(product.price_cents))
 
 
 @then("I should see the subtotal displayed correctly")
-def validate_subtotal(driver):
+def validate_subtotal(journey):
     """Verify the subtotal displayed in the side cart."""
-    CartPage(driver).validate_subtotal()
+    journey.validate_subtotal()
 
 
 @when("I proceed to the checkout page")
-def proceed_to_checkout(driver):
+def proceed_to_checkout(journey):
     """Navigate from the cart to the checkout page."""
-    cart_page = CartPage(driver)
-    cart_page.proceed_to_checkout()
-    cart_page.logger.info("Proceeding to checkout page")
+    journey.proceed_to_checkout()
+    journey.logger.info("Proceeding to checkout page")
 
 
 @then("I should be on the checkout page")
-def verify_checkout_page(driver):
+def verify_checkout_page(journey):
     """Confirm that the checkout page is displayed."""
-    checkout_page = CheckoutPage(driver)
-    assert checkout_page.verify_checkout_page(), "Checkout page was not loaded"
-    checkout_page.logger.info("Verified checkout page")
+    assert journey.verify_checkout_page(), "Checkout page was not loaded"
+    journey.logger.info("Verified checkout page")
 
 
 @then(parsers.parse('I should see "{product_name}" and its "{product_price}" in the order summary'))
@@ -86,16 +96,26 @@ def verify_product_in_order_summary(driver, product_name, product_price):
         product_name, product_price
     ), f"{product_name} was not found in the order summary"
     checkout_page.logger.info(
-        f"Verified the product '{product_name}' with its '{product_price}' was found in the order summary"
+        "Verified the product '%s' with its '%s' was found in the order summary", product_name, product_price
     )
 
 
+@then(parsers.parse('I should see "{product_name}" at its catalog price in the order summary'))
+def verify_product_in_order_summary_catalog_price(journey, catalog, product_name):
+    """Verify that a product is listed in the order summary at its catalog price."""
+    product = catalog.by_title(product_name)
+    assert journey.verify_order_line(
+        product_name, product
+    ), f"{product_name} was not found in the order summary"
+    journey.logger.info(
+        "Verified '%s' at catalog price %s in the order summary", product_name, format_price(product.price_cents))
+
+
 @then("I should see total updated correctly in the order summary")
-def order_summary_total_check(driver):
+def order_summary_total_check(journey):
     """Validate the grand total in the order summary."""
-    checkout_page = CheckoutPage(driver)
-    assert checkout_page.check_order_summary_total(), "Order summary total is not correct"
-    checkout_page.logger.info("Order summary total is correct")
+    assert journey.check_order_total(), "Order summary total is not correct"
+    journey.logger.info("Order summary total is correct")
 
 
 @when(
@@ -103,33 +123,31 @@ def order_summary_total_check(driver):
         'I enter checkout details "{first_name}", "{last_name}", "{address}", "{state_or_province}", "{postcode}"'
     )
 )
-def enter_checkout_details(driver, first_name, last_name, address, state_or_province, postcode):
+def enter_checkout_details(journey, first_name, last_name, address, state_or_province, postcode):
     """Fill the checkout form using data from the scenario outline."""
-    checkout_page = CheckoutPage(driver)
-    checkout_page.fill_checkout_form(
+    journey.fill_checkout_form(
         first_name=first_name,
         last_name=last_name,
         address=address,
         state_or_province=state_or_province,
         postcode=postcode,
     )
-    checkout_page.logger.info("Entered checkout details")
+    journey.logger.info("Entered checkout details")
 
 
 @when("I submit the order")
-def submit_the_order(driver):
+def submit_the_order(journey):
     """Place the order from the checkout page."""
-    CheckoutPage(driver).place_order()
+    journey.place_order()
 
 
 @then("I should see an order confirmation message")
-def verify_order_confirmation(driver):
+def verify_order_confirmation(journey):
     """Validate the confirmation banner after placing an order."""
-    confirmation_page = ConfirmationPage(driver)
     expected_confirmation_message = "Your Order has been successfully placed."
-    actual_confirmation_message = confirmation_page.get_confirmation_message()
+    actual_confirmation_message = journey.get_confirmation_message()
     assert actual_confirmation_message == expected_confirmation_message, "Order confirmation message not found"
-    confirmation_page.logger.info("Verified order confirmation message")
+    journey.logger.info("Verified order confirmation message")
 
 
 @when("I navigate to the side cart adding any items")
@@ -148,23 +166,26 @@ def verify_continue_shopping_button(driver):
     cart_page.logger.info("Verified continue shopping button")
 
 
-@then("the page should pass accessibility checks")
-def check_accessibility_compliance(driver, request):
-    """Run axe-core accessibility scan to ensure the current page has no violations."""
-    axe = Axe(driver)
-    axe.inject()
-    results = axe.run()
-    violations = results.get("violations", [])
-
+def assert_accessible(accessibility, driver, request, scope=None):
+    """Scan the page (or one region of it) and fail on any axe-core violation."""
+    violations = accessibility.scan(driver, scope=scope, test=request.node.nodeid)
     if violations:
-        output_dir = Path("reports/accessibility")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = output_dir / f"{request.node.name}.json"
-        axe.write_results(results, str(report_path))
-        ids = ", ".join(v.get("id", "unknown") for v in violations)
+        ids = ", ".join(sorted({v.get("id", "unknown") for v in violations}))
         raise AssertionError(
-            f"Accessibility violations detected: {ids}. See {report_path} for details.")
-    
+            f"Accessibility violations detected: {ids}. See {report_path()} for details.")
+
+
+@then("the page should pass accessibility checks")
+def check_accessibility_compliance(driver, request, accessibility):
+    """Run an axe-core scan to ensure the current page has no violations."""
+    assert_accessible(accessibility, driver, request)
+
+
+@then("the login form should pass accessibility checks")
+def check_login_form_accessibility(driver, request, accessibility):
+    """Run an axe-core scan limited to the login form."""
+    assert_accessible(accessibility, driver, request, scope=LoginPage.LOGIN_FORM[1])
+
 
 @then("I should logout successfully")
 def logout(driver):
@@ -0,0 +1,119 @@
+"""Step definitions for the impact selection scenarios, run against a scratch git copy of the repository."""
+
+import ast
+import os
+import shutil
+import subprocess
+from typing import Dict
+
+import pytest
+from pytest_bdd import given, when, then, parsers
+from pytest_bdd.parser import FeatureParser
+
+from utils.impact import (
+    INDEX_VERSION,
+    changed_since,
+    indexed_symbols,
+    select,
+    selection_index,
+    static_dependencies,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FEATURES_DIR = os.path.join("tests", "features")
+COPIED = ("pages", os.path.join("tests", "step_definitions"), FEATURES_DIR)
+
+
+def _git(root: str, *args: str):
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def impact_context() -> Dict[str, object]:
+    """Mutable context shared across impact steps."""
+    return {}
+
+
+@given("a scratch git copy of the page objects, step definitions and features")
+def scratch_repository(impact_context, tmp_path):
+    root = str(tmp_path / "repo")
+    for directory in COPIED:
+        shutil.copytree(os.path.join(ROOT, directory), os.path.join(root, directory),
+                        ignore=shutil.ignore_patterns("__pycache__"))
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "-c", "user.name=impact", "-c", "user.email=impact@localhost", "commit", "-q", "-m", "base")
+
+    scenarios, files = {}, {}
+    for name in sorted(os.listdir(os.path.join(root, FEATURES_DIR))):
+        feature = FeatureParser(os.path.join(root, FEATURES_DIR), name).parse()
+        for title, scenario in feature.scenarios.items():
+            key = f"{FEATURES_DIR.replace(os.sep, '/')}/{name}::{title}"
+            scenarios[key] = [(step.type, step.name) for step in scenario.steps]
+            files[key] = {key.split("::", 1)[0]}
+    static = static_dependencies(root, scenarios)
+    impact_context.update(root=root, files=files, static=static,
+                          stored={"version": INDEX_VERSION, "static": static, "traced": {}})
+
+
+@given("no dependency index has been stored yet")
+def no_stored_index(impact_context):
+    impact_context["stored"] = {}
+
+
+@when(parsers.parse('a line is added inside "{qualname}" in "{path}"'))
+def add_line(impact_context, qualname, path):
+    absolute = os.path.join(impact_context["root"], path)
+    with open(absolute, encoding="utf8") as handle:
+        source = handle.read()
+    node = _find(ast.parse(source), qualname.split("."))
+    lines = source.splitlines(keepends=True)
+    lines.insert(node.end_lineno, " " * node.body[0].col_offset + "_impact_check = None\n")
+    with open(absolute, "w", encoding="utf8") as handle:
+        handle.writelines(lines)
+
+    changes = changed_since(impact_context["root"], "HEAD")
+    index = selection_index(impact_context["stored"], impact_context["static"])
+    impact_context.update(changes=changes, selection=select(
+        index, changes, impact_context["files"], indexed_symbols(impact_context["root"])))
+    logger.info("Impact selection after editing %s: %s", qualname, impact_context["selection"].reason)
+
+
+def _find(tree: ast.AST, names):
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name == names[0]:
+            return node if len(names) == 1 else _find(node, names[1:])
+    raise LookupError(f"{'.'.join(names)} not found")
+
+
+@then(parsers.parse('the change should map to the symbol "{symbol}"'))
+def change_maps_to_symbol(impact_context, symbol):
+    changes = impact_context["changes"]
+    assert changes.symbols == {symbol}, f"Expected only {symbol} to change, got {sorted(changes.symbols)}"
+
+
+def _selected(impact_context, scenario):
+    selection = impact_context["selection"]
+    assert not selection.full_run, f"Expected a bounded selection, got a full run ({selection.reason})"
+    return f"{FEATURES_DIR.replace(os.sep, '/')}/{scenario}" in selection.selected
+
+
+@then(parsers.parse('impact selection should pick "{scenario}"'))
+def scenario_selected(impact_context, scenario):
+    assert _selected(impact_context, scenario), \
+        f"'{scenario}' was not selected ({impact_context['selection'].reason})"
+
+
+@then(parsers.parse('impact selection should not pick "{scenario}"'))
+def scenario_not_selected(impact_context, scenario):
+    assert not _selected(impact_context, scenario), f"'{scenario}' was selected but cannot be affected"
+
+
+@then(parsers.parse('impact selection should be a full run because "{reason}"'))
+def full_run(impact_context, reason):
+    selection = impact_context["selection"]
+    assert selection.full_run, f"Expected a full run, got: {selection.reason}"
+    assert reason in selection.reason, f"Expected the reason to mention '{reason}', got '{selection.reason}'"
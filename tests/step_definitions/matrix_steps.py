@@ -0,0 +1,84 @@
+"""Step definitions for the capability matrix scenarios, run against the Grid stand-in."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+import pytest
+from pytest_bdd import given, when, then, parsers
+
+from mock_store.grid import GridStandIn
+from utils.driver_factory import get_driver
+from utils.logger import get_logger
+from utils.matrix import SessionSlots, load_environments
+from utils.matrix_runner import plan_limits
+
+logger = get_logger(__name__)
+
+# Seconds each stand-in session is held open, long enough for callers to queue.
+SESSION_HOLD_SECONDS = 0.1
+
+
+@pytest.fixture
+def matrix_context(tmp_path) -> Dict[str, object]:
+    """Mutable context shared across matrix steps; stops the Grid stand-in afterwards."""
+    context = {"slots_dir": str(tmp_path / "slots")}
+    yield context
+    if context.get("grid"):
+        context["grid"].stop()
+
+
+@given(parsers.parse('a Grid stand-in with {nodes:d} nodes offering "{browsers}" with {sessions:d} sessions each'))
+def grid_stand_in(matrix_context, nodes, browsers, sessions):
+    browser_names = [name.strip() for name in browsers.split(",")]
+    matrix_context["grid"] = GridStandIn(nodes=nodes, max_sessions=sessions, browsers=browser_names).start()
+
+
+@when(parsers.parse("session slots are planned with a budget of {budget:d} and at most {cap:d} session per node"))
+def plan_session_slots(matrix_context, config, budget, cap):
+    grid_config = {"run_mode": "grid", "grid_url": matrix_context["grid"].url}
+    limits = plan_limits(grid_config, load_environments(config), budget, cap)
+    SessionSlots.write_limits(matrix_context["slots_dir"], limits)
+    matrix_context.update(config=grid_config, limits=limits, environments=load_environments(config))
+    logger.info("Planned session limits: %s", limits)
+
+
+@then(parsers.parse('the planned limits should be "{expected}"'))
+def planned_limits(matrix_context, expected):
+    limits = {key.strip(): int(value) for key, value in (pair.split("=") for pair in expected.split(","))}
+    assert matrix_context["limits"] == limits, f"Expected limits {limits} but got {matrix_context['limits']}"
+
+
+@when(parsers.parse("{count:d} sessions per matrix environment are opened concurrently"))
+def open_matrix_sessions(matrix_context, count):
+    def run_session(environment):
+        driver = get_driver(dict(matrix_context["config"], matrix_environment=environment,
+                                 matrix_slots_dir=matrix_context["slots_dir"]))
+        time.sleep(SESSION_HOLD_SECONDS)
+        driver.quit()
+        return environment["browser_name"]
+
+    requested = matrix_context["environments"] * count
+    with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+        matrix_context["completed"] = list(executor.map(run_session, requested))
+    matrix_context["requested"] = len(requested)
+
+
+@then("every matrix session should have been created")
+def every_session_created(matrix_context):
+    created = matrix_context["grid"].state.created
+    assert len(matrix_context["completed"]) == matrix_context["requested"]
+    assert created == matrix_context["requested"], \
+        f"Expected {matrix_context['requested']} sessions but the Grid created {created}"
+
+
+@then(parsers.parse("no Grid node should have run more than {cap:d} session at once"))
+def per_node_cap_respected(matrix_context, cap):
+    peaks = [node.peak for node in matrix_context["grid"].state.nodes]
+    assert max(peaks) <= cap, f"Node session peaks {peaks} exceed the cap of {cap}"
+
+
+@then("the Grid stand-in should not have rejected any session")
+def no_rejected_sessions(matrix_context):
+    rejected = matrix_context["grid"].state.rejected
+    assert rejected == 0, f"The Grid rejected {rejected} session request(s)"
@@ -0,0 +1,133 @@
+"""Step definitions for the rerun and quarantine scenarios, run as a scratch pytest session in a subprocess."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from typing import Dict
+
+import pytest
+from pytest_bdd import given, when, then, parsers
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MODULE = "test_scratch.py"
+
+MODULE_HEADER = '''import os
+
+
+def _run(name):
+    """Count this attempt, log the run order and return the attempt number (1-based)."""
+    with open("order.log", "a", encoding="utf8") as handle:
+        handle.write(name + "\\n")
+    path = name + ".runs"
+    with open(path, "a", encoding="utf8") as handle:
+        handle.write(".")
+    return os.path.getsize(path)
+'''
+
+BEHAVIOURS = {
+    "passes": "",
+    "fails once and then passes": "    assert attempt > 1, 'first attempt fails'\n",
+    "always fails": "    assert False, 'always fails'\n",
+}
+
+
+@pytest.fixture
+def retries_context() -> Dict[str, object]:
+    """Mutable context shared across retries steps."""
+    return {}
+
+
+@given("a scratch suite run with the retries plugin")
+def scratch_suite(retries_context, tmp_path):
+    root = str(tmp_path / "suite")
+    shutil.copytree(os.path.join(ROOT, "config"), os.path.join(root, "config"))
+    with open(os.path.join(root, "pytest.ini"), "w", encoding="utf8") as handle:
+        handle.write("[pytest]\n")
+    retries_context.update(root=root, tests=[], flakiness={})
+
+
+@given(parsers.parse('a scratch test "{name}" that {behaviour}'))
+def scratch_test(retries_context, name, behaviour):
+    retries_context["tests"].append(
+        f"\n\ndef test_{name}():\n    attempt = _run({name!r})\n{BEHAVIOURS[behaviour]}")
+
+
+@given(parsers.parse('"{name}" has scored {score:f} flakiness over {runs:d} runs'))
+def seeded_flakiness(retries_context, name, score, runs):
+    retries_context["flakiness"][f"{MODULE}::test_{name}"] = {
+        "score": score, "runs": runs, "flaky": runs, "failed": 0, "last": "flaky"}
+
+
+@when(parsers.re(r"the scratch suite runs with (?P<retries>\d+) retr(?:y|ies), a budget of (?P<budget>\d+) "
+                 r"and (?P<workers>\d+) xdist workers"))
+def run_scratch_suite(retries_context, retries, budget, workers):
+    root = retries_context["root"]
+    with open(os.path.join(root, MODULE), "w", encoding="utf8") as handle:
+        handle.write(MODULE_HEADER + "".join(retries_context["tests"]))
+    with open(os.path.join(root, "flakiness.json"), "w", encoding="utf8") as handle:
+        json.dump(retries_context["flakiness"], handle)
+    command = [
+        sys.executable, "-m", "pytest", MODULE, "-p", "tests.plugins.retries", "-p", "no:cacheprovider",
+        "--retries", retries, "--flakiness-db", "flakiness.json", "--junitxml", "junit.xml", "-n", workers,
+    ]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.getenv("PYTHONPATH")])),
+               RETRY_BUDGET=budget, QUARANTINE_THRESHOLD="0.3", QUARANTINE_MIN_RUNS="5")
+    env.pop("PYTEST_ADDOPTS", None)
+    result = subprocess.run(command, cwd=root, env=env, capture_output=True, text=True, timeout=120, check=False)
+    logger.info("Scratch suite exited with %d:\n%s", result.returncode, result.stdout[-2000:])
+    retries_context["result"] = result
+
+
+def _read(retries_context, name: str) -> str:
+    path = os.path.join(retries_context["root"], name)
+    if not os.path.exists(path):
+        return ""
+    with open(path, encoding="utf8") as handle:
+        return handle.read()
+
+
+@then(parsers.parse("the scratch suite should exit with status {status:d}"))
+def exit_status(retries_context, status):
+    result = retries_context["result"]
+    assert result.returncode == status, \
+        f"Expected exit status {status}, got {result.returncode}:\n{result.stdout[-2000:]}{result.stderr[-2000:]}"
+
+
+@then(parsers.re(r'"(?P<name>\w+)" should have run (?P<times>\d+) times?'))
+def run_count(retries_context, name, times):
+    runs = len(_read(retries_context, f"{name}.runs"))
+    assert runs == int(times), f"Expected {name} to run {times} time(s), it ran {runs}"
+
+
+@then(parsers.parse('"{name}" should have run last'))
+def ran_last(retries_context, name):
+    order = _read(retries_context, "order.log").split()
+    assert order and order[-1] == name, f"Expected {name} to run last, the order was {order}"
+
+
+@then(parsers.parse('the JUnit report should list "{name}" once as "{outcome}" on retry attempt {attempt:d}'))
+def junit_testcase(retries_context, name, outcome, attempt):
+    cases = [case for case in ET.parse(os.path.join(retries_context["root"], "junit.xml")).iter("testcase")
+             if case.get("name") == f"test_{name}"]
+    assert len(cases) == 1, f"Expected one JUnit testcase for test_{name}, found {len(cases)}"
+    children = {child.tag for child in cases[0]}
+    actual = "failed" if children & {"failure", "error"} else "skipped" if "skipped" in children else "passed"
+    assert actual == outcome, f"Expected test_{name} to be reported as {outcome}, got {actual}"
+    properties = {prop.get("name"): prop.get("value") for prop in cases[0].iter("property")}
+    assert properties.get("retry_attempt") == str(attempt), \
+        f"Expected retry attempt {attempt} for test_{name}, got {properties.get('retry_attempt')}"
+
+
+@then(parsers.parse('the flakiness scores should record "{name}" as "{outcome}"'))
+def flakiness_recorded(retries_context, name, outcome):
+    scores = json.loads(_read(retries_context, "flakiness.json") or "{}")
+    record = scores.get(f"{MODULE}::test_{name}")
+    assert record is not None, f"No flakiness record for test_{name}"
+    assert record["last"] == outcome, f"Expected test_{name} to be recorded as {outcome}, got {record['last']}"
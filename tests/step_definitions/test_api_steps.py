@@ -1,3 +1,16 @@
-from pytest_bdd import scenarios
+import pytest
+from pytest_bdd import scenario, scenarios
+
+from utils.config import load_config
+
+# Generated Examples: one test per catalog row, resolved from the live catalog at run time.
+CATALOG_EXAMPLES = load_config().get("catalog_examples", 20)
+
+
+@pytest.mark.parametrize("catalog_example", range(CATALOG_EXAMPLES))
+@scenario("../features/api_catalog.feature", "Generated catalog examples resolve to exactly priced products")
+def test_generated_catalog_examples(catalog_example):
+    """Run the catalog sweep once per generated row."""
+
 
 scenarios("../features/api_catalog.feature")
@@ -0,0 +1,179 @@
+"""
+Incremental accessibility scanning with axe-core.
+
+The axe-core bundle is several hundred KB. AccessibilityEngine sends it to
+the browser at most once per page load: a window marker set after injection
+survives until the next navigation, and a cheap probe checks for it before
+every scan. The same probe hashes the DOM of the scanned region. Results are
+cached by (region, DOM hash), so a page that renders identically for several
+personas is only scanned once per worker.
+
+Scans can be scoped to a CSS selector (for example just the login form), so
+re-checking a region after an interaction does not rescan the whole page.
+Violations are aggregated into an AccessibilityReport that deduplicates them
+by rule and element, across every test that saw them.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import axe_selenium_python.axe as axe_module
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+AXE_SCRIPT = axe_module._DEFAULT_SCRIPT  # pylint: disable=protected-access
+MARKER = "__hmctsAxeInjected"
+
+# Reports whether axe is present on the current page and hashes (FNV-1a) the
+# markup of the region that would be scanned.
+PROBE_SCRIPT = """
+const [scope, marker] = arguments;
+const root = scope ? document.querySelector(scope) : document.documentElement;
+if (!root) return null;
+const html = root.outerHTML;
+let hash = 0x811c9dc5;
+for (let i = 0; i < html.length; i++) {
+    hash ^= html.charCodeAt(i);
+    hash = Math.imul(hash, 16777619);
+}
+return {injected: !!(window.axe && window[marker]), hash: (hash >>> 0).toString(16) + ':' + html.length,
+        url: window.location.href};
+"""
+
+# Runs axe and returns only the fields the report needs, to keep the reply small.
+RUN_SCRIPT = """
+const [scope, options] = arguments;
+const done = arguments[arguments.length - 1];
+axe.run(scope || document, options || {}).then((results) => done(results.violations.map((v) => ({
+    id: v.id, impact: v.impact, help: v.help, helpUrl: v.helpUrl, tags: v.tags,
+    nodes: v.nodes.map((n) => ({target: n.target, html: n.html, failureSummary: n.failureSummary}))
+})))).catch((error) => done({error: String(error)}));
+"""
+
+
+class AccessibilityError(Exception):
+    """Raised when axe-core cannot be run on the page."""
+
+
+class AccessibilityReport:
+    """Violations deduplicated by rule id and element target."""
+
+    def __init__(self):
+        self.violations: Dict[str, dict] = {}
+        self.stats = {"scans": 0, "cache_hits": 0, "injections": 0}
+
+    def add(self, violations: List[dict], url: str, scope: Optional[str], test: Optional[str]):
+        """Fold one scan's violations into the report."""
+        for violation in violations:
+            for node in violation.get("nodes", []):
+                target = " ".join(str(part) for part in node.get("target", []))
+                key = f"{violation['id']}|{target}"
+                entry = self.violations.setdefault(key, {
+                    "id": violation["id"],
+                    "impact": violation.get("impact"),
+                    "help": violation.get("help"),
+                    "helpUrl": violation.get("helpUrl"),
+                    "tags": violation.get("tags", []),
+                    "target": target,
+                    "html": node.get("html"),
+                    "failureSummary": node.get("failureSummary"),
+                    "occurrences": 0,
+                    "pages": [],
+                    "scopes": [],
+                    "tests": [],
+                })
+                entry["occurrences"] += 1
+                for field, value in (("pages", url), ("scopes", scope or "document"), ("tests", test)):
+                    if value and value not in entry[field]:
+                        entry[field].append(value)
+
+    def merge(self, data: dict):
+        """Merge a report produced by another worker (see `to_dict`)."""
+        for key, value in data.get("stats", {}).items():
+            self.stats[key] = self.stats.get(key, 0) + value
+        for incoming in data.get("violations", []):
+            key = f"{incoming['id']}|{incoming['target']}"
+            entry = self.violations.get(key)
+            if entry is None:
+                self.violations[key] = dict(incoming, **{f: list(incoming[f]) for f in ("pages", "scopes", "tests")})
+                continue
+            entry["occurrences"] += incoming["occurrences"]
+            for field in ("pages", "scopes", "tests"):
+                entry[field].extend(v for v in incoming[field] if v not in entry[field])
+
+    def to_dict(self) -> dict:
+        ordered = sorted(self.violations.values(), key=lambda v: (v["id"], v["target"]))
+        rules = sorted({v["id"] for v in ordered})
+        return {"stats": dict(self.stats), "rules": rules, "violations": ordered}
+
+
+class AccessibilityEngine:
+    """Inject axe-core once per page load, scan regions and cache results by DOM hash."""
+
+    _script: Optional[str] = None
+
+    def __init__(self, report: Optional[AccessibilityReport] = None, options: Optional[dict] = None,
+                 script_path: str = AXE_SCRIPT):
+        """
+        Initialise the engine.
+
+        Args:
+            report: Report that collects every scan's violations.
+            options: axe.run options, e.g. {"runOnly": ["wcag2a", "wcag2aa"]}.
+            script_path: Location of axe.min.js; defaults to the copy bundled
+                         with axe-selenium-python.
+        """
+        self.report = report or AccessibilityReport()
+        self.options = options or {}
+        self.script_path = script_path
+        self._cache: Dict[Tuple[Optional[str], str], List[dict]] = {}
+
+    def _source(self) -> str:
+        if AccessibilityEngine._script is None or self.script_path != AXE_SCRIPT:
+            with open(self.script_path, encoding="utf8") as handle:
+                source = handle.read()
+            if self.script_path != AXE_SCRIPT:
+                return source
+            AccessibilityEngine._script = source
+        return AccessibilityEngine._script
+
+    def scan(self, driver, scope: Optional[str] = None, test: Optional[str] = None) -> List[dict]:
+        """
+        Return the axe violations for the page, or for the region matching `scope`.
+
+        Args:
+            driver: WebDriver session showing the page.
+            scope: Optional CSS selector limiting the scan to one region.
+            test: Test node id recorded against any violations.
+
+        Raises:
+            AccessibilityError: If the region is missing or axe fails to run.
+        """
+        probe = driver.execute_script(PROBE_SCRIPT, scope, MARKER)
+        if probe is None:
+            raise AccessibilityError(f"Nothing matches the accessibility scope '{scope}'")
+
+        key = (scope, probe["hash"])
+        violations = self._cache.get(key)
+        if violations is not None:
+            self.report.stats["cache_hits"] += 1
+            logger.info("Accessibility scan of %s reused (unchanged DOM)", scope or probe["url"])
+        else:
+            if not probe["injected"]:
+                driver.execute_script(f"{self._source()}\nwindow['{MARKER}'] = true;")
+                self.report.stats["injections"] += 1
+            violations = driver.execute_async_script(RUN_SCRIPT, scope, self.options)
+            if isinstance(violations, dict) and "error" in violations:
+                raise AccessibilityError(f"axe-core failed: {violations['error']}")
+            self._cache[key] = violations
+            self.report.stats["scans"] += 1
+        self.report.add(violations, probe["url"], scope, test)
+        return violations
+
+
+def report_path(reports_dir: str = "reports") -> str:
+    """Return the location of the aggregated accessibility report."""
+    return os.path.join(reports_dir, "accessibility", "report.json")
@@ -0,0 +1,231 @@
+"""
+Off-thread artefact pipeline for screenshots, page source and browser logs.
+
+Capturing an artefact has two parts:
+- grabbing the data from the browser, which needs the live session and so
+  runs on the test thread (a screenshot is fetched as the base64 string the
+  driver receives anyway, without decoding it)
+- decoding, compressing and writing it to disk, which does not
+
+The second part is handed to a small pool of writer threads through a
+bounded queue. The test thread only pays for the round trips, so teardown
+returns the browser (or the pool slot) sooner. `flush()` waits for pending
+writes, and the session fixture calls it before the reports are generated.
+
+Artefacts are named by a hash of their content. A page that looks the same
+at every step, or the same error page captured by several tests, is written
+once and referenced by path from every result that captured it.
+
+Screenshots are re-encoded when Pillow is installed: optimised PNG by default
+or WebP with `artefact_format: webp`. Without Pillow the PNG from the browser
+is written unchanged.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.file_lock import atomic_write
+from utils.logger import get_logger
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional
+    Image = None
+
+
+logger = get_logger(__name__)
+
+KINDS = ("screenshot", "source", "logs")
+WEBP_QUALITY = 80
+
+
+def content_digest(kind: str, payload) -> str:
+    """Return a short hash of a grabbed artefact, used as its file name."""
+    if kind == "screenshot":
+        data = payload.encode("ascii")
+    elif isinstance(payload, str):
+        data = payload.encode("utf-8")
+    else:
+        data = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:20]
+
+
+@dataclass
+class _Job:
+    path: str
+    kind: str
+    payload: object
+
+
+class ArtefactPipeline:
+    """Grab artefacts on the calling thread and write them on background threads."""
+
+    def __init__(self, root: str, workers: int = 2, queue_size: int = 64, image_format: str = "png"):
+        """
+        Initialise the pipeline and start its writer threads.
+
+        Args:
+            root: Directory artefacts are written under.
+            workers: Number of writer threads.
+            queue_size: Pending writes allowed before capture blocks (or drops,
+                        for best-effort captures).
+            image_format: "png" or "webp"; WebP needs Pillow and falls back to PNG.
+        """
+        self.root = root
+        if image_format == "webp" and Image is None:
+            logger.warning("Pillow is not installed; writing screenshots as PNG instead of WebP")
+            image_format = "png"
+        self.image_format = image_format
+        self.queue: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.stats = {"captured": 0, "written": 0, "deduplicated": 0, "dropped": 0, "failed": 0, "bytes": 0,
+                      "grab_seconds": 0.0, "write_seconds": 0.0}
+        self._paths = set()  # queued or written by this pipeline
+        self._threads = [
+            threading.Thread(target=self._work, name=f"artefact-writer-{index}", daemon=True)
+            for index in range(max(workers, 1))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _extension(self, kind: str) -> str:
+        return {"screenshot": self.image_format, "source": "html", "logs": "json"}[kind]
+
+    def capture(self, driver, name: str, kinds: Iterable[str] = KINDS, subdir: str = "screenshots",
+                best_effort: bool = False) -> Dict[str, str]:
+        """
+        Grab artefacts from the browser and queue them for writing.
+
+        Args:
+            driver: Live WebDriver session.
+            name: Test or step name, for log messages; files are named by content hash.
+            kinds: Any of "screenshot", "source" and "logs".
+            subdir: Directory under the pipeline root.
+            best_effort: Drop the artefacts instead of blocking when the queue is
+                         full; used for per-step captures.
+
+        Returns:
+            The path each artefact will be written to, keyed by kind. Paths are
+            final as soon as this returns, so they can be linked in reports.
+            Content that was captured before maps to the existing file.
+        """
+        start = time.perf_counter()
+        directory = os.path.join(self.root, subdir)
+        jobs = []
+        paths = {}
+        for kind in kinds:
+            try:
+                payload = self._grab(driver, kind)
+            except WebDriverException as exc:
+                logger.warning("Could not capture %s for %s: %s", kind, name, exc.__class__.__name__)
+                continue
+            if payload is None:
+                continue
+            path = os.path.join(directory, f"{content_digest(kind, payload)}.{self._extension(kind)}")
+            with self.lock:
+                seen = path in self._paths or os.path.exists(path)
+                if seen:
+                    self.stats["deduplicated"] += 1
+            if seen:
+                paths[kind] = path
+                continue
+            jobs.append(_Job(path, kind, payload))
+
+        for job in jobs:
+            try:
+                self.queue.put(job, block=not best_effort)
+            except queue.Full:
+                with self.lock:
+                    self.stats["dropped"] += 1
+                continue
+            paths[job.kind] = job.path
+            with self.lock:
+                self._paths.add(job.path)
+        with self.lock:
+            self.stats["captured"] += len(paths)
+            self.stats["grab_seconds"] += time.perf_counter() - start
+        return paths
+
+    @staticmethod
+    def _grab(driver, kind: str):
+        if kind == "screenshot":
+            return driver.get_screenshot_as_base64()
+        if kind == "source":
+            return driver.page_source
+        if kind == "logs":
+            try:
+                return driver.get_log("browser")
+            except (AttributeError, WebDriverException):
+                # Only Chromium-based drivers expose browser logs.
+                return None
+        raise ValueError(f"Unknown artefact kind '{kind}'")
+
+    def _encode(self, job: _Job) -> bytes:
+        if job.kind == "screenshot":
+            raw = base64.b64decode(job.payload)
+            if Image is None:
+                return raw
+            out = io.BytesIO()
+            with Image.open(io.BytesIO(raw)) as image:
+                if self.image_format == "webp":
+                    image.save(out, format="WEBP", quality=WEBP_QUALITY, method=4)
+                else:
+                    image.save(out, format="PNG", optimize=True)
+            return out.getvalue()
+        if job.kind == "source":
+            return job.payload.encode("utf-8")
+        return json.dumps(job.payload, indent=2).encode("utf-8")
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                self.queue.task_done()
+                return
+            start = time.perf_counter()
+            try:
+                data = self._encode(job)
+                os.makedirs(os.path.dirname(job.path), exist_ok=True)
+                tmp = f"{job.path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp, job.path)
+                with self.lock:
+                    self.stats["written"] += 1
+                    self.stats["bytes"] += len(data)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Failed to write artefact %s: %s", job.path, exc)
+                with self.lock:
+                    self.stats["failed"] += 1
+            finally:
+                with self.lock:
+                    self.stats["write_seconds"] += time.perf_counter() - start
+                self.queue.task_done()
+
+    def flush(self):
+        """Block until every queued artefact has been written."""
+        self.queue.join()
+
+    def close(self):
+        """Flush pending writes and stop the writer threads."""
+        self.flush()
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        if not self.stats["captured"]:
+            return
+        summary = dict(self.stats, grab_seconds=round(self.stats["grab_seconds"], 3),
+                       write_seconds=round(self.stats["write_seconds"], 3))
+        atomic_write(os.path.join(self.root, "artefacts.json"), json.dumps(summary, indent=2))
+        logger.info("Artefacts: %s", summary)
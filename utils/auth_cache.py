@@ -0,0 +1,119 @@
+"""
+Cache of authenticated browser state per persona.
+
+Logging in through the UI takes several clicks through the username/password
+dropdowns. The cache lets each pytest worker perform that flow once per
+persona, capture the resulting cookies and web storage, and inject them into
+later sessions before navigating. Entries expire after a TTL and are dropped
+as soon as a restored session turns out not to be authenticated.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Only these cookie fields are accepted by WebDriver's add_cookie; the domain is
+# left out so cookies are always bound to the page that is currently open.
+COOKIE_FIELDS = ("name", "value", "path", "secure", "httpOnly", "expiry", "sameSite")
+
+READ_STORAGE_SCRIPT = """
+const dump = (storage) => {
+    const data = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+};
+return JSON.stringify({local: dump(window.localStorage), session: dump(window.sessionStorage)});
+"""
+
+WRITE_STORAGE_SCRIPT = """
+const state = JSON.parse(arguments[0]);
+Object.entries(state.local).forEach(([k, v]) => window.localStorage.setItem(k, v));
+Object.entries(state.session).forEach(([k, v]) => window.sessionStorage.setItem(k, v));
+"""
+
+
+@dataclass
+class AuthSnapshot:
+    """Cookies and web storage captured from an authenticated session."""
+
+    cookies: List[dict]
+    local_storage: Dict[str, str]
+    session_storage: Dict[str, str]
+    captured_at: float = field(default_factory=time.monotonic)
+
+
+def capture_auth_state(driver) -> AuthSnapshot:
+    """
+    Capture the authentication state of the page currently open in the browser.
+
+    Args:
+        driver: Selenium WebDriver instance with an authenticated session.
+
+    Returns:
+        An AuthSnapshot of the cookies, localStorage and sessionStorage.
+    """
+    storage = json.loads(driver.execute_script(READ_STORAGE_SCRIPT))
+    cookies = [
+        {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+        for cookie in driver.get_cookies()
+    ]
+    return AuthSnapshot(cookies, storage["local"], storage["session"])
+
+
+def restore_auth_state(driver, snapshot: AuthSnapshot):
+    """
+    Inject a captured authentication state into the page currently open.
+
+    The browser must already be on the application origin; the caller is
+    expected to reload the page afterwards so the app picks the state up.
+
+    Args:
+        driver: Selenium WebDriver instance on the application origin.
+        snapshot: Previously captured AuthSnapshot.
+    """
+    for cookie in snapshot.cookies:
+        driver.add_cookie(cookie)
+    driver.execute_script(
+        WRITE_STORAGE_SCRIPT,
+        json.dumps({"local": snapshot.local_storage, "session": snapshot.session_storage}),
+    )
+
+
+class AuthStateCache:
+    """In-memory, per-worker cache of AuthSnapshots keyed by persona."""
+
+    def __init__(self, ttl_seconds: float = 900):
+        """
+        Initialise the cache.
+
+        Args:
+            ttl_seconds: Age after which a snapshot is no longer reused.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: Dict[str, AuthSnapshot] = {}
+
+    def get(self, persona: str) -> Optional[AuthSnapshot]:
+        """Return a fresh snapshot for the persona, or None if absent/expired."""
+        snapshot = self._snapshots.get(persona)
+        if snapshot and time.monotonic() - snapshot.captured_at > self.ttl_seconds:
+            logger.info("Auth snapshot for %s expired", persona)
+            self.invalidate(persona)
+            return None
+        return snapshot
+
+    def store(self, persona: str, snapshot: AuthSnapshot):
+        """Remember the snapshot for the persona."""
+        self._snapshots[persona] = snapshot
+
+    def invalidate(self, persona: str):
+        """Forget the snapshot for the persona, e.g. after an auth failure."""
+        self._snapshots.pop(persona, None)
@@ -0,0 +1,139 @@
+"""
+Runtime configuration loader.
+
+Settings live in config/config.yaml and can be overridden through environment
+variables so Docker/CI pipelines can change behaviour without editing the YAML
+file. Loading is kept outside the pytest fixtures so plugins and command-line
+helpers that run before any fixture is available see the same values.
+"""
+
+import json
+import os
+
+import yaml
+
+
+CONFIG_PATH = "config/config.yaml"
+
+# Environment variable that overrides each configuration key.
+ENV_OVERRIDES = {
+    "base_url": "BASE_URL",
+    "browser": "BROWSER",
+    "run_mode": "RUN_MODE",
+    "grid_url": "GRID_URL",
+    "implicit_wait": "IMPLICIT_WAIT",
+    "explicit_wait": "EXPLICIT_WAIT",
+    "wait_policy": "WAIT_POLICY",
+    "event_waits": "EVENT_WAITS",
+    "api_base_url": "API_BASE_URL",
+    "driver_pool": "DRIVER_POOL",
+    "driver_pool_max_uses": "DRIVER_POOL_MAX_USES",
+    "driver_offline": "DRIVER_OFFLINE",
+    "driver_manifest": "DRIVER_MANIFEST",
+    "chromedriver_path": "CHROMEDRIVER_PATH",
+    "geckodriver_path": "GECKODRIVER_PATH",
+    "persona_password": "PERSONA_PASSWORD",
+    "auth_cache_ttl": "AUTH_CACHE_TTL",
+    "parallel_workers": "PARALLEL_WORKERS",
+    "api_timeout": "API_TIMEOUT",
+    "api_concurrency": "API_CONCURRENCY",
+    "api_cache": "API_CACHE",
+    "api_cache_ttl": "API_CACHE_TTL",
+    "api_cache_dir": "API_CACHE_DIR",
+    "catalog_examples": "CATALOG_EXAMPLES",
+    "catalog_seed": "CATALOG_SEED",
+    "impact_base": "IMPACT_BASE",
+    "http_backend_tags": "HTTP_BACKEND_TAGS",
+    "retries": "RETRIES",
+    "retry_budget": "RETRY_BUDGET",
+    "quarantine_threshold": "QUARANTINE_THRESHOLD",
+    "quarantine_min_runs": "QUARANTINE_MIN_RUNS",
+    "click_retry_backoff": "CLICK_RETRY_BACKOFF",
+    "log_level": "LOG_LEVEL",
+    "log_levels": "LOG_LEVELS",
+    "log_debug_sample": "LOG_DEBUG_SAMPLE",
+    "timing": "TIMING",
+    "history_db": "HISTORY_DB",
+    "history_keep_runs": "HISTORY_KEEP_RUNS",
+    "regression_threshold": "REGRESSION_THRESHOLD",
+    "regression_min_delta": "REGRESSION_MIN_DELTA",
+    "regression_min_samples": "REGRESSION_MIN_SAMPLES",
+    "report_page_size": "REPORT_PAGE_SIZE",
+    "report_keep_runs": "REPORT_KEEP_RUNS",
+    "artefact_workers": "ARTEFACT_WORKERS",
+    "artefact_queue_size": "ARTEFACT_QUEUE_SIZE",
+    "artefact_format": "ARTEFACT_FORMAT",
+    "artefacts_every_step": "ARTEFACTS_EVERY_STEP",
+    "accessibility_tags": "ACCESSIBILITY_TAGS",
+    "load_profile": "LOAD_PROFILE",
+    "load_block_patterns": "LOAD_BLOCK_PATTERNS",
+    "mock_server": "MOCK_SERVER",
+    "mock_server_host": "MOCK_SERVER_HOST",
+    "grid_session_budget": "GRID_SESSION_BUDGET",
+    "grid_per_node_cap": "GRID_PER_NODE_CAP",
+    "matrix_environment": "MATRIX_ENVIRONMENT",
+    "matrix_slots_dir": "MATRIX_SLOTS_DIR",
+    "matrix_slot_timeout": "MATRIX_SLOT_TIMEOUT",
+}
+
+# Settings whose environment overrides must be converted from strings.
+INT_SETTINGS = {
+    "implicit_wait",
+    "explicit_wait",
+    "driver_pool_max_uses",
+    "auth_cache_ttl",
+    "parallel_workers",
+    "api_timeout",
+    "api_concurrency",
+    "api_cache_ttl",
+    "catalog_examples",
+    "catalog_seed",
+    "retries",
+    "retry_budget",
+    "quarantine_min_runs",
+    "log_debug_sample",
+    "grid_session_budget",
+    "grid_per_node_cap",
+    "matrix_slot_timeout",
+    "report_page_size",
+    "report_keep_runs",
+    "history_keep_runs",
+    "regression_min_samples",
+    "artefact_workers",
+    "artefact_queue_size",
+}
+FLOAT_SETTINGS = {"quarantine_threshold", "click_retry_backoff", "regression_threshold", "regression_min_delta"}
+BOOL_SETTINGS = {"driver_pool", "event_waits", "driver_offline", "mock_server", "api_cache", "timing", "artefacts_every_step"}
+# Settings passed as JSON, e.g. the capability set chosen by the matrix runner.
+JSON_SETTINGS = {"matrix_environment"}
+
+
+def load_config(path: str = CONFIG_PATH) -> dict:
+    """
+    Load the YAML configuration and apply environment variable overrides.
+
+    Args:
+        path: Location of the YAML configuration file.
+
+    Returns:
+        Dictionary of runtime settings.
+    """
+    with open(path) as f:
+        config_data = yaml.safe_load(f)
+
+    for key, env_name in ENV_OVERRIDES.items():
+        value = os.getenv(env_name)
+        if value is None:
+            continue
+        if key in INT_SETTINGS:
+            config_data[key] = int(value)
+        elif key in FLOAT_SETTINGS:
+            config_data[key] = float(value)
+        elif key in BOOL_SETTINGS:
+            config_data[key] = value.strip().lower() in ("1", "true", "yes", "on")
+        elif key in JSON_SETTINGS:
+            config_data[key] = json.loads(value)
+        else:
+            config_data[key] = value
+
+    return config_data
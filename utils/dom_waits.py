@@ -0,0 +1,170 @@
+"""
+Event-driven element waits.
+
+WebDriverWait polls: every poll is one or more WebDriver round trips (find
+the element, then ask whether it is displayed or enabled), followed by a
+sleep. A remote session can spend dozens of HTTP calls on one wait and
+notices the element up to one poll interval late.
+
+`event_wait` makes one `execute_async_script` call instead. The script
+checks the condition in the page, then re-checks it whenever a
+MutationObserver sees the DOM change. It also re-checks on a short in-page
+timer, because style and layout changes do not always mutate the DOM. The
+call returns as soon as the condition holds, or once the timeout has passed.
+
+When the script cannot run (the page navigates away mid-wait, the driver
+rejects async scripts, the locator has no CSS/XPath form), the caller falls
+back to polling. A session whose scripts keep failing stops trying. Every
+wait is counted in the session's WaitState, including an estimate of the
+round trips that polling would have made.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import get_logger
+from utils.waits import wait_state
+
+
+logger = get_logger(__name__)
+
+PRESENT, VISIBLE, CLICKABLE, ABSENT, TEXT = "present", "visible", "clickable", "absent", "text"
+
+# Round trips one WebDriverWait poll makes for each condition
+# (find_element, then is_displayed / is_enabled / text).
+POLL_CALLS = {PRESENT: 1, VISIBLE: 2, CLICKABLE: 3, ABSENT: 2, TEXT: 3}
+
+# Consecutive script failures after which a session only polls.
+MAX_FAILURES = 3
+
+# Visibility as the wait script and page snapshots judge it: rendered, not
+# visibility:hidden and not fully transparent.
+VISIBILITY_FUNCTION = """
+const visible = (el) => {
+    if (!el.isConnected) return false;
+    if (el.checkVisibility) return el.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+};
+"""
+
+WAIT_SCRIPT = VISIBILITY_FUNCTION + """
+const strategy = arguments[0], value = arguments[1], condition = arguments[2],
+      expected = arguments[3], timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+const find = () => {
+    if (strategy === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(value);
+};
+const check = () => {
+    let el;
+    try { el = find(); } catch (e) { return {error: String(e)}; }
+    switch (condition) {
+        case 'present': return el ? {element: el} : null;
+        case 'visible': return el && visible(el) ? {element: el} : null;
+        case 'clickable': return el && visible(el) && !el.disabled ? {element: el} : null;
+        case 'absent': return !el || !visible(el) ? {element: null} : null;
+        case 'text': return el && visible(el) && (el.innerText || '').trim() === expected ? {element: el} : null;
+    }
+    return {error: 'Unknown condition ' + condition};
+};
+const start = performance.now();
+let settled = false, observer = null, tick = null, timer = null;
+const finish = (result) => {
+    if (settled) return;
+    settled = true;
+    if (observer) observer.disconnect();
+    clearInterval(tick);
+    clearTimeout(timer);
+    result.elapsed = (performance.now() - start) / 1000;
+    done(result);
+};
+const recheck = () => { const result = check(); if (result) finish(result); };
+const first = check();
+if (first) {
+    finish(first);
+} else {
+    observer = new MutationObserver(recheck);
+    observer.observe(document.documentElement || document,
+                     {childList: true, subtree: true, attributes: true, characterData: true});
+    tick = setInterval(recheck, 100);
+    timer = setTimeout(() => finish({timeout: true}), timeoutMs);
+}
+"""
+
+
+@dataclass
+class EventWaitResult:
+    """Outcome of one in-page wait."""
+
+    matched: bool
+    element: object = None
+    elapsed: float = 0.0
+
+
+def polls_avoided(condition: str, elapsed: float, poll_frequency: float) -> int:
+    """
+    Estimate the round trips WebDriverWait would have made for the same wait.
+
+    WebDriverWait checks immediately and then once per poll interval, and
+    each check costs POLL_CALLS[condition] calls. The event wait itself
+    costs one call.
+    """
+    polls = int(elapsed / poll_frequency) + 1 if poll_frequency > 0 else 1
+    return max(polls * POLL_CALLS[condition] - 1, 0)
+
+
+def _ensure_script_timeout(driver, seconds: float):
+    """Raise the session's script timeout above the wait's own timeout, once per session."""
+    state = wait_state(driver)
+    if seconds + 1 > state.script_timeout:
+        state.script_timeout = seconds + 5
+        driver.set_script_timeout(state.script_timeout)
+
+
+def event_wait(driver, script_locator, condition: str, timeout: float, poll_frequency: float,
+               expected: Optional[str] = None) -> Optional[EventWaitResult]:
+    """
+    Wait in the page for the element's condition with one round trip.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        script_locator: ("css selector" | "xpath", value), see pages.base_page.to_script_locator.
+        condition: PRESENT, VISIBLE, CLICKABLE, ABSENT or TEXT.
+        timeout: Seconds to wait.
+        poll_frequency: The poll interval the fallback would use, for the savings estimate.
+        expected: Text the element must show, for TEXT.
+
+    Returns:
+        The result, or None if the caller should fall back to polling.
+    """
+    state = wait_state(driver)
+    if not state.event_waits:
+        return None
+    strategy, value = script_locator
+    try:
+        _ensure_script_timeout(driver, timeout)
+        raw = driver.execute_async_script(WAIT_SCRIPT, strategy, value, condition, expected, int(timeout * 1000))
+    except WebDriverException as exc:
+        state.poll_fallbacks += 1
+        state.event_failures += 1
+        if state.event_failures >= MAX_FAILURES:
+            state.event_waits = False
+            logger.warning("In-page waits failed %d times in a row (%s); polling for the rest of the session",
+                           state.event_failures, exc.__class__.__name__)
+        else:
+            logger.debug("In-page wait for %s failed (%s); polling instead", value, exc.__class__.__name__)
+        return None
+    if not isinstance(raw, dict) or raw.get("error"):
+        state.poll_fallbacks += 1
+        logger.debug("In-page wait for %s could not run (%s); polling instead", value,
+                     raw.get("error") if isinstance(raw, dict) else raw)
+        return None
+    state.event_failures = 0
+    state.in_page_waits += 1
+    elapsed = float(raw.get("elapsed") or 0.0)
+    state.round_trips_saved += polls_avoided(condition, elapsed, poll_frequency)
+    return EventWaitResult(matched=not raw.get("timeout"), element=raw.get("element"), elapsed=elapsed)
@@ -7,18 +7,45 @@ isolated so that page objects and tests remain focused on behaviour.
 """
 import os
 import platform
+from typing import Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.common.exceptions import WebDriverException, JavascriptException
+from selenium.common.exceptions import (
+    WebDriverException,
+    JavascriptException,
+    SessionNotCreatedException,
+)
 
+from utils.driver_resolver import DriverResolver
+from utils.load_profiles import LoadProfile, configure_options, launched_with, resolve_profile
+from utils.logger import get_logger
+from utils.matrix import DEFAULT_ENVIRONMENTS, hold_lease, session_slots
 
-def get_local_driver(browser_name: str):
+
+logger = get_logger(__name__)
+
+
+def _start_local(driver_class, service_class, browser: str, options, resolver: DriverResolver):
+    """
+    Start a local browser using a cached driver binary.
+
+    If the cached driver no longer matches the installed browser the session
+    fails to start; the cache entry is then dropped and resolution retried once.
+    """
+    try:
+        return driver_class(service=service_class(resolver.resolve(browser)), options=options)
+    except SessionNotCreatedException:
+        if resolver.offline:
+            raise
+        resolver.invalidate(browser)
+        return driver_class(service=service_class(resolver.resolve(browser)), options=options)
+
+
+def get_local_driver(browser_name: str, config: Optional[dict] = None, profile: Optional[LoadProfile] = None):
     """
     Create and return a WebDriver instance for the given browser.
 
@@ -28,6 +55,18 @@ def get_local_driver(browser_name: str):
         - "chrome-headless"
         - "firefox-headless"
 
+    Driver binaries are located through `DriverResolver`, which caches the
+    resolved path per machine and browser version instead of querying
+    webdriver-manager for every session.
+
+    Args:
+        browser_name: Browser name/mode to start.
+        config: Optional runtime configuration with driver resolution settings
+                (`driver_offline`, `driver_manifest`, `chromedriver_path`,
+                `geckodriver_path`).
+        profile: Optional page-load profile. Chrome blocks requests through CDP
+                 once started; Firefox applies the profile as preferences.
+
     Returns:
         A configured Selenium WebDriver instance.
 
@@ -36,6 +75,7 @@ def get_local_driver(browser_name: str):
     """
     os_name = platform.system().lower()
     name = browser_name.lower()
+    resolver = DriverResolver.from_config(config)
 
     is_headless = "headless" in name
     is_chrome = name.startswith("chrome")
@@ -63,16 +103,16 @@ def get_local_driver(browser_name: str):
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--window-size=1920,1080")
 
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=chrome_options
-        )
+        if profile:
+            configure_options(chrome_options, profile, "chrome", runtime_blocking=True)
+
+        driver = _start_local(webdriver.Chrome, ChromeService, "chrome", chrome_options, resolver)
 
 
         if not is_headless:
             try:
                 driver.maximize_window()  # Try first for Windows / Linux
-                print("Maximized window using maximize_window()")
+                logger.debug("Maximized window using maximize_window()")
             except WebDriverException:
                 pass
 
@@ -93,17 +133,17 @@ def get_local_driver(browser_name: str):
         firefox_options.set_preference("dom.popup_maximum", 0)
         firefox_options.set_preference("privacy.trackingprotection.enabled", False)
 
-        driver = webdriver.Firefox(
-            service=FirefoxService(GeckoDriverManager().install()),
-            options=firefox_options
-        )
+        if profile:
+            configure_options(firefox_options, profile, "firefox", runtime_blocking=False)
+
+        driver = _start_local(webdriver.Firefox, FirefoxService, "firefox", firefox_options, resolver)
 
         if not is_headless:
             try:
                 screen_width = driver.execute_script("return screen.width")
                 screen_height = driver.execute_script("return screen.height")
                 driver.set_window_size(screen_width, screen_height)
-                print("Maximized window using JavaScript")
+                logger.debug("Maximized window using JavaScript")
             except (JavascriptException, WebDriverException):
                 pass
 
@@ -114,13 +154,16 @@ def get_local_driver(browser_name: str):
             "Unsupported browser. Use: chrome, firefox, chrome-headless, or firefox-headless.")
 
 
-def get_grid_driver(config: dict):
+def get_grid_driver(config: dict, profile: Optional[LoadProfile] = None):
     """
     Create a remote WebDriver instance that targets a Selenium Grid.
 
     The grid URL can be supplied via the configuration file or the GRID_URL
     environment variable. Browsers are selected using the same `browser`
     property as local runs, allowing a single toggle between environments.
+    When the matrix runner sets `matrix_environment`, its browser name,
+    version and optional platform_name are requested instead. The
+    page-load profile, if given, is applied at launch (no CDP on the Grid).
     """
     grid_url = config.get("grid_url") or os.getenv("GRID_URL")
     if not grid_url:
@@ -128,7 +171,8 @@ def get_grid_driver(config: dict):
             "GRID_URL must be configured when run_mode is set to 'grid'."
         )
 
-    browser_name = (config.get("browser") or "chrome").lower()
+    environment = config.get("matrix_environment") or {}
+    browser_name = (environment.get("browser_name") or config.get("browser") or "chrome").lower()
 
     if "chrome" in browser_name:
         options = webdriver.ChromeOptions()
@@ -136,12 +180,20 @@ def get_grid_driver(config: dict):
             options.add_argument("--headless=new")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--no-sandbox")
-        return webdriver.Remote(command_executor=grid_url, options=options)
-
-    if "firefox" in browser_name:
+    elif "firefox" in browser_name:
         options = webdriver.FirefoxOptions()
         if "-headless" in browser_name:
             options.add_argument("-headless")
+    else:
+        options = None
+
+    if options is not None:
+        if environment.get("browser_version") not in (None, "", "latest"):
+            options.set_capability("browserVersion", environment["browser_version"])
+        if environment.get("platform_name"):
+            options.set_capability("platformName", environment["platform_name"])
+        if profile:
+            configure_options(options, profile, browser_name, runtime_blocking=False)
         return webdriver.Remote(command_executor=grid_url, options=options)
 
     raise Exception(
@@ -150,7 +202,7 @@ def get_grid_driver(config: dict):
     )
 
 
-def get_browserstack_driver(browserstack_config):
+def get_browserstack_driver(browserstack_config, profile: Optional[LoadProfile] = None):
     """
     Create a remote WebDriver instance for BrowserStack.
 
@@ -163,8 +215,9 @@ def get_browserstack_driver(browserstack_config):
         BROWSERSTACK_ACCESS_KEY
 
     Args:
-        config: Loaded configuration dictionary which may include browser
-                name and other runtime options.
+        browserstack_config: BrowserStack capability set (browser, OS and
+                             session name).
+        profile: Optional page-load profile, applied at launch.
 
     Returns:
         A remote Selenium WebDriver instance pointing to BrowserStack.
@@ -201,6 +254,8 @@ def get_browserstack_driver(browserstack_config):
 
     for key, value in capabilities.items():
         options.set_capability(key, value)
+    if profile:
+        configure_options(options, profile, browser_name, runtime_blocking=False)
 
     return webdriver.Remote(
         command_executor=remote_url,
@@ -208,7 +263,7 @@ def get_browserstack_driver(browserstack_config):
     )
 
 
-def get_driver(config: dict):
+def get_driver(config: dict, profile: Optional[LoadProfile] = None):
     """
     Return a WebDriver instance based on the runtime configuration.
 
@@ -220,18 +275,37 @@ def get_driver(config: dict):
         run_mode: "local" or "browserstack"
         browser: "chrome", "firefox", ...
 
+    Remote sessions wait for a free slot first when the matrix runner has
+    set up session slots (`matrix_slots_dir`); the slot is released when the
+    driver quits.
+
     Args:
         config: Loaded configuration dictionary.
+        profile: Page-load profile; defaults to the configured `load_profile`.
 
     Returns:
         A Selenium WebDriver instance ready for test execution.
     """
     run_mode = (config.get("run_mode") or "local").lower()
     browser = config.get("browser", "chrome")
+    profile = profile or resolve_profile(config)
 
-    if run_mode == "browserstack":
-        return get_browserstack_driver(config)
-    if run_mode == "grid":
-        return get_grid_driver(config)
+    if run_mode not in ("browserstack", "grid"):
+        driver = get_local_driver(browser, config, profile)
+        launched_with(driver, profile)
+        return driver
 
-    return get_local_driver(browser)
+    environment = config.get("matrix_environment")
+    slots = session_slots(config)
+    lease = slots.acquire(environment["browser_name"] if environment else browser) if slots else None
+    try:
+        if run_mode == "browserstack":
+            driver = get_browserstack_driver(environment or DEFAULT_ENVIRONMENTS[0], profile)
+        else:
+            driver = get_grid_driver(config, profile)
+    except Exception:
+        if lease:
+            lease.release()
+        raise
+    launched_with(driver, profile)
+    return hold_lease(driver, lease) if lease else driver
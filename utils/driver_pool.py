@@ -0,0 +1,160 @@
+"""
+Worker-local pool of warm WebDriver sessions.
+
+Starting a browser is the most expensive part of a UI scenario, so the pool
+keeps sessions alive for the lifetime of a pytest worker and hands them out one
+scenario at a time. Between scenarios each session is reset to a blank state
+(cookies, web storage, extra windows) and it is recycled after a configurable
+number of uses, or as soon as a health check fails.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PooledDriver:
+    """A WebDriver session owned by the pool together with its usage count."""
+
+    driver: object
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+
+def reset_driver_state(driver):
+    """
+    Return a browser session to a clean state so it can be reused.
+
+    Extra windows are closed, cookies and local/session storage are cleared
+    for the current origin and the browser is parked on about:blank.
+
+    Args:
+        driver: Selenium WebDriver instance to reset.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    try:
+        driver.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();")
+    except JavascriptException:
+        # about:blank and data: URLs have no storage to clear.
+        pass
+    driver.delete_all_cookies()
+
+    # Local Chrome sessions can drop cookies for every domain, not only the
+    # one currently loaded.
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+    driver.get("about:blank")
+
+
+def is_healthy(driver) -> bool:
+    """Return True if the browser session still responds to commands."""
+    try:
+        return bool(driver.window_handles) and driver.current_url is not None
+    except WebDriverException:
+        return False
+
+
+class DriverPool:
+    """
+    Pool of reusable WebDriver sessions for a single pytest worker.
+
+    Each xdist worker is its own process, so a session-scoped pool is already
+    worker-local; no locking is required.
+    """
+
+    def __init__(self, factory: Callable[[], object], max_uses: int = 20, max_idle: int = 1):
+        """
+        Initialise the pool.
+
+        Args:
+            factory: Callable returning a new WebDriver instance.
+            max_uses: Number of scenarios a session may serve before it is recycled.
+            max_idle: Maximum number of idle sessions kept warm.
+        """
+        self.factory = factory
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self._idle: List[PooledDriver] = []
+        self.created = 0
+        self.recycled = 0
+        self.last_checkout_seconds = 0.0
+        self.last_reset_seconds = 0.0
+
+    def acquire(self) -> PooledDriver:
+        """
+        Check out a healthy session, starting a new browser if none is idle.
+
+        Returns:
+            The PooledDriver wrapping the checked-out session.
+        """
+        start = time.perf_counter()
+        pooled = None
+        while self._idle:
+            candidate = self._idle.pop()
+            if is_healthy(candidate.driver):
+                pooled = candidate
+                break
+            logger.warning("Discarding unhealthy pooled browser session")
+            self._discard(candidate)
+
+        if pooled is None:
+            pooled = PooledDriver(self.factory())
+            self.created += 1
+
+        pooled.uses += 1
+        self.last_checkout_seconds = time.perf_counter() - start
+        return pooled
+
+    def release(self, pooled: PooledDriver, discard: bool = False):
+        """
+        Return a session to the pool, resetting it for the next scenario.
+
+        Args:
+            pooled: Session previously returned by acquire().
+            discard: Quit the session instead of returning it to the pool.
+        """
+        start = time.perf_counter()
+        if discard or pooled.uses >= self.max_uses or len(self._idle) >= self.max_idle:
+            self._discard(pooled)
+        else:
+            try:
+                reset_driver_state(pooled.driver)
+                self._idle.append(pooled)
+            except WebDriverException as exc:
+                logger.warning("Failed to reset pooled browser (%s); recycling it",
+                               exc.__class__.__name__)
+                self._discard(pooled)
+        self.last_reset_seconds = time.perf_counter() - start
+
+    def close(self):
+        """Quit every idle session held by the pool."""
+        while self._idle:
+            self._quit(self._idle.pop())
+        logger.info("Driver pool closed: %s browsers started, %s recycled",
+                    self.created, self.recycled)
+
+    def _discard(self, pooled: PooledDriver):
+        self.recycled += 1
+        self._quit(pooled)
+
+    @staticmethod
+    def _quit(pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except WebDriverException:
+            pass
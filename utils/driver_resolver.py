@@ -0,0 +1,194 @@
+"""
+Resolve browser driver binaries once per machine and browser version.
+
+Calling ChromeDriverManager/GeckoDriverManager for every new session performs
+a version lookup and a round of filesystem probing, which can stall for
+seconds on locked-down runners. The resolver performs that lookup once, stores
+the resulting path in an on-disk manifest shared by all pytest-xdist workers,
+and afterwards hands the cached path straight to `Service(path)`.
+
+For air-gapped runners an offline mode never touches webdriver-manager and only
+looks at configured paths and the PATH.
+"""
+
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+from typing import Dict, Optional
+
+from utils.file_lock import atomic_write, locked
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MANIFEST = os.path.join(
+    os.path.expanduser("~"), ".cache", "hmcts-test-automation", "drivers.json"
+)
+
+DRIVER_BINARIES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+}
+
+BROWSER_BINARIES = {
+    "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"),
+    "firefox": ("firefox",),
+}
+
+DRIVER_PATH_ENV = {
+    "chrome": "CHROMEDRIVER_PATH",
+    "firefox": "GECKODRIVER_PATH",
+}
+
+
+def detect_browser_version(browser: str) -> str:
+    """
+    Return the installed major browser version, or "unknown" if not detectable.
+
+    Args:
+        browser: Browser family, "chrome" or "firefox".
+    """
+    for binary in BROWSER_BINARIES.get(browser, ()):
+        path = shutil.which(binary)
+        if not path:
+            continue
+        try:
+            output = subprocess.run(
+                [path, "--version"], capture_output=True, text=True, timeout=5, check=False
+            ).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        match = re.search(r"(\d+)\.\d+", output)
+        if match:
+            return match.group(1)
+    return "unknown"
+
+
+class DriverResolver:
+    """
+    Resolve and cache driver binary paths for local browser sessions.
+
+    Resolved paths are kept in memory for the lifetime of the process and in a
+    JSON manifest keyed by browser, platform and browser major version.
+    """
+
+    _memory: Dict[str, str] = {}
+
+    def __init__(self, manifest_path: Optional[str] = None, offline: bool = False,
+                 driver_paths: Optional[Dict[str, str]] = None):
+        """
+        Initialise the resolver.
+
+        Args:
+            manifest_path: Location of the shared JSON manifest.
+            offline: Never download drivers; only use configured paths or PATH.
+            driver_paths: Optional explicit driver paths keyed by browser family.
+        """
+        self.manifest_path = manifest_path or DEFAULT_MANIFEST
+        self.offline = offline
+        self.driver_paths = driver_paths or {}
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> "DriverResolver":
+        """Build a resolver from the runtime configuration dictionary."""
+        config = config or {}
+        return cls(
+            manifest_path=config.get("driver_manifest"),
+            offline=bool(config.get("driver_offline", False)),
+            driver_paths={
+                "chrome": config.get("chromedriver_path"),
+                "firefox": config.get("geckodriver_path"),
+            },
+        )
+
+    def _key(self, browser: str) -> str:
+        return f"{browser}-{platform.system().lower()}-{platform.machine().lower()}-" \
+               f"{detect_browser_version(browser)}"
+
+    def resolve(self, browser: str) -> str:
+        """
+        Return the driver binary path for the given browser family.
+
+        Args:
+            browser: Browser family, "chrome" or "firefox".
+
+        Returns:
+            Absolute path to the driver executable.
+
+        Raises:
+            RuntimeError: If offline mode is enabled and no driver can be found.
+        """
+        if browser in self._memory:
+            return self._memory[browser]
+
+        if self.offline:
+            path = self._resolve_offline(browser)
+            self._memory[browser] = path
+            return path
+
+        key = self._key(browser)
+        with locked(self.manifest_path):
+            manifest = self._read_manifest()
+            path = manifest.get(key)
+            if not path or not os.path.exists(path):
+                path = self._install(browser)
+                manifest[key] = path
+                atomic_write(self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+                logger.info("Resolved %s driver for %s to %s", browser, key, path)
+
+        self._memory[browser] = path
+        return path
+
+    def invalidate(self, browser: str):
+        """
+        Forget the cached driver for a browser, e.g. after a version mismatch.
+
+        Args:
+            browser: Browser family, "chrome" or "firefox".
+        """
+        self._memory.pop(browser, None)
+        if self.offline:
+            return
+        prefix = f"{browser}-"
+        with locked(self.manifest_path):
+            manifest = {
+                key: value for key, value in self._read_manifest().items()
+                if not key.startswith(prefix)
+            }
+            atomic_write(self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+
+    def _read_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_path) as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _resolve_offline(self, browser: str) -> str:
+        candidates = [
+            self.driver_paths.get(browser),
+            os.getenv(DRIVER_PATH_ENV[browser]),
+            shutil.which(DRIVER_BINARIES[browser]),
+        ]
+        for candidate in candidates:
+            if candidate and os.path.exists(candidate):
+                return candidate
+        raise RuntimeError(
+            f"Offline driver resolution is enabled but no {DRIVER_BINARIES[browser]} was found. "
+            f"Set {DRIVER_PATH_ENV[browser]} or put the binary on PATH."
+        )
+
+    @staticmethod
+    def _install(browser: str) -> str:
+        # Imported lazily so offline runners never load webdriver-manager.
+        if browser == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        if browser == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        raise ValueError(f"No driver binary known for browser '{browser}'")
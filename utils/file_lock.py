@@ -0,0 +1,96 @@
+"""
+Cross-process file locking helper.
+
+Several helpers persist small JSON files that are shared by every pytest-xdist
+worker on a machine. This module provides an exclusive advisory lock so that
+concurrent workers never read a half-written file or overwrite each other.
+"""
+
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def locked(path: str):
+    """
+    Hold an exclusive lock on `<path>.lock` for the duration of the block.
+
+    Args:
+        path: Path of the file being protected. The lock itself lives in a
+              sibling file so the protected file can be replaced atomically.
+    """
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+    with open(lock_path, "a+") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write(path: str, content: str):
+    """
+    Replace the contents of `path` without exposing a partially written file.
+
+    Args:
+        path: Destination file.
+        content: Text to write.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as handle:
+        handle.write(content)
+    os.replace(tmp_path, path)
+
+
+def try_lock(path: str):
+    """
+    Try to take an exclusive lock on `path` without blocking.
+
+    The lock is released by `unlock()` or automatically when the process
+    exits, so a crashed holder never leaks it.
+
+    Args:
+        path: Lock file to create/lock.
+
+    Returns:
+        The open lock handle, or None if another process holds the lock.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    handle = open(path, "a+")  # pylint: disable=consider-using-with
+    try:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+def unlock(handle):
+    """Release and close a handle returned by `try_lock()`."""
+    if fcntl:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    handle.close()
@@ -0,0 +1,622 @@
+"""
+Impact analysis: which scenarios does a change touch?
+
+The dependency index maps every scenario ("<feature path>::<scenario name>")
+to the code symbols it uses. Symbols are written "<path>::<qualname>", e.g.
+"pages/checkout_page.py::CheckoutPage.place_order" or
+"pages/login_page.py::LoginPage.LOGIN_BUTTON".
+
+The index is built in two layers:
+- static: an AST pass over tests/step_definitions and pages. Each step text is
+  matched to its step definition. The page-object classes, methods and
+  locators the definition uses (directly or through a fixture such as
+  `journey`) are then followed through `self.` calls, base classes, the
+  page objects a class constructs, and the module-level functions and
+  constants of pages/ they refer to (e.g. `locator()` and `xpath_to_css`
+  behind every compiled locator).
+- traced: with `--impact-trace`, every function called from repository code
+  during a test's setup and call is recorded. This picks up fixtures and
+  utils/ and api/ helpers that static analysis does not follow.
+
+Selection diffs the working tree against the merge base with a git ref and
+maps each changed hunk to the function, method or class attribute around it.
+A scenario is selected when its feature file or test module changed, or when
+it depends on a changed symbol. The whole suite runs instead when the
+impact cannot be bounded: no index, git unavailable, or a changed symbol
+that neither the static pass models nor any trace accounts for.
+"""
+
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import parse
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+STEP_DIR = os.path.join("tests", "step_definitions")
+PAGES_DIR = "pages"
+# Packages the static pass indexes. A symbol there that the pass models (see
+# indexed_symbols) but no scenario uses cannot affect any scenario.
+STATIC_PACKAGES = (STEP_DIR.replace(os.sep, "/") + "/", PAGES_DIR + "/")
+# Changes that never affect test outcomes.
+IGNORED_PATTERNS = ("*.md", "docs/*", ".github/*", "benchmarks/*", "reports/*", ".gitignore", "LICENSE*")
+STEP_DECORATORS = {"given", "when", "then", "step"}
+# Fixtures that hand steps a page-layer object, by the class they provide on the browser tier.
+FIXTURE_CLASSES = {"journey": "BrowserJourney"}
+
+
+def rel(path: str, root: str) -> str:
+    """Return a repository-relative path with forward slashes."""
+    return os.path.relpath(os.path.abspath(path), root).replace(os.sep, "/")
+
+
+# Static analysis -------------------------------------------------------------
+
+@dataclass
+class StepDefinition:
+    """One pytest-bdd step definition found by the static pass."""
+
+    kinds: Tuple[str, ...]
+    parser: str
+    pattern: str
+    symbol: str
+
+    def matches(self, kind: str, text: str) -> bool:
+        if self.kinds and kind not in self.kinds and "step" not in self.kinds:
+            return False
+        if self.parser == "string":
+            return text == self.pattern
+        if self.parser == "re":
+            return re.fullmatch(self.pattern, text) is not None
+        return _compiled(self.pattern).parse(text) is not None
+
+
+@lru_cache(maxsize=None)
+def _compiled(pattern: str):
+    return parse.compile(pattern)
+
+
+def _step_pattern(call: ast.Call) -> Optional[Tuple[str, str]]:
+    """Return (parser, pattern) for a given/when/then decorator call."""
+    if not call.args:
+        return None
+    arg = call.args[0]
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        return "string", arg.value
+    if isinstance(arg, ast.Call) and arg.args and isinstance(arg.args[0], ast.Constant):
+        name = arg.func.attr if isinstance(arg.func, ast.Attribute) else getattr(arg.func, "id", "")
+        return ("re" if name == "re" else "parse"), arg.args[0].value
+    return None
+
+
+def _decorator_name(node: ast.expr) -> str:
+    func = node.func if isinstance(node, ast.Call) else node
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return getattr(func, "id", "")
+
+
+class _UseCollector(ast.NodeVisitor):
+    """Collect page classes, `var.method()` calls and helper calls inside a function."""
+
+    def __init__(self, classes: Set[str], variables: Optional[Dict[str, str]] = None,
+                 attributes: Optional[Dict[str, str]] = None):
+        self.classes = classes
+        self.variables: Dict[str, str] = dict(variables or {})
+        self.attributes = attributes or {}
+        self.uses: Set[Tuple[str, Optional[str]]] = set()
+        self.calls: Set[str] = set()
+
+    def _class_of(self, node: ast.expr) -> Optional[str]:
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in self.classes:
+            return node.func.id
+        if isinstance(node, ast.Name):
+            if node.id in self.classes:
+                return node.id
+            return self.variables.get(node.id)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+            return self.attributes.get(node.attr)
+        return None
+
+    def visit_Assign(self, node):  # pylint: disable=invalid-name
+        owner = self._class_of(node.value)
+        if owner:
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.variables[target.id] = owner
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):  # pylint: disable=invalid-name
+        owner = self._class_of(node.value)
+        if owner:
+            self.uses.add((owner, node.attr))
+        self.generic_visit(node)
+
+    def visit_Call(self, node):  # pylint: disable=invalid-name
+        owner = self._class_of(node)
+        if owner:
+            self.uses.add((owner, None))
+        elif isinstance(node.func, ast.Name):
+            self.calls.add(node.func.id)
+        self.generic_visit(node)
+
+
+@dataclass
+class PageIndex:
+    """
+    Page-object classes: their file, bases, methods, attributes, `self.` references and uses of other pages.
+
+    Module-level functions and constants of pages/ are indexed too, as
+    "<path>::<name>" symbols: `functions` holds the module-level symbols and
+    `function_classes` the classes each one refers to, and `helpers` the
+    module-level symbols each class member refers to.
+    """
+
+    files: Dict[str, str] = field(default_factory=dict)
+    bases: Dict[str, List[str]] = field(default_factory=dict)
+    members: Dict[str, Set[str]] = field(default_factory=dict)
+    references: Dict[Tuple[str, str], Set[str]] = field(default_factory=dict)
+    uses: Dict[Tuple[str, str], Set[Tuple[str, Optional[str]]]] = field(default_factory=dict)
+    functions: Dict[str, Set[str]] = field(default_factory=dict)
+    function_classes: Dict[str, Set[str]] = field(default_factory=dict)
+    helpers: Dict[Tuple[str, str], Set[str]] = field(default_factory=dict)
+
+    def symbols(self) -> Set[str]:
+        """Return every symbol the index models: classes, their members and module-level names."""
+        symbols = set(self.functions)
+        for cls, path in self.files.items():
+            symbols.add(f"{path}::{cls}")
+            symbols.update(f"{path}::{cls}.{member}" for member in self.members.get(cls, ()))
+        return symbols
+
+    def owner(self, cls: str, member: str) -> Optional[str]:
+        """Return the class (cls or a base) that defines the member."""
+        pending = [cls]
+        while pending:
+            current = pending.pop(0)
+            if member in self.members.get(current, ()):
+                return current
+            pending.extend(self.bases.get(current, []))
+        return None
+
+    def closure(self, uses: Iterable[Tuple[str, Optional[str]]]) -> Set[str]:
+        """Return every symbol reachable from the (class, member) uses."""
+        symbols: Set[str] = set()
+        pending = list(uses)
+        helpers: List[str] = []
+        seen = set()
+        while pending or helpers:
+            if helpers:
+                helper = helpers.pop()
+                if helper in symbols or helper not in self.functions:
+                    continue
+                symbols.add(helper)
+                helpers.extend(self.functions[helper])
+                # A helper hands out instances of the classes it names (e.g. LocatorTemplate),
+                # so any of their members may run.
+                for cls in self.function_classes.get(helper, ()):
+                    pending.append((cls, None))
+                    pending.extend((cls, member) for member in self.members.get(cls, ()))
+                continue
+            cls, member = pending.pop()
+            if (cls, member) in seen or cls not in self.files:
+                continue
+            seen.add((cls, member))
+            if member is None:
+                # Constructing the page runs __init__ of the class or a base.
+                symbols.add(f"{self.files[cls]}::{cls}")
+                init_owner = self.owner(cls, "__init__")
+                if init_owner:
+                    pending.append((init_owner, "__init__"))
+                continue
+            owner = self.owner(cls, member)
+            if owner is None:
+                continue
+            symbols.add(f"{self.files[owner]}::{owner}.{member}")
+            for referenced in self.references.get((owner, member), ()):
+                pending.append((cls, referenced))
+            pending.extend(self.uses.get((owner, member), ()))
+            helpers.extend(self.helpers.get((owner, member), ()))
+        return symbols
+
+
+def _module_names(tree: ast.Module) -> Dict[str, ast.stmt]:
+    """Return the module-level functions and assigned constants of a module, by name."""
+    names = {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            names[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names.update((t.id, node) for t in targets if isinstance(t, ast.Name))
+    return names
+
+
+def _page_imports(tree: ast.Module, modules: Dict[str, Dict[str, ast.stmt]]) -> Dict[str, str]:
+    """Map names imported from other pages/ modules to their "<path>::<name>" symbols."""
+    imported = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom) or not node.module:
+            continue
+        if node.level == 1:
+            module = node.module
+        elif node.level == 0 and node.module.startswith(PAGES_DIR + "."):
+            module = node.module[len(PAGES_DIR) + 1:]
+        else:
+            continue
+        path = f"{PAGES_DIR}/{module.replace('.', '/')}.py"
+        for alias in node.names:
+            if alias.name in modules.get(path, {}):
+                imported[alias.asname or alias.name] = f"{path}::{alias.name}"
+    return imported
+
+
+def _names_used(node: ast.AST, scope: Dict[str, str], classes: Set[str]) -> Tuple[Set[str], Set[str]]:
+    """Return the module-level symbols (from scope) and the classes a node refers to by name."""
+    names = {sub.id for sub in ast.walk(node) if isinstance(sub, ast.Name)}
+    return {scope[name] for name in names if name in scope}, names & classes
+
+
+def index_pages(root: str) -> PageIndex:
+    """Parse every module under pages/ into a PageIndex."""
+    pages = PageIndex()
+    directory = os.path.join(root, PAGES_DIR)
+    classes = []
+    trees: Dict[str, ast.Module] = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".py"):
+            continue
+        path = os.path.join(directory, name)
+        with open(path, encoding="utf8") as handle:
+            tree = ast.parse(handle.read(), path)
+        trees[rel(path, root)] = tree
+        classes.extend((node, rel(path, root)) for node in tree.body if isinstance(node, ast.ClassDef))
+    pages.files = {node.name: path for node, path in classes}
+    known = set(pages.files)
+
+    # Module-level names each module can see: its own, plus those imported from other pages modules.
+    modules = {path: _module_names(tree) for path, tree in trees.items()}
+    scopes = {}
+    for path, tree in trees.items():
+        scopes[path] = dict(_page_imports(tree, modules), **{name: f"{path}::{name}" for name in modules[path]})
+        for name, node in modules[path].items():
+            symbol = f"{path}::{name}"
+            used, named_classes = _names_used(node, scopes[path], known)
+            pages.functions[symbol] = used - {symbol}
+            pages.function_classes[symbol] = named_classes
+
+    for node, path in classes:
+        pages.bases[node.name] = [b.id for b in node.bases if isinstance(b, ast.Name)]
+        members = pages.members.setdefault(node.name, set())
+        # Attributes holding other page objects, e.g. `self.cart_page = CartPage(driver)`.
+        attributes = {
+            target.attr: sub.value.func.id
+            for sub in ast.walk(node) if isinstance(sub, ast.Assign)
+            and isinstance(sub.value, ast.Call) and getattr(sub.value.func, "id", None) in known
+            for target in sub.targets
+            if isinstance(target, ast.Attribute) and getattr(target.value, "id", None) == "self"
+        }
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                members.add(item.name)
+                refs = {
+                    sub.attr for sub in ast.walk(item)
+                    if isinstance(sub, ast.Attribute) and isinstance(sub.value, ast.Name)
+                    and sub.value.id in ("self", "cls", node.name)
+                }
+                pages.references[(node.name, item.name)] = refs
+                collector = _UseCollector(known - {node.name}, attributes=attributes)
+                collector.visit(item)
+                pages.uses[(node.name, item.name)] = collector.uses
+                pages.helpers[(node.name, item.name)] = _names_used(item, scopes[path], known)[0]
+            elif isinstance(item, (ast.Assign, ast.AnnAssign)):
+                targets = item.targets if isinstance(item, ast.Assign) else [item.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        members.add(target.id)
+                        # e.g. `LOGIN_BUTTON = locator(...)` depends on locator() and what it calls.
+                        pages.helpers[(node.name, target.id)] = _names_used(item, scopes[path], known)[0]
+    return pages
+
+
+def index_steps(root: str, pages: PageIndex) -> List[Tuple[StepDefinition, Set[str]]]:
+    """Return every step definition with the symbols it depends on."""
+    steps = []
+    directory = os.path.join(root, STEP_DIR)
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".py"):
+            continue
+        path = os.path.join(directory, name)
+        with open(path, encoding="utf8") as handle:
+            tree = ast.parse(handle.read(), path)
+        module = rel(path, root)
+        functions = {n.name: n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        for function in functions.values():
+            decorators = [d for d in function.decorator_list
+                          if isinstance(d, ast.Call) and _decorator_name(d) in STEP_DECORATORS]
+            if not decorators:
+                continue
+            symbols, uses = {f"{module}::{function.name}"}, set()
+            pending, visited = [function.name], set()
+            while pending:
+                current = pending.pop()
+                if current in visited:
+                    continue
+                visited.add(current)
+                symbols.add(f"{module}::{current}")
+                arguments = {arg.arg for arg in functions[current].args.args}
+                collector = _UseCollector(
+                    set(pages.files),
+                    variables={name: cls for name, cls in FIXTURE_CLASSES.items() if name in arguments},
+                )
+                collector.visit(functions[current])
+                uses |= collector.uses
+                uses |= {(cls, None) for cls in collector.variables.values() if cls in FIXTURE_CLASSES.values()}
+                pending.extend(call for call in collector.calls if call in functions)
+            symbols |= pages.closure(uses)
+            for decorator in decorators:
+                pattern = _step_pattern(decorator)
+                if pattern:
+                    kinds = (_decorator_name(decorator),)
+                    steps.append((StepDefinition(kinds, pattern[0], pattern[1], f"{module}::{function.name}"), symbols))
+    return steps
+
+
+def indexed_symbols(root: str) -> Set[str]:
+    """
+    Return every symbol the static pass models.
+
+    That is each page-object class and member, each module-level function
+    and constant of pages/, and each step definition with the module
+    functions it calls. A changed symbol in STATIC_PACKAGES outside this set
+    (a fixture, a helper class in a step module) has unknown impact.
+    """
+    pages = index_pages(root)
+    symbols = pages.symbols()
+    for _, used in index_steps(root, pages):
+        symbols |= used
+    return symbols
+
+
+def static_dependencies(root: str, scenarios: Dict[str, List[Tuple[str, str]]]) -> Dict[str, List[str]]:
+    """
+    Map each scenario to the symbols used by its steps.
+
+    Args:
+        root: Repository root.
+        scenarios: Steps per scenario key, as (type, text) pairs.
+    """
+    pages = index_pages(root)
+    steps = index_steps(root, pages)
+    result = {}
+    for key, scenario_steps in scenarios.items():
+        symbols: Set[str] = set()
+        for kind, text in scenario_steps:
+            for definition, used in steps:
+                if definition.matches(kind, text):
+                    symbols |= used
+                    break
+            else:
+                logger.debug("No step definition found for '%s %s' in %s", kind, text, key)
+        result[key] = sorted(symbols)
+    return result
+
+
+# Runtime tracing -------------------------------------------------------------
+
+class CallTracer:
+    """Record the repository functions called while enabled (via sys.setprofile)."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root) + os.sep
+        self.calls: Set[str] = set()
+        self._files: Dict[str, Optional[str]] = {}
+
+    def _relative(self, filename: str) -> Optional[str]:
+        cached = self._files.get(filename, False)
+        if cached is not False:
+            return cached
+        absolute = os.path.abspath(filename)
+        inside = absolute.startswith(self.root) and "site-packages" not in absolute
+        value = rel(absolute, self.root) if inside else None
+        self._files[filename] = value
+        return value
+
+    def __call__(self, frame, event, arg):
+        if event != "call":
+            return
+        code = frame.f_code
+        path = self._relative(code.co_filename)
+        if path:
+            self.calls.add(f"{path}::{getattr(code, 'co_qualname', code.co_name)}")
+
+
+# Index persistence -------------------------------------------------------------
+
+def load_index(path: str) -> dict:
+    """Return the stored index, or an empty one if missing or from another version."""
+    try:
+        with open(path) as handle:
+            index = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return index if index.get("version") == INDEX_VERSION else {}
+
+
+def selection_index(stored: dict, static: Dict[str, List[str]]) -> dict:
+    """
+    Return the stored index with this run's static layer on top.
+
+    An empty stored index stays empty, so selection falls back to a full run
+    until a run has written the index (with its traces, when enabled).
+    """
+    if not stored:
+        return {}
+    return dict(stored, version=INDEX_VERSION, static=dict(stored.get("static", {}), **static))
+
+
+def dependencies(index: dict, key: str) -> Set[str]:
+    """Return the static and traced symbols of one scenario."""
+    return set(index.get("static", {}).get(key, [])) | set(index.get("traced", {}).get(key, []))
+
+
+# Change detection --------------------------------------------------------------
+
+def _git(root: str, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True).stdout
+
+
+def symbol_ranges(path: str) -> List[Tuple[int, int, str]]:
+    """Return (first line, last line, qualname) for every function, method and class attribute."""
+    with open(path, encoding="utf8") as handle:
+        tree = ast.parse(handle.read(), path)
+    ranges = []
+
+    def visit(body, prefix):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                ranges.append((start, node.end_lineno, prefix + node.name))
+            elif isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+            elif prefix and isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        ranges.append((node.lineno, node.end_lineno, prefix + target.id))
+
+    visit(tree.body, "")
+    return ranges
+
+
+@dataclass
+class ChangeSet:
+    """Files and symbols changed relative to a base ref."""
+
+    files: Set[str] = field(default_factory=set)
+    symbols: Set[str] = field(default_factory=set)
+    # Python files changed outside any function/attribute (imports, module code) or removed.
+    whole_files: Set[str] = field(default_factory=set)
+
+
+def changed_since(root: str, base: str) -> ChangeSet:
+    """
+    Return what changed between the merge base with `base` and the working tree.
+
+    Raises:
+        subprocess.CalledProcessError: If git cannot compute the diff.
+        FileNotFoundError: If git is not installed.
+    """
+    merge_base = _git(root, "merge-base", base, "HEAD").strip()
+    diff = _git(root, "diff", "--no-color", "--no-renames", "-U0", merge_base)
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard").split()
+    changes = ChangeSet()
+    lines: Dict[str, Set[int]] = {}
+    current = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git"):
+            current = line.split(" b/", 1)[1]
+            changes.files.add(current)
+            lines.setdefault(current, set())
+        elif line.startswith("@@") and current:
+            match = re.match(r"@@ -\S+ \+(\d+)(?:,(\d+))? @@", line)
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # A pure deletion is attributed to the line it was removed after.
+            lines[current].update(range(start, start + count) if count else {max(start, 1)})
+    for path in untracked:
+        changes.files.add(path)
+        changes.whole_files.add(path)
+    for path, changed_lines in lines.items():
+        if not path.endswith(".py"):
+            continue
+        absolute = os.path.join(root, path)
+        if not os.path.exists(absolute):
+            changes.whole_files.add(path)
+            continue
+        try:
+            ranges = symbol_ranges(absolute)
+        except SyntaxError:
+            changes.whole_files.add(path)
+            continue
+        for number in changed_lines:
+            owners = [name for start, end, name in ranges if start <= number <= end]
+            if owners:
+                changes.symbols.update(f"{path}::{name}" for name in owners)
+            else:
+                changes.whole_files.add(path)
+    return changes
+
+
+# Selection -------------------------------------------------------------------
+
+@dataclass
+class Selection:
+    """Outcome of impact selection."""
+
+    full_run: bool
+    reason: str
+    selected: Set[str] = field(default_factory=set)
+
+
+def select(index: dict, changes: ChangeSet, scenarios: Dict[str, Set[str]],
+           indexed: Iterable[str] = ()) -> Selection:
+    """
+    Decide which scenarios to run.
+
+    Args:
+        index: Dependency index (see selection_index).
+        changes: What changed (see changed_since).
+        scenarios: Per scenario key, the files that define it (feature file
+                   and test module).
+        indexed: Symbols the static pass models (see indexed_symbols). A
+                 changed one that no scenario uses is known to be unused;
+                 any other unknown changed symbol forces a full run.
+    """
+    if not index:
+        return Selection(True, "no dependency index yet")
+    known: Set[str] = set()
+    for key in scenarios:
+        known |= dependencies(index, key)
+    known_files = {symbol.split("::", 1)[0] for symbol in known}
+
+    for path in sorted(changes.whole_files | {s.split("::", 1)[0] for s in changes.symbols}):
+        if any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED_PATTERNS):
+            continue
+        statically_covered = path.startswith(STATIC_PACKAGES)
+        if path in changes.whole_files and not statically_covered and path not in known_files:
+            return Selection(True, f"{path} changed outside the indexed code")
+    for path in sorted(changes.files):
+        if path.endswith(".py") or any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED_PATTERNS):
+            continue
+        if not any(path in files for files in scenarios.values()):
+            return Selection(True, f"{path} changed and is not mapped to scenarios")
+    indexed = set(indexed)
+    scenario_files = set().union(*scenarios.values()) if scenarios else set()
+    for symbol in sorted(changes.symbols):
+        path = symbol.split("::", 1)[0]
+        if any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED_PATTERNS):
+            continue
+        if symbol in known or symbol in indexed or path in scenario_files:
+            continue
+        if path.startswith(STATIC_PACKAGES):
+            return Selection(True, f"{symbol} changed and the static index does not model it")
+        return Selection(True, f"{symbol} changed and no recorded scenario uses it")
+
+    selected = set()
+    for key, files in scenarios.items():
+        deps = dependencies(index, key)
+        if files & changes.files or deps & changes.symbols or \
+                any(symbol.split("::", 1)[0] in changes.whole_files for symbol in deps):
+            selected.add(key)
+    return Selection(False, f"{len(selected)} of {len(scenarios)} scenario(s) impacted", selected)
@@ -0,0 +1,289 @@
+"""
+Page-load profiles: resource blocking, page load strategy and readiness.
+
+Most scenarios never look at product images, web fonts or analytics, yet a
+normal page load waits for all of them. A load profile decides:
+- which requests are blocked: resource types (image, font, media,
+  stylesheet) and URL patterns such as third-party analytics hosts
+- the `pageLoadStrategy` of new sessions ("normal", "eager" or "none")
+- which `document.readyState` values count as loaded; BasePage.open waits
+  for it, and for the app root to render, instead of relying on the strategy
+
+Blocking is applied in one of two ways:
+- Local Chrome uses CDP `Network.setBlockedURLs`. This can be switched for
+  each test, so a pooled session can go back to a full load.
+- Firefox and remote sessions have no CDP. Blocking is set when the session
+  starts, through Firefox preferences or Chrome's image preference and
+  host-resolver rules. URL patterns are reduced to their host names.
+
+Every navigation records the bytes transferred (Resource Timing) and the
+wall time until ready. tests/plugins/load_profiles.py compares them with a
+baseline built from full-profile loads to report what each profile saves.
+"""
+
+import weakref
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+FULL = "full"
+
+# URL patterns (Network.setBlockedURLs syntax, "*" wildcards) per resource type.
+RESOURCE_PATTERNS = {
+    "image": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"),
+    "font": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    "media": ("*.mp4", "*.webm", "*.mp3", "*.ogg"),
+    "stylesheet": ("*.css",),
+}
+
+THIRD_PARTY = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*fullstory.com*",
+)
+
+# Firefox preferences that block a resource type for the whole session.
+FIREFOX_TYPE_PREFS = {
+    "image": {"permissions.default.image": 2},
+    "font": {"browser.display.use_document_fonts": 0},
+    "media": {"media.autoplay.default": 5, "media.preload.default": 0},
+}
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """What a session downloads and when a navigation counts as loaded."""
+
+    name: str
+    page_load_strategy: str = "normal"
+    ready_states: Tuple[str, ...] = ("complete",)
+    block_types: Tuple[str, ...] = ()
+    block_patterns: Tuple[str, ...] = ()
+
+    def url_patterns(self) -> List[str]:
+        """Return every blocked URL pattern, resource types included."""
+        patterns = [p for kind in self.block_types for p in RESOURCE_PATTERNS.get(kind, ())]
+        return patterns + list(self.block_patterns)
+
+    def blocked_hosts(self) -> List[str]:
+        """Return the host names in the URL patterns, e.g. "*hotjar.com*" -> "hotjar.com"."""
+        hosts = []
+        for pattern in self.block_patterns:
+            host = pattern.strip("*").split("/")[0].lstrip(".")
+            if host and "*" not in host and "." in host and host not in hosts:
+                hosts.append(host)
+        return hosts
+
+
+PROFILES = {
+    FULL: LoadProfile(FULL),
+    "fast": LoadProfile(
+        "fast",
+        page_load_strategy="eager",
+        ready_states=("interactive", "complete"),
+        block_types=("image", "font", "media"),
+        block_patterns=THIRD_PARTY,
+    ),
+}
+
+
+def resolve_profile(config: dict, full_load: bool = False) -> LoadProfile:
+    """
+    Return the profile for a test.
+
+    Args:
+        config: Runtime configuration (`load_profile`, `load_block_patterns`).
+        full_load: The test opted into full page loads (the `full_load` marker).
+
+    Raises:
+        ValueError: If `load_profile` names an unknown profile.
+    """
+    name = FULL if full_load else (config.get("load_profile") or FULL).lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unsupported load_profile '{name}'. Use: {', '.join(PROFILES)}.")
+    profile = PROFILES[name]
+    extra = tuple(p.strip() for p in (config.get("load_block_patterns") or "").split(",") if p.strip())
+    if extra and name != FULL:
+        profile = replace(profile, block_patterns=profile.block_patterns + extra)
+    return profile
+
+
+def configure_options(options, profile: LoadProfile, browser: str, runtime_blocking: bool):
+    """
+    Apply the launch-time part of a profile to Chrome or Firefox options.
+
+    Args:
+        options: ChromeOptions or FirefoxOptions for the new session.
+        profile: Profile to apply.
+        browser: Browser name; only the "chrome"/"firefox" prefix matters.
+        runtime_blocking: True when blocking will be applied later through CDP,
+                          so nothing is blocked at launch.
+    """
+    options.page_load_strategy = profile.page_load_strategy
+    if runtime_blocking:
+        return
+    hosts = profile.blocked_hosts()
+    if browser.lower().startswith("firefox"):
+        for kind in profile.block_types:
+            for pref, value in FIREFOX_TYPE_PREFS.get(kind, {}).items():
+                options.set_preference(pref, value)
+        if hosts:
+            # Resolving the hosts to localhost makes their requests fail at once.
+            options.set_preference("network.dns.localDomains", ",".join(hosts))
+        return
+    if "image" in profile.block_types:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if hosts:
+        rules = ", ".join(f"MAP {host} 127.0.0.1, MAP *.{host} 127.0.0.1" for host in hosts)
+        options.add_argument(f"--host-resolver-rules={rules}")
+
+
+@dataclass
+class ProfileState:
+    """The profile a session was launched with, the one in effect and the URLs blocked through CDP."""
+
+    launched: LoadProfile
+    active: LoadProfile
+    blocked: Optional[List[str]] = None
+
+
+_states: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def launched_with(driver, profile: LoadProfile):
+    """Record the profile a new session was started with."""
+    _states[driver] = ProfileState(profile, profile)
+
+
+def active_profile(driver) -> LoadProfile:
+    """Return the profile in effect for the session (full when unknown)."""
+    state = _states.get(driver)
+    return state.active if state else PROFILES[FULL]
+
+
+def supports_runtime_blocking(driver) -> bool:
+    """Return True if blocking can be switched on a live session (local Chromium)."""
+    return hasattr(driver, "execute_cdp_cmd")
+
+
+def apply_profile(driver, profile: LoadProfile) -> bool:
+    """
+    Switch a live session to the profile.
+
+    Chromium sessions switch request blocking through CDP; the readiness rule
+    always follows the new profile. Other sessions can only run the profile
+    they were launched with.
+
+    Returns:
+        False if the session cannot run the profile and a new one is needed.
+    """
+    state = _states.get(driver)
+    if state is None:
+        state = ProfileState(PROFILES[FULL], PROFILES[FULL])
+        _states[driver] = state
+    patterns = profile.url_patterns()
+    if not supports_runtime_blocking(driver):
+        if state.launched.url_patterns() != patterns:
+            return False
+    elif state.blocked != patterns:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as exc:
+            logger.warning("Could not apply load profile '%s': %s", profile.name, exc.msg)
+            return False
+        state.blocked = patterns
+    state.active = profile
+    return True
+
+
+# Checks readiness and, once ready, reports what the navigation transferred.
+# Cross-origin resources without Timing-Allow-Origin report a transferSize of 0.
+READY_SCRIPT = """
+const states = arguments[0];
+if (!states.includes(document.readyState)) return null;
+const root = document.getElementById('__next');
+if (root && !root.childElementCount) return null;
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {
+    bytes: entries.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+    requests: entries.length,
+};
+"""
+
+
+@dataclass
+class LoadStats:
+    """Navigations recorded by this process."""
+
+    navigations: List[dict] = field(default_factory=list)
+
+    def record(self, profile: LoadProfile, url: str, seconds: float, bytes_: int, requests: int):
+        self.navigations.append({
+            "profile": profile.name,
+            "path": urlparse(url).path or "/",
+            "seconds": round(seconds, 4),
+            "bytes": bytes_,
+            "requests": requests,
+        })
+
+
+def summarise_navigations(navigations: List[dict], baseline: Dict[str, dict]) -> Dict[str, dict]:
+    """
+    Return per-profile means of bytes and time, and the savings against the baseline.
+
+    Args:
+        navigations: Recorded navigations (see LoadStats.record).
+        baseline: Mean bytes/seconds of full loads per path.
+    """
+    summary: Dict[str, dict] = {}
+    for nav in navigations:
+        row = summary.setdefault(nav["profile"], {
+            "navigations": 0, "bytes": 0, "seconds": 0.0,
+            "compared": 0, "bytes_saved": 0, "seconds_saved": 0.0,
+        })
+        row["navigations"] += 1
+        row["bytes"] += nav["bytes"]
+        row["seconds"] += nav["seconds"]
+        full = baseline.get(nav["path"])
+        if full and nav["profile"] != FULL:
+            row["compared"] += 1
+            row["bytes_saved"] += full["bytes"] - nav["bytes"]
+            row["seconds_saved"] += full["seconds"] - nav["seconds"]
+    for row in summary.values():
+        count, compared = row["navigations"], row.pop("compared")
+        row["mean_bytes"] = round(row.pop("bytes") / count)
+        row["mean_seconds"] = round(row.pop("seconds") / count, 3)
+        total_bytes, total_seconds = row.pop("bytes_saved"), row.pop("seconds_saved")
+        row["bytes_saved_per_navigation"] = round(total_bytes / compared) if compared else None
+        row["seconds_saved_per_navigation"] = round(total_seconds / compared, 3) if compared else None
+    return summary
+
+
+def update_baseline(baseline: Dict[str, dict], navigations: List[dict], weight: float = 0.2) -> Dict[str, dict]:
+    """Fold full-profile navigations into the per-path baseline (exponential moving average)."""
+    for nav in navigations:
+        if nav["profile"] != FULL:
+            continue
+        current = baseline.get(nav["path"])
+        if current is None:
+            baseline[nav["path"]] = {"bytes": nav["bytes"], "seconds": nav["seconds"], "samples": 1}
+            continue
+        current["bytes"] = round(current["bytes"] + weight * (nav["bytes"] - current["bytes"]))
+        current["seconds"] = round(current["seconds"] + weight * (nav["seconds"] - current["seconds"]), 4)
+        current["samples"] += 1
+    return baseline
+
+
+stats = LoadStats()
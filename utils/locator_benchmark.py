@@ -0,0 +1,189 @@
+"""
+Offline benchmark for the page-object locator registry.
+
+Every locator declared through pages.locators is timed inside a local browser
+against saved DOM snapshots (benchmarks/snapshots/*.html, loaded via file://,
+so no network is needed). Lookups run in a JavaScript loop so the numbers
+reflect the browser's selector engine rather than WebDriver round trips.
+
+A locator is flagged when:
+- "slow": its worst lookup is more than --max-ratio times the median CSS/id
+  lookup on the same snapshot, or above --budget-ms when given
+- "mismatch": its compiled (CSS) form matches a different number of elements
+  than the XPath it was declared with
+- "unmatched": it matches nothing in any snapshot (reported, not failed;
+  the snapshots may not cover that page)
+
+Usage:
+    python -m utils.locator_benchmark [--snapshots DIR] [--iterations N]
+
+The exit status is 1 when any locator is mismatched. Slow locators are only
+reported, since timing ratios are noisy on shared CI runners, unless
+--fail-on-slow is given.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import statistics
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from selenium.webdriver.common.by import By
+
+import pages
+from pages.base_page import to_script_locator
+from pages.locators import REGISTRY, StaticLocator
+from utils.config import load_config
+from utils.driver_factory import get_local_driver
+from utils.file_lock import atomic_write
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_SNAPSHOTS = os.path.join("benchmarks", "snapshots")
+DEFAULT_OUTPUT = os.path.join("reports", "locator_benchmark.json")
+
+# Runs one lookup strategy repeatedly and returns the match count and the mean
+# time per lookup in milliseconds.
+BENCHMARK_SCRIPT = """
+const [strategy, value, iterations] = arguments;
+const run = strategy === 'xpath'
+    ? () => document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+    : () => document.querySelectorAll(value).length;
+const matches = run();
+const start = performance.now();
+for (let i = 0; i < iterations; i++) run();
+return {matches: matches, ms: (performance.now() - start) / iterations};
+"""
+
+
+def load_registry() -> Dict[str, object]:
+    """Import every page module so all locator declarations are registered."""
+    for module in pkgutil.iter_modules(pages.__path__):
+        importlib.import_module(f"pages.{module.name}")
+    return REGISTRY
+
+
+def forms(entry) -> Dict[str, tuple]:
+    """Return the declared and compiled forms of a registry entry."""
+    if isinstance(entry, StaticLocator):
+        return {"declared": entry.source, "compiled": entry.compiled}
+    return {"declared": entry.source(**entry.example), "compiled": entry(**entry.example)}
+
+
+def time_locator(driver, locator, iterations: int) -> dict:
+    strategy, value = to_script_locator(locator)
+    return driver.execute_script(BENCHMARK_SCRIPT, strategy, value, iterations)
+
+
+def run_benchmark(driver, snapshots: List[Path], iterations: int) -> Dict[str, dict]:
+    """
+    Time every registered locator on every snapshot.
+
+    Returns:
+        Per locator: declared/compiled forms and, per snapshot, the match
+        count and ms per lookup of each form.
+    """
+    registry = load_registry()
+    results = {name: {"forms": forms(entry), "snapshots": {}} for name, entry in registry.items()}
+    for snapshot in snapshots:
+        driver.get(snapshot.resolve().as_uri())
+        for name, result in results.items():
+            timings = {}
+            for label, locator in result["forms"].items():
+                if label == "declared" and locator == result["forms"]["compiled"]:
+                    continue
+                timings[label] = time_locator(driver, locator, iterations)
+            result["snapshots"][snapshot.stem] = timings
+    return results
+
+
+def flag(results: Dict[str, dict], max_ratio: float, budget_ms: float = None) -> Dict[str, List[str]]:
+    """Return the flags raised for each locator (see module docstring)."""
+    baselines = {}
+    for snapshot in {s for result in results.values() for s in result["snapshots"]}:
+        fast = [
+            result["snapshots"][snapshot]["compiled"]["ms"]
+            for result in results.values()
+            if result["forms"]["compiled"][0] in (By.CSS_SELECTOR, By.ID)
+        ]
+        baselines[snapshot] = statistics.median(fast) if fast else 0.0
+
+    flags = {}
+    for name, result in results.items():
+        raised = []
+        compiled = {s: t["compiled"] for s, t in result["snapshots"].items()}
+        slow = any(
+            (baselines[s] and t["ms"] > max_ratio * baselines[s]) or (budget_ms and t["ms"] > budget_ms)
+            for s, t in compiled.items()
+        )
+        if slow:
+            raised.append("slow")
+        if any("declared" in t and t["declared"]["matches"] != t["compiled"]["matches"]
+               for t in result["snapshots"].values()):
+            raised.append("mismatch")
+        if not any(t["matches"] for t in compiled.values()):
+            raised.append("unmatched")
+        flags[name] = raised
+    return flags
+
+
+def print_table(results: Dict[str, dict], flags: Dict[str, List[str]]):
+    print(f"{'locator':40} {'strategy':13} {'worst ms':>9} {'declared ms':>12}  flags")
+    for name, result in sorted(results.items()):
+        timings = result["snapshots"].values()
+        worst = max((t["compiled"]["ms"] for t in timings), default=0.0)
+        declared = [t["declared"]["ms"] for t in timings if "declared" in t]
+        declared_ms = f"{max(declared):12.4f}" if declared else f"{'-':>12}"
+        strategy = result["forms"]["compiled"][0]
+        print(f"{name:40} {strategy:13} {worst:9.4f} {declared_ms}  {', '.join(flags[name])}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time every registered locator against saved DOM snapshots.")
+    parser.add_argument("--snapshots", default=DEFAULT_SNAPSHOTS, help="Directory of *.html DOM snapshots")
+    parser.add_argument("--iterations", type=int, default=500, help="Lookups per locator and snapshot")
+    parser.add_argument("--max-ratio", type=float, default=10.0,
+                        help="Flag locators slower than this multiple of the median CSS/id lookup")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Optional absolute budget per lookup")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--fail-on-slow", action="store_true", help="Also exit 1 when a locator is flagged slow")
+    args = parser.parse_args(argv)
+
+    snapshots = sorted(Path(args.snapshots).glob("*.html"))
+    if not snapshots:
+        parser.error(f"no *.html snapshots found in {args.snapshots}")
+
+    config = load_config()
+    # Snapshots are local files, so the benchmark always drives a local browser.
+    driver = get_local_driver(config.get("browser", "chrome-headless"), config)
+    try:
+        results = run_benchmark(driver, snapshots, args.iterations)
+    finally:
+        driver.quit()
+
+    flags = flag(results, args.max_ratio, args.budget_ms)
+    print_table(results, flags)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    atomic_write(args.output, json.dumps(
+        {name: dict(result, flags=flags[name]) for name, result in results.items()}, indent=2))
+    logger.info("Locator benchmark written to %s", args.output)
+
+    slow = sorted(name for name, raised in flags.items() if "slow" in raised)
+    if slow and not args.fail_on_slow:
+        logger.warning("Slow locators (reported only): %s", ", ".join(slow))
+    failing_flags = {"slow", "mismatch"} if args.fail_on_slow else {"mismatch"}
+    failing = sorted(name for name, raised in flags.items() if failing_flags & set(raised))
+    if failing:
+        logger.error("Locators needing attention: %s", ", ".join(failing))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,232 @@
 """
-Lightweight logging helper for the test framework.
+Logging for the test framework.
 
-The goal of this module is to provide a simple logger that can be reused
-across page objects and utilities without repeated configuration.
+Every framework logger ("pages.cart_page", "utils.timing", ...) hands its
+records to one QueueHandler per process. A QueueListener thread writes them,
+so a test thread never blocks on console or file I/O. Records go:
+- to the console, in the usual text format
+- as JSON lines to the process's log file, once `open_log_file` has been
+  called (tests/plugins/logs.py opens one file per xdist worker and merges
+  them into one ordered log at the end of the session)
+
+`configure_logging` applies the per-subsystem levels ("pages=DEBUG,
+utils.timing=WARNING") and the DEBUG sampling rate: keep 1 in N records of
+each debug message template. Loggers are called with %-style arguments
+(`logger.info("Added %s to cart", name)`), so a record that is filtered out
+or sampled away is never formatted.
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+DEFAULT_LEVEL = logging.INFO
+
+
+class RecordFilter(logging.Filter):
+    """
+    Sample DEBUG records and stamp every record with the running test.
+
+    Runs in the calling thread, before the record is queued or formatted.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.debug_sample = 1
+        self.test: Optional[str] = None
+        self._seen: Dict[tuple, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno <= logging.DEBUG and self.debug_sample > 1:
+            key = (record.name, record.msg)
+            count = self._seen.get(key, 0)
+            self._seen[key] = count + 1
+            if count % self.debug_sample:
+                return False
+        record.test = self.test
+        return True
+
+
+class JsonLinesHandler(logging.Handler):
+    """Write records as JSON lines to a file; records are dropped until a file is opened."""
+
+    def __init__(self):
+        super().__init__()
+        self.worker = "main"
+        self.path: Optional[str] = None
+        self._stream = None
+        self._seq = 0
+
+    def open(self, path: str, worker: str):
+        self.close_stream()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path, self.worker = path, worker
+        self._stream = open(path, "a", encoding="utf8")  # pylint: disable=consider-using-with
+
+    def close_stream(self):
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+    def emit(self, record: logging.LogRecord):
+        if self._stream is None:
+            return
+        self._seq += 1
+        entry = {
+            "ts": record.created,
+            "worker": self.worker,
+            "seq": self._seq,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        test = getattr(record, "test", None)
+        if test:
+            entry["test"] = test
+        self._stream.write(json.dumps(entry) + "\n")
+
+    def flush(self):
+        if self._stream:
+            self._stream.flush()
+
+
+class _Pipeline:
+    """The process-wide queue, its listener thread and the handlers it feeds."""
+
+    def __init__(self):
+        self.queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.filter = RecordFilter()
+        self.handler = QueueHandler(self.queue)
+        self.handler.addFilter(self.filter)
+        self.console = logging.StreamHandler()
+        self.console.setFormatter(logging.Formatter(TEXT_FORMAT))
+        self.jsonl = JsonLinesHandler()
+        self.listener = QueueListener(self.queue, self.console, self.jsonl, respect_handler_level=True)
+        self.listener.start()
+        self.roots: set = set()
+        self.level = DEFAULT_LEVEL
+        self.lock = threading.Lock()
+        atexit.register(self.stop)
+
+    @contextmanager
+    def paused(self):
+        """Drain the queue and hold the listener while the block runs."""
+        with self.lock:
+            self.listener.stop()
+            try:
+                yield
+            finally:
+                self.listener.start()
+
+    def stop(self):
+        with self.lock:
+            if self.listener._thread is not None:  # pylint: disable=protected-access
+                self.listener.stop()
+            self.jsonl.flush()
+
+
+_pipeline: Optional[_Pipeline] = None
+
+
+def _get_pipeline() -> _Pipeline:
+    global _pipeline  # pylint: disable=global-statement
+    if _pipeline is None:
+        _pipeline = _Pipeline()
+    return _pipeline
 
 
 def get_logger(name: str = "test_logger") -> logging.Logger:
     """
-    Return a configured logger instance.
+    Return a logger that writes through the framework's queue.
 
-    The logger writes messages to the standard output stream and is intended
-    for ad-hoc debugging and traceability when running tests locally or in CI.
+    The queue handler is attached once to the top-level logger of the name
+    ("pages" for "pages.cart_page"), which defaults to `log_level` (INFO);
+    child loggers inherit it.
 
     Args:
         name: Name of the logger to create or retrieve.
 
     Returns:
-        A configured logging.Logger instance.
-    """
-    logger = logging.getLogger(name)
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    return logger
+        A logging.Logger instance.
+    """
+    pipeline = _get_pipeline()
+    root = name.split(".")[0]
+    with pipeline.lock:
+        if root not in pipeline.roots:
+            top = logging.getLogger(root)
+            top.addHandler(pipeline.handler)
+            if top.level == logging.NOTSET:
+                top.setLevel(pipeline.level)
+            pipeline.roots.add(root)
+    return logging.getLogger(name)
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """
+    Parse "pages=DEBUG,utils.timing=WARNING" into {logger name: level}.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown level.
+    """
+    levels = {}
+    for entry in (spec or "").split(","):
+        if not entry.strip():
+            continue
+        name, sep, level = entry.partition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if not sep or not name.strip() or not isinstance(value, int):
+            raise ValueError(f"Invalid log_levels entry '{entry.strip()}'. Use <logger>=<LEVEL>.")
+        levels[name.strip()] = value
+    return levels
+
+
+def configure_logging(config: dict):
+    """
+    Apply the logging settings from the runtime configuration.
+
+    Args:
+        config: Settings with `log_level` (default level of every framework
+                package), `log_levels` (per-subsystem overrides) and
+                `log_debug_sample` (keep 1 in N of each DEBUG message).
+
+    Raises:
+        ValueError: If a level is unknown.
+    """
+    pipeline = _get_pipeline()
+    default = logging.getLevelName(str(config.get("log_level") or "INFO").upper())
+    if not isinstance(default, int):
+        raise ValueError(f"Unknown log_level '{config.get('log_level')}'")
+    pipeline.level = default
+    for root in list(pipeline.roots):
+        logging.getLogger(root).setLevel(default)
+    for name, level in parse_levels(config.get("log_levels", "")).items():
+        get_logger(name).setLevel(level)
+    pipeline.filter.debug_sample = max(int(config.get("log_debug_sample") or 1), 1)
+
+
+def open_log_file(path: str, worker: str):
+    """Start writing this process's records as JSON lines to path."""
+    pipeline = _get_pipeline()
+    with pipeline.paused():
+        pipeline.jsonl.open(path, worker)
+
+
+def close_log_file():
+    """Write out everything queued so far and close the JSON lines file."""
+    pipeline = _get_pipeline()
+    with pipeline.paused():
+        pipeline.jsonl.close_stream()
+
+
+def set_log_context(test: Optional[str]):
+    """Stamp the records that follow with the running test's node id (None to clear)."""
+    _get_pipeline().filter.test = test
@@ -0,0 +1,232 @@
+"""
+Capability matrix and Selenium Grid session budgeting.
+
+The matrix is the list of browser/OS capability sets every scenario should
+run against. On a Grid, sessions are rationed through file-lock leases shared
+by every process on the machine:
+- one "budget" lease per in-flight session, capped by the configured session
+  budget
+- one lease per browser family, capped by the Grid capacity for that browser
+  after applying the per-node cap
+
+The Grid places each new session on its least loaded node, so keeping the
+total at or below nodes x per-node cap keeps every node within the cap.
+
+A process that cannot get both leases waits (queues) until another session
+quits instead of asking the Grid for a session it cannot serve.
+"""
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import requests
+
+from utils.file_lock import atomic_write, try_lock, unlock
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# Sample BrowserStack Platform, OS version and browser combinations.
+# Grid runs only use browser_name/browser_version (and platform_name if set).
+DEFAULT_ENVIRONMENTS = [
+    {
+        "browser_name": "chrome",
+        "browser_version": "latest",
+        "os_name": "Windows",
+        "os_version": "10",
+        "session_name": "Chrome on Win 10"
+    },
+    {
+        "browser_name": "firefox",
+        "browser_version": "latest",
+        "os_name": "OS X",
+        "os_version": "Ventura",
+        "session_name": "Firefox on Mac"
+    }
+    # can be extended as per requirement
+]
+
+LIMITS_FILE = "limits.json"
+BUDGET_KEY = "budget"
+
+
+def load_environments(config: dict) -> List[dict]:
+    """Return the capability sets from `matrix_environments`, or the defaults."""
+    return config.get("matrix_environments") or DEFAULT_ENVIRONMENTS
+
+
+def environment_slug(environment: dict) -> str:
+    """Return a filesystem-safe name for an environment, e.g. "chrome-on-win-10"."""
+    name = environment.get("session_name") or environment["browser_name"]
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def browser_family(browser: str) -> str:
+    """Return the Grid browserName for a configured browser, e.g. "chrome-headless" -> "chrome"."""
+    return (browser or "chrome").lower().split("-")[0]
+
+
+def grid_root(grid_url: str) -> str:
+    """Return the Grid base URL without the legacy /wd/hub suffix."""
+    root = grid_url.rstrip("/")
+    if root.endswith("/wd/hub"):
+        root = root[: -len("/wd/hub")]
+    return root
+
+
+def fetch_grid_status(grid_url: str, timeout: float = 3) -> dict:
+    """
+    Return the `value` object of the Grid's /status response.
+
+    Raises:
+        requests.RequestException: If the Grid cannot be reached.
+    """
+    response = requests.get(f"{grid_root(grid_url)}/status", timeout=timeout)
+    response.raise_for_status()
+    return response.json().get("value", {})
+
+
+def grid_capacity(status: dict, per_node_cap: int = 0) -> Dict[str, int]:
+    """
+    Return how many concurrent sessions the Grid can serve per browser.
+
+    Each node contributes at most `maxSessions` (and at most `per_node_cap`
+    when set) sessions; the key BUDGET_KEY holds the total over all nodes.
+
+    Args:
+        status: The `value` object of a Grid /status response.
+        per_node_cap: Maximum in-flight sessions on any single node; 0 for none.
+    """
+    capacity: Dict[str, int] = {BUDGET_KEY: 0}
+    for node in status.get("nodes", []):
+        if node.get("availability", "UP") != "UP":
+            continue
+        slots = node.get("slots", [])
+        node_limit = node.get("maxSessions") or len(slots)
+        if per_node_cap:
+            node_limit = min(node_limit, per_node_cap)
+        per_browser: Dict[str, int] = {}
+        for slot in slots:
+            browser = slot.get("stereotype", {}).get("browserName")
+            if browser:
+                per_browser[browser] = per_browser.get(browser, 0) + 1
+        for browser, count in per_browser.items():
+            capacity[browser] = capacity.get(browser, 0) + min(count, node_limit)
+        capacity[BUDGET_KEY] += min(len(slots), node_limit)
+    return capacity
+
+
+@dataclass
+class SlotLease:
+    """Leases held for one in-flight session."""
+
+    handles: list
+    waited: float = 0.0
+    released: bool = field(default=False, repr=False)
+
+    def release(self):
+        """Give the slots back; safe to call more than once."""
+        if self.released:
+            return
+        for handle in self.handles:
+            unlock(handle)
+        self.released = True
+
+
+class SessionSlots:
+    """
+    Cross-process session slots backed by lock files in one directory.
+
+    The limits are written once by the matrix runner (see `write_limits`)
+    and read by every pytest process it starts.
+    """
+
+    def __init__(self, directory: str, limits: Dict[str, int], timeout: float = 600,
+                 poll_interval: float = 0.2):
+        """
+        Initialise the slots.
+
+        Args:
+            directory: Directory holding the lock files and limits.json.
+            limits: Slot count per key: BUDGET_KEY plus one per browser family.
+            timeout: Seconds to queue for a slot before giving up.
+            poll_interval: Seconds between attempts while queued.
+        """
+        self.directory = directory
+        self.limits = limits
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    @classmethod
+    def from_directory(cls, directory: str, timeout: float = 600) -> "SessionSlots":
+        with open(os.path.join(directory, LIMITS_FILE)) as handle:
+            return cls(directory, json.load(handle), timeout)
+
+    @staticmethod
+    def write_limits(directory: str, limits: Dict[str, int]):
+        atomic_write(os.path.join(directory, LIMITS_FILE), json.dumps(limits, indent=2, sort_keys=True))
+
+    def _take(self, key: str):
+        for index in range(self.limits.get(key, 0)):
+            handle = try_lock(os.path.join(self.directory, f"{key}-{index}.lock"))
+            if handle:
+                return handle
+        return None
+
+    def acquire(self, browser: str) -> SlotLease:
+        """
+        Block until a budget slot and a slot for the browser are free.
+
+        Browsers without a configured limit only need a budget slot.
+
+        Raises:
+            TimeoutError: If no slot frees up within the timeout.
+            ValueError: If the Grid has no capacity for the browser at all.
+        """
+        family = browser_family(browser)
+        if family in self.limits and self.limits[family] == 0:
+            raise ValueError(f"No Grid node offers '{family}' sessions")
+        start = time.monotonic()
+        queued = False
+        while True:
+            budget = self._take(BUDGET_KEY)
+            if budget:
+                if family not in self.limits:
+                    return SlotLease([budget], time.monotonic() - start)
+                slot = self._take(family)
+                if slot:
+                    return SlotLease([budget, slot], time.monotonic() - start)
+                unlock(budget)
+            if not queued:
+                logger.info("All %s session slots are busy; queueing", family)
+                queued = True
+            if time.monotonic() - start > self.timeout:
+                raise TimeoutError(f"No {family} session slot freed up within {self.timeout}s")
+            time.sleep(self.poll_interval)
+
+
+def hold_lease(driver, lease: SlotLease):
+    """Release the lease when the driver quits."""
+    original = driver.quit
+
+    def quit_and_release():
+        try:
+            original()
+        finally:
+            lease.release()
+
+    driver.quit = quit_and_release
+    return driver
+
+
+def session_slots(config: dict) -> Optional[SessionSlots]:
+    """Return the slots configured for this process through `matrix_slots_dir`, if any."""
+    directory = config.get("matrix_slots_dir")
+    if not directory:
+        return None
+    return SessionSlots.from_directory(directory, timeout=config.get("matrix_slot_timeout", 600))
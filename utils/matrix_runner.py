@@ -0,0 +1,207 @@
+"""
+Run the suite concurrently over every capability set in the matrix.
+
+One pytest process (with xdist workers) is started per environment, all at
+the same time, against the Grid or BrowserStack selected by `run_mode`.
+Sessions are rationed through utils.matrix.SessionSlots: the session budget
+caps in-flight sessions overall, the per-node cap limits how many sessions a
+single Grid node is given, and workers that find every slot busy queue until
+one is released instead of failing.
+
+Usage:
+    python -m utils.matrix_runner [--session-budget N] [--per-node-cap N] [-- <pytest args>]
+
+Each environment writes its report, JUnit XML and log under
+reports/matrix/<environment>/; reports/matrix/summary.json holds scenarios,
+outcomes and throughput (scenarios/minute) per environment.
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, List
+
+import requests
+
+from utils.config import load_config
+from utils.file_lock import atomic_write
+from utils.logger import get_logger
+from utils.matrix import (
+    BUDGET_KEY,
+    SessionSlots,
+    browser_family,
+    environment_slug,
+    fetch_grid_status,
+    grid_capacity,
+    load_environments,
+)
+
+
+logger = get_logger(__name__)
+
+MATRIX_DIR = os.path.join("reports", "matrix")
+
+
+def plan_limits(config: dict, environments: List[dict], session_budget: int, per_node_cap: int) -> Dict[str, int]:
+    """
+    Work out the slot limits for this run.
+
+    On a Grid the limits come from /status, capped by the session budget; on
+    BrowserStack only the budget applies (defaulting to the plan's parallel
+    sessions).
+    """
+    run_mode = (config.get("run_mode") or "local").lower()
+    if run_mode == "browserstack":
+        return {BUDGET_KEY: session_budget or int(config.get("browserstack_parallel_sessions", 1))}
+
+    capacity = grid_capacity(fetch_grid_status(config["grid_url"]), per_node_cap)
+    limits = {BUDGET_KEY: min(session_budget or capacity[BUDGET_KEY], capacity[BUDGET_KEY])}
+    for environment in environments:
+        family = browser_family(environment["browser_name"])
+        limits[family] = min(capacity.get(family, 0), limits[BUDGET_KEY])
+    return limits
+
+
+def workers_for(environment: dict, limits: Dict[str, int], environments: List[dict], requested: int) -> int:
+    """Return the xdist worker count for one environment."""
+    if requested:
+        return requested
+    share = math.ceil(limits[BUDGET_KEY] / len(environments))
+    return max(1, min(share, limits.get(browser_family(environment["browser_name"]), share)))
+
+
+def junit_counts(path: str) -> Dict[str, int]:
+    """Return test/failure/error/skip counts from a JUnit XML report."""
+    counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return counts
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    for suite in suites:
+        for key in counts:
+            counts[key] += int(suite.get(key, 0))
+    return counts
+
+
+def run_matrix(config: dict, environments: List[dict], limits: Dict[str, int], pytest_args: List[str],
+               workers: int = 0) -> List[dict]:
+    """
+    Start one pytest process per environment and wait for all of them.
+
+    Returns:
+        One summary dict per environment.
+    """
+    slots_dir = os.path.join(MATRIX_DIR, "slots")
+    shutil.rmtree(slots_dir, ignore_errors=True)
+    os.makedirs(slots_dir)
+    SessionSlots.write_limits(slots_dir, limits)
+
+    runs = []
+    for environment in environments:
+        slug = environment_slug(environment)
+        family = browser_family(environment["browser_name"])
+        if family in limits and limits[family] == 0:
+            logger.warning("Skipping %s: no Grid node offers %s", slug, family)
+            runs.append({"environment": slug, "status": "unsupported"})
+            continue
+        out_dir = os.path.join(MATRIX_DIR, slug)
+        os.makedirs(out_dir, exist_ok=True)
+        count = workers_for(environment, limits, environments, workers)
+        command = [
+            sys.executable, "-m", "pytest", *pytest_args,
+            "-n", str(count),
+            f"--junitxml={os.path.join(out_dir, 'junit.xml')}",
+        ]
+        env = dict(
+            os.environ,
+            RUN_MODE=config.get("run_mode", "grid"),
+            MATRIX_ENVIRONMENT=json.dumps(environment),
+            MATRIX_SLOTS_DIR=os.path.abspath(slots_dir),
+        )
+        log = open(os.path.join(out_dir, "pytest.log"), "w")  # pylint: disable=consider-using-with
+        logger.info("Starting %s with %s worker(s)", slug, count)
+        process = subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+        runs.append({"environment": slug, "process": process, "log": log,
+                     "junit": os.path.join(out_dir, "junit.xml"), "start": time.monotonic(), "workers": count})
+
+    for run in runs:
+        if "process" not in run:
+            continue
+        run["returncode"] = run["process"].wait()
+        elapsed = time.monotonic() - run["start"]
+        run["log"].close()
+        counts = junit_counts(run["junit"])
+        executed = counts["tests"] - counts["skipped"]
+        run.update(
+            status="passed" if run["returncode"] == 0 else "failed",
+            seconds=round(elapsed, 1),
+            scenarios_per_minute=round(executed / (elapsed / 60), 2) if elapsed else 0.0,
+            **counts,
+        )
+        for key in ("process", "log", "junit", "start"):
+            run.pop(key)
+    return runs
+
+
+def print_summary(runs: List[dict], limits: Dict[str, int]):
+    print(f"Session limits: {limits}")
+    print(f"{'environment':30} {'status':12} {'workers':>7} {'tests':>6} {'failed':>6} {'seconds':>8} {'scen/min':>9}")
+    for run in runs:
+        failed = run.get("failures", 0) + run.get("errors", 0)
+        print(f"{run['environment']:30} {run['status']:12} {run.get('workers', 0):7} {run.get('tests', 0):6} "
+              f"{failed:6} {run.get('seconds', 0):8} {run.get('scenarios_per_minute', 0):9}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fan the suite out over every capability set in the matrix.",
+        epilog="Arguments after -- are passed to pytest, e.g. -- -m smoke",
+    )
+    parser.add_argument("--session-budget", type=int, default=None,
+                        help="Max concurrent sessions overall (default: grid_session_budget, else Grid capacity)")
+    parser.add_argument("--per-node-cap", type=int, default=None,
+                        help="Max in-flight sessions per Grid node (default: grid_per_node_cap)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="xdist workers per environment (default: the budget shared across environments)")
+    parser.add_argument("--grid-url", default=None, help="Override grid_url/GRID_URL")
+    parser.add_argument("pytest_args", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    run_mode = (config.get("run_mode") or "local").lower()
+    if args.grid_url:
+        config["grid_url"] = args.grid_url
+        os.environ["GRID_URL"] = args.grid_url
+        run_mode = "grid"
+    if run_mode not in ("grid", "browserstack"):
+        parser.error("the matrix runs on a Selenium Grid or BrowserStack; set RUN_MODE or --grid-url")
+    config["run_mode"] = run_mode
+
+    environments = load_environments(config)
+    session_budget = args.session_budget if args.session_budget is not None else config.get("grid_session_budget", 0)
+    per_node_cap = args.per_node_cap if args.per_node_cap is not None else config.get("grid_per_node_cap", 0)
+    try:
+        limits = plan_limits(config, environments, session_budget, per_node_cap)
+    except (requests.RequestException, ValueError) as exc:
+        logger.error("Could not read Grid status: %s", exc)
+        return 2
+    if not limits[BUDGET_KEY]:
+        logger.error("The Grid reports no session slots")
+        return 2
+
+    runs = run_matrix(config, environments, limits, args.pytest_args, args.workers)
+    print_summary(runs, limits)
+    atomic_write(os.path.join(MATRIX_DIR, "summary.json"),
+                 json.dumps({"limits": limits, "environments": runs}, indent=2))
+    return 0 if all(run["status"] in ("passed", "unsupported") for run in runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Parsed page snapshots for read-only checks.
+
+Assertions such as "the side cart shows these three products" or "the login
+modal renders its four controls" read data that does not change between
+their calls. Each read is still a wait plus a text or visibility round
+trip. A snapshot answers all of them from one call: the script clones the
+DOM, marks every element that is visible in the live page, and returns the
+HTML. lxml parses it, and XPath/CSS queries then run locally.
+
+A snapshot stays valid until the page may have changed:
+- BasePage actions (open, click, type, fill_form) invalidate it;
+- so does any navigation, input or cookie command sent through the driver,
+  whoever sends it (see `_watch_commands`).
+"""
+
+import time
+import weakref
+from typing import List, Optional
+
+import lxml.html
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from utils.dom_waits import VISIBILITY_FUNCTION
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+VISIBLE_ATTRIBUTE = "data-snapshot-visible"
+
+# Clone the document, mark the clone's elements that are visible in the live
+# page (both are walked in the same document order), and drop what no check
+# reads.
+SNAPSHOT_SCRIPT = VISIBILITY_FUNCTION + """
+const root = document.documentElement;
+const clone = root.cloneNode(true);
+const live = root.getElementsByTagName('*'), copies = clone.getElementsByTagName('*');
+for (let i = 0; i < live.length; i++) {
+    if (visible(live[i])) copies[i].setAttribute('%s', '');
+}
+clone.querySelectorAll('script, style, noscript').forEach((el) => el.remove());
+return clone.outerHTML;
+""" % VISIBLE_ATTRIBUTE
+
+# Commands after which a snapshot may no longer match the page.
+PAGE_CHANGING_COMMANDS = frozenset({
+    Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD,
+    Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT, Command.CLEAR_ELEMENT, Command.W3C_ACTIONS,
+    Command.ADD_COOKIE, Command.DELETE_COOKIE, Command.DELETE_ALL_COOKIES,
+    Command.SWITCH_TO_FRAME, Command.SWITCH_TO_PARENT_FRAME, Command.SWITCH_TO_WINDOW, Command.CLOSE,
+})
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _visible_text(element) -> str:
+    """Return the text of an element without its hidden descendants, as WebElement.text does."""
+    parts = [element.text or ""]
+    for child in element:
+        if isinstance(child.tag, str) and child.get(VISIBLE_ATTRIBUTE) is not None:
+            parts.append(_visible_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+class PageSnapshot:
+    """A parsed copy of the page at one moment, with visibility marked on each element."""
+
+    def __init__(self, html: str):
+        self.tree = lxml.html.document_fromstring(html)
+        self.taken_at = time.time()
+
+    def find_all(self, locator) -> list:
+        """
+        Return the elements matching a (By, value) locator, in document order.
+
+        Raises:
+            ValueError: If the strategy cannot be evaluated on a snapshot.
+        """
+        by, value = locator
+        if by == By.XPATH:
+            return [node for node in self.tree.xpath(value) if isinstance(node, lxml.html.HtmlElement)]
+        if by == By.CSS_SELECTOR:
+            return self.tree.cssselect(value)
+        if by == By.ID:
+            return self.tree.xpath("//*[@id=$value]", value=value)
+        if by == By.NAME:
+            return self.tree.xpath("//*[@name=$value]", value=value)
+        if by == By.CLASS_NAME:
+            return self.tree.find_class(value)
+        if by == By.TAG_NAME:
+            return list(self.tree.iter(value))
+        raise ValueError(f"Locator strategy '{by}' cannot be evaluated on a page snapshot")
+
+    def _first(self, locator):
+        matches = self.find_all(locator)
+        return matches[0] if matches else None
+
+    def visible(self, locator) -> bool:
+        """Return True if the first element matching the locator was visible."""
+        element = self._first(locator)
+        return element is not None and element.get(VISIBLE_ATTRIBUTE) is not None
+
+    def text(self, locator) -> Optional[str]:
+        """Return the visible text of the first matching element if it was visible, otherwise None."""
+        element = self._first(locator)
+        if element is None or element.get(VISIBLE_ATTRIBUTE) is None:
+            return None
+        return _normalise(_visible_text(element))
+
+    def texts(self, locator) -> List[str]:
+        """Return the text of every visible element matching the locator."""
+        return [_normalise(_visible_text(element)) for element in self.find_all(locator)
+                if element.get(VISIBLE_ATTRIBUTE) is not None]
+
+
+_snapshots: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _watch_commands(driver):
+    """Drop the driver's snapshot whenever it sends a command that can change the page."""
+    if getattr(driver, "_snapshot_watched", False):
+        return
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        if driver_command in PAGE_CHANGING_COMMANDS:
+            _snapshots.pop(driver, None)
+        return original(driver_command, params)
+
+    driver.execute = execute
+    driver._snapshot_watched = True  # pylint: disable=protected-access
+
+
+def cached_snapshot(driver) -> Optional[PageSnapshot]:
+    """Return the driver's current snapshot, or None if there is none or it was invalidated."""
+    return _snapshots.get(driver)
+
+
+def take_snapshot(driver) -> PageSnapshot:
+    """Snapshot the current page in one round trip and cache it for the driver."""
+    _watch_commands(driver)
+    start = time.perf_counter()
+    snapshot = PageSnapshot(driver.execute_script(SNAPSHOT_SCRIPT))
+    _snapshots[driver] = snapshot
+    logger.debug("Page snapshot taken in %.3fs", time.perf_counter() - start)
+    return snapshot
+
+
+def invalidate_snapshot(driver):
+    """Forget the driver's snapshot, e.g. after an action changed the page."""
+    _snapshots.pop(driver, None)
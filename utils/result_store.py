@@ -0,0 +1,302 @@
+"""
+Streaming test result store and its static viewer.
+
+ResultWriter appends one JSON line per finished test to
+reports/results/<run_id>/results.jsonl, as soon as the test's teardown is
+reported. It only holds the tests still running, so memory stays flat however
+large the suite is. Failure text is truncated. Screenshots and other
+artefacts are referenced by their path under reports/ (they are named by
+content hash, see utils.artefacts), never inlined.
+
+`prune_runs` deletes the oldest run directories beyond `report_keep_runs`,
+and `prune_artefacts` then deletes the artefacts no remaining run references.
+
+`build_viewer` turns the finished stream into pages of results
+(pages/NNNN.js) plus an index.js summary, and copies the static viewer next
+to them. The viewer loads the summary first and then one page at a time, as
+the reader pages through. The pages are plain <script> files rather than
+JSON fetched by the viewer, so the report also opens from file://.
+"""
+
+import glob
+import json
+import os
+import shutil
+import time
+from collections import Counter
+from typing import Dict, List
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+RESULTS_DIR = os.path.join("reports", "results")
+VIEWER_TEMPLATE = os.path.join(os.path.dirname(__file__), "report_viewer.html")
+MESSAGE_LIMIT = 20000
+PAGE_SIZE = 200
+
+RERUN = "rerun"
+# Artefact directories under the reports root (and each worker's reports/gwN/), see utils.artefacts.
+ARTEFACT_DIRS = ("screenshots", "steps")
+
+# The worst phase outcome decides a test's outcome.
+_SEVERITY = {"passed": 0, "skipped": 1, "xpassed": 1, "xfailed": 1, RERUN: 2, "failed": 3, "error": 3}
+
+
+def phase_outcome(report) -> str:
+    """Return the outcome one phase report contributes: passed, failed, error, skipped, xfailed, xpassed or rerun."""
+    if report.outcome == RERUN:
+        return RERUN
+    if hasattr(report, "wasxfail"):
+        return "xfailed" if report.skipped else "xpassed"
+    if report.failed:
+        return "failed" if report.when == "call" else "error"
+    return report.outcome
+
+
+def _json_safe(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return str(value)
+
+
+class ResultWriter:
+    """Append finished test results to a JSON-lines file as they arrive."""
+
+    def __init__(self, run_dir: str, reports_root: str = "reports"):
+        """
+        Open the run's result stream.
+
+        Args:
+            run_dir: Directory of this run, e.g. reports/results/<run_id>.
+            reports_root: Directory artefact paths are made relative to.
+        """
+        os.makedirs(run_dir, exist_ok=True)
+        self.run_dir = run_dir
+        self.reports_root = reports_root
+        self.path = os.path.join(run_dir, "results.jsonl")
+        self._stream = open(self.path, "a", encoding="utf8")  # pylint: disable=consider-using-with
+        self._pending: Dict[str, dict] = {}
+        self.counts: Counter = Counter()
+        self.written = 0
+        self.reruns = 0  # rows for failed attempts that were rerun; the test's final attempt has its own row
+        self.started = time.time()
+
+    def add(self, report):
+        """Fold one phase report into its test; the test is written once its teardown arrives."""
+        entry = self._pending.get(report.nodeid)
+        if entry is None:
+            entry = self._pending[report.nodeid] = {
+                "nodeid": report.nodeid,
+                "name": report.head_line or report.nodeid,
+                "outcome": "passed",
+                "duration": 0.0,
+                "worker": getattr(report, "worker_id", None) or "main",
+                "start": getattr(report, "start", None),
+                "phases": {},
+                "message": "",
+            }
+        outcome = phase_outcome(report)
+        entry["phases"][report.when] = outcome
+        entry["duration"] += report.duration
+        if _SEVERITY.get(outcome, 0) > _SEVERITY.get(entry["outcome"], 0):
+            entry["outcome"] = outcome
+        if outcome not in ("passed", "xpassed") and report.longrepr:
+            if isinstance(report.longrepr, tuple):  # skip: (path, line, reason)
+                text = str(report.longrepr[2])
+            else:
+                text = getattr(report, "longreprtext", "") or str(report.longrepr)
+            entry["message"] = (entry["message"] + "\n" + text).strip()[:MESSAGE_LIMIT]
+        if report.when == "teardown":
+            self._write(self._pending.pop(report.nodeid), report)
+
+    def _write(self, entry: dict, teardown):
+        properties, artefacts = {}, []
+        for name, value in teardown.user_properties:
+            if name == "artefact":
+                artefact = self._artefact(value)
+                if artefact not in artefacts:  # a rerun's item still carries the earlier attempt's entries
+                    artefacts.append(artefact)
+            else:
+                properties[name] = _json_safe(value)
+        entry.update(
+            seq=self.written,
+            duration=round(entry["duration"], 3),
+            stop=getattr(teardown, "stop", None),
+            attempt=properties.get("retry_attempt", 0),
+            properties=properties,
+            artefacts=artefacts,
+        )
+        self._stream.write(json.dumps(entry) + "\n")
+        self._stream.flush()
+        self.written += 1
+        self.reruns += RERUN in entry["phases"].values()
+        self.counts[entry["outcome"]] += 1
+
+    @property
+    def tests(self) -> int:
+        """Number of distinct tests written, counting each rerun test once."""
+        return self.written - self.reruns
+
+    def _artefact(self, value) -> dict:
+        label, path = value.get("label", "artefact"), value.get("path", "")
+        return {"label": label, "path": os.path.relpath(path, self.reports_root).replace(os.sep, "/")}
+
+    def close(self):
+        """Write out tests whose teardown never arrived (e.g. an interrupted run) and close the stream."""
+        for entry in list(self._pending.values()):
+            entry.update(seq=self.written, duration=round(entry["duration"], 3), properties={}, artefacts=[])
+            self._stream.write(json.dumps(entry) + "\n")
+            self.written += 1
+            self.counts[entry["outcome"]] += 1
+        self._pending.clear()
+        self._stream.close()
+
+    def summary(self, run_id: str) -> dict:
+        return {
+            "run_id": run_id,
+            "started": self.started,
+            "seconds": round(time.time() - self.started, 3),
+            "total": self.tests,
+            "reruns": self.reruns,
+            "counts": dict(self.counts),
+        }
+
+
+def build_viewer(run_dir: str, summary: dict, page_size: int = PAGE_SIZE) -> str:
+    """
+    Split a finished result stream into viewer pages and install the viewer.
+
+    The stream is read line by line, so only one page is in memory at a time.
+
+    Args:
+        run_dir: Directory holding results.jsonl.
+        summary: Run summary shown above the results (see ResultWriter.summary).
+        page_size: Results per page.
+
+    Returns:
+        Path of the viewer's index.html.
+    """
+    pages_dir = os.path.join(run_dir, "pages")
+    os.makedirs(pages_dir, exist_ok=True)
+    pages = 0
+    batch = []
+
+    def flush_page():
+        nonlocal pages
+        pages += 1
+        with open(os.path.join(pages_dir, f"{pages:04d}.js"), "w", encoding="utf8") as handle:
+            handle.write(f"window.reportPage({pages}, {json.dumps(batch)});\n")
+        batch.clear()
+
+    with open(os.path.join(run_dir, "results.jsonl"), encoding="utf8") as stream:
+        for line in stream:
+            if line.strip():
+                batch.append(json.loads(line))
+            if len(batch) >= page_size:
+                flush_page()
+    if batch:
+        flush_page()
+
+    index = dict(summary, pages=pages, page_size=page_size)
+    with open(os.path.join(run_dir, "index.js"), "w", encoding="utf8") as handle:
+        handle.write(f"window.REPORT_INDEX = {json.dumps(index)};\n")
+    viewer = os.path.join(run_dir, "index.html")
+    shutil.copyfile(VIEWER_TEMPLATE, viewer)
+
+    # reports/results/index.html always opens the latest run.
+    latest = os.path.join(os.path.dirname(run_dir), "index.html")
+    with open(latest, "w", encoding="utf8") as handle:
+        handle.write('<!DOCTYPE html><meta charset="utf-8">'
+                     f'<meta http-equiv="refresh" content="0; url={os.path.basename(run_dir)}/index.html">\n')
+    return viewer
+
+
+def prune_runs(results_dir: str, keep: int, current: str = "") -> int:
+    """
+    Delete all but the newest `keep` run directories under results_dir.
+
+    Run ids start with their timestamp, so names sort oldest first. The
+    current run is never deleted.
+
+    Args:
+        results_dir: Directory holding one sub-directory per run.
+        keep: Runs to keep; 0 keeps all.
+        current: Run id of the run being written.
+
+    Returns:
+        Number of run directories deleted.
+    """
+    if keep <= 0 or not os.path.isdir(results_dir):
+        return 0
+    stale = [name for name in _run_names(results_dir)[:-keep] if name != current]
+    for name in stale:
+        shutil.rmtree(os.path.join(results_dir, name), ignore_errors=True)
+    return len(stale)
+
+
+def _run_names(results_dir: str) -> List[str]:
+    return sorted(name for name in os.listdir(results_dir) if os.path.isdir(os.path.join(results_dir, name)))
+
+
+def _run_started(name: str) -> float:
+    """Return when a run started, from the timestamp its id starts with (0 if it has none)."""
+    try:
+        return time.mktime(time.strptime(name[:15], "%Y%m%d-%H%M%S"))
+    except ValueError:
+        return 0.0
+
+
+def prune_artefacts(results_dir: str, reports_root: str = "reports") -> int:
+    """
+    Delete artefacts that no remaining run references.
+
+    Artefacts are named by content hash and shared between runs, so they are
+    not deleted with a run directory. Each remaining run's stream is read
+    line by line for the paths it references. An unreferenced file is only
+    deleted if it is older than the oldest remaining run, so files a run
+    still in progress (e.g. another matrix environment) has captured but not
+    yet reported are kept.
+
+    Args:
+        results_dir: Directory holding one sub-directory per run.
+        reports_root: Directory artefact paths in the streams are relative to.
+
+    Returns:
+        Number of files deleted.
+    """
+    if not os.path.isdir(results_dir):
+        return 0
+    runs = _run_names(results_dir)
+    if not runs:
+        return 0
+    referenced = set()
+    for name in runs:
+        path = os.path.join(results_dir, name, "results.jsonl")
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf8") as stream:
+            for line in stream:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                referenced.update(artefact["path"] for artefact in entry.get("artefacts", []))
+    cutoff = min(_run_started(name) for name in runs)
+    deleted = 0
+    for pattern in ARTEFACT_DIRS:
+        for directory in glob.glob(os.path.join(reports_root, pattern)) + \
+                glob.glob(os.path.join(reports_root, "gw*", pattern)):
+            for entry in os.scandir(directory):
+                relative = os.path.relpath(entry.path, reports_root).replace(os.sep, "/")
+                if entry.name.startswith(".") or not entry.is_file():  # e.g. .gitkeep
+                    continue
+                if relative not in referenced and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    deleted += 1
+    return deleted
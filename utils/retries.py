@@ -0,0 +1,133 @@
+"""
+Retry policy, flakiness scores and retry cost accounting.
+
+Retries happen at two levels:
+- element level: BasePage.click retries intercepted, stale and
+  non-interactable clicks. The delay between attempts doubles each time
+  (`backoff_delay`), so a re-rendering page gets time to settle instead of
+  being hammered in a tight loop.
+- scenario level: tests/plugins/retries.py reruns failed scenarios at the
+  end of the session on fresh drivers.
+
+Every scenario outcome is folded into a persisted flakiness score, an
+exponential moving average of "failed, then passed on a rerun". A scenario
+whose score stays at or above the quarantine threshold is moved into the
+quarantine lane. It still runs, but its failures no longer fail the build,
+until its score drops again.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Set, Tuple
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+FLAKY, PASSED, FAILED = "flaky", "passed", "failed"
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 2.0) -> float:
+    """
+    Return the delay before retry number `attempt` (1-based): base, 2*base, 4*base, ... up to cap.
+
+    Args:
+        attempt: Retry number, starting at 1.
+        base: Delay before the first retry, in seconds; 0 disables backoff.
+        cap: Longest delay, in seconds.
+    """
+    if base <= 0 or attempt < 1:
+        return 0.0
+    return min(base * 2 ** (attempt - 1), cap)
+
+
+@dataclass
+class ElementRetryStats:
+    """Element-level retries made by this process and the time they cost."""
+
+    retries: int = 0
+    seconds: float = 0.0
+    by_locator: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, locator: str, seconds: float):
+        self.retries += 1
+        self.seconds += seconds
+        self.by_locator[locator] = self.by_locator.get(locator, 0) + 1
+
+    def merge(self, other: dict):
+        """Fold in stats reported by another process (see `asdict`)."""
+        self.retries += other.get("retries", 0)
+        self.seconds += other.get("seconds", 0.0)
+        for locator, count in other.get("by_locator", {}).items():
+            self.by_locator[locator] = self.by_locator.get(locator, 0) + count
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class FlakinessRecord:
+    """The persisted history of one scenario."""
+
+    score: float = 0.0
+    runs: int = 0
+    flaky: int = 0
+    failed: int = 0
+    last: str = ""
+
+
+class FlakinessStore:
+    """Flakiness scores by node id, persisted as JSON between runs."""
+
+    def __init__(self, records: Dict[str, FlakinessRecord], weight: float = 0.3):
+        self.records = records
+        self.weight = weight
+
+    @classmethod
+    def load(cls, path: str, weight: float = 0.3) -> "FlakinessStore":
+        """Read the store, or start an empty one if the file is missing or unreadable."""
+        try:
+            with open(path) as handle:
+                raw = json.load(handle)
+        except (OSError, ValueError):
+            raw = {}
+        records = {nodeid: FlakinessRecord(**values) for nodeid, values in raw.items()}
+        return cls(records, weight)
+
+    def record(self, nodeid: str, outcome: str):
+        """
+        Fold one run's outcome into the scenario's score.
+
+        Args:
+            nodeid: Scenario node id.
+            outcome: FLAKY (failed, then passed on a rerun), PASSED or FAILED.
+        """
+        record = self.records.setdefault(nodeid, FlakinessRecord())
+        sample = 1.0 if outcome == FLAKY else 0.0
+        record.score = round(record.score + self.weight * (sample - record.score), 4)
+        record.runs += 1
+        record.flaky += outcome == FLAKY
+        record.failed += outcome == FAILED
+        record.last = outcome
+
+    def quarantined(self, threshold: float, min_runs: int) -> Set[str]:
+        """Return the node ids that have been consistently flaky over at least `min_runs` runs."""
+        if threshold <= 0:
+            return set()
+        return {
+            nodeid for nodeid, record in self.records.items()
+            if record.runs >= min_runs and record.score >= threshold
+        }
+
+    def top(self, count: int = 10) -> Iterable[Tuple[str, FlakinessRecord]]:
+        """Return the flakiest scenarios, highest score first."""
+        ranked = sorted(self.records.items(), key=lambda entry: entry[1].score, reverse=True)
+        return [(nodeid, record) for nodeid, record in ranked[:count] if record.score > 0]
+
+    def to_json(self) -> str:
+        return json.dumps({nodeid: asdict(record) for nodeid, record in self.records.items()},
+                          indent=2, sort_keys=True)
+
+
+element_retries = ElementRetryStats()
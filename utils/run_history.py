@@ -0,0 +1,279 @@
+"""
+Run history and performance regression checks.
+
+Every run's timings are recorded in a SQLite database (`history_db`,
+reports/history.sqlite by default) by tests/plugins/history.py:
+- one sample per scenario (its total duration)
+- the samples of every step, BasePage action and WebDriver command
+  (see utils.timing)
+
+Each run is stored with its commit, browser and run mode. A CI cache or a
+long-lived runner can keep the file between runs.
+
+The command line compares a run (the latest by default) with a baseline:
+either one run or the previous N runs in the same browser and run mode,
+whose samples are pooled. It fails when the p95 of a scenario, step or
+command grew by more than the threshold. A page-object change that makes
+ProductPage.add_product_to_cart slower therefore shows up as a regression
+of the steps that use it.
+
+A p95 is only compared when the run has at least `--min-samples` samples of
+the name. A scenario runs once per run, so its single sample is noise; it
+is only checked on request (`--kinds scenario`) and with a lower minimum.
+
+Usage:
+    python -m utils.run_history list
+    python -m utils.run_history compare [--run ID] [--baseline ID | --baseline-runs N]
+                                        [--threshold 0.2] [--min-delta 0.05] [--min-samples 5] [--kinds step]
+
+`compare` exits with status 1 when any p95 regressed.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from utils.config import load_config
+from utils.logger import get_logger
+from utils.timing import KINDS, percentile, summarise
+
+
+logger = get_logger(__name__)
+
+DEFAULT_DB = os.path.join("reports", "history.sqlite")
+SCENARIO = "scenario"
+HISTORY_KINDS = (SCENARIO,) + KINDS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    recorded REAL NOT NULL,
+    git_commit TEXT,
+    browser TEXT,
+    run_mode TEXT,
+    tests INTEGER
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    p50 REAL NOT NULL,
+    p95 REAL NOT NULL,
+    max REAL NOT NULL,
+    samples TEXT NOT NULL,
+    PRIMARY KEY (run_id, kind, name)
+);
+CREATE INDEX IF NOT EXISTS runs_by_environment ON runs (browser, run_mode, recorded);
+"""
+
+
+def git_commit(root: str = ".") -> str:
+    """Return the commit under test: GITHUB_SHA in CI, else `git rev-parse HEAD`, else ""."""
+    if os.getenv("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+class RunHistory:
+    """The run-history database."""
+
+    def __init__(self, path: str = DEFAULT_DB):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        # Parallel matrix runs record into the same file; wait for each other's writes.
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def record_run(self, run_id: str, samples: Dict[str, Dict[str, List[float]]], commit: str = "",
+                   browser: str = "", run_mode: str = "", tests: int = 0, keep: int = 0):
+        """
+        Store one run's samples.
+
+        Args:
+            run_id: Unique id of the run.
+            samples: {kind: {name: [seconds, ...]}} for the kinds in HISTORY_KINDS.
+            commit: Commit under test.
+            browser: Configured browser.
+            run_mode: local, grid or browserstack.
+            tests: Number of tests in the run.
+            keep: Runs to keep per browser and run mode; older ones are dropped. 0 keeps all.
+        """
+        rows = [
+            (run_id, kind, name, stats["count"], stats["p50"], stats["p95"], stats["max"],
+             json.dumps([round(value, 4) for value in values]))
+            for kind, names in samples.items()
+            for name, values in names.items() if values
+            for stats in (summarise(values),)
+        ]
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                            (run_id, time.time(), commit, browser, run_mode, tests))
+            self.db.executemany("INSERT OR REPLACE INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if keep > 0:
+                self.db.execute(
+                    "DELETE FROM runs WHERE browser = ? AND run_mode = ? AND run_id NOT IN "
+                    "(SELECT run_id FROM runs WHERE browser = ? AND run_mode = ? ORDER BY recorded DESC LIMIT ?)",
+                    (browser, run_mode, browser, run_mode, keep))
+
+    def runs(self, browser: Optional[str] = None, run_mode: Optional[str] = None, limit: int = 20) -> List[dict]:
+        """Return recorded runs, newest first, optionally for one browser and run mode."""
+        query, params = "SELECT * FROM runs", []
+        filters = [(column, value) for column, value in (("browser", browser), ("run_mode", run_mode))
+                   if value is not None]
+        if filters:
+            query += " WHERE " + " AND ".join(f"{column} = ?" for column, _ in filters)
+            params = [value for _, value in filters]
+        query += " ORDER BY recorded DESC LIMIT ?"
+        return [dict(row) for row in self.db.execute(query, params + [limit])]
+
+    def run(self, run_id: str) -> Optional[dict]:
+        row = self.db.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def samples(self, run_ids: Iterable[str], kind: str) -> Dict[str, List[float]]:
+        """Return the pooled samples per name of one kind across the given runs."""
+        run_ids = list(run_ids)
+        pooled: Dict[str, List[float]] = {}
+        if not run_ids:
+            return pooled
+        placeholders = ", ".join("?" for _ in run_ids)
+        for row in self.db.execute(
+                f"SELECT name, samples FROM timings WHERE kind = ? AND run_id IN ({placeholders})",
+                [kind] + run_ids):
+            pooled.setdefault(row["name"], []).extend(json.loads(row["samples"]))
+        return pooled
+
+
+@dataclass
+class Regression:
+    """A name whose p95 grew beyond the threshold."""
+
+    kind: str
+    name: str
+    baseline_p95: float
+    current_p95: float
+    baseline_count: int
+    current_count: int
+
+    @property
+    def change(self) -> float:
+        return self.current_p95 / self.baseline_p95 - 1 if self.baseline_p95 else float("inf")
+
+
+def compare(kind: str, current: Dict[str, List[float]], baseline: Dict[str, List[float]],
+            threshold: float, min_delta: float = 0.0, min_samples: int = 1) -> List[Regression]:
+    """
+    Return the names whose p95 grew by more than `threshold` (0.2 = 20%) and by at least `min_delta` seconds.
+
+    Names missing from either side are new or gone, not regressions. Names
+    with fewer than `min_samples` current samples are skipped, since their
+    p95 is little more than one sample. The absolute floor keeps
+    millisecond-level noise on fast commands from failing the check.
+    """
+    regressions = []
+    for name, values in current.items():
+        if len(values) < max(min_samples, 1) or not baseline.get(name):
+            continue
+        before, after = percentile(baseline[name], 95), percentile(values, 95)
+        if after - before >= min_delta and after > before * (1 + threshold):
+            regressions.append(Regression(kind, name, before, after, len(baseline[name]), len(values)))
+    return sorted(regressions, key=lambda regression: regression.change, reverse=True)
+
+
+def _print_runs(runs: List[dict]):
+    print(f"{'run':28} {'recorded':19} {'commit':12} {'browser':16} {'mode':12} {'tests':>5}")
+    for run in runs:
+        recorded = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run["recorded"]))
+        print(f"{run['run_id']:28} {recorded:19} {(run['git_commit'] or '-')[:12]:12} "
+              f"{run['browser'] or '-':16} {run['run_mode'] or '-':12} {run['tests'] or 0:5}")
+
+
+def main(argv=None) -> int:
+    config = load_config()
+    parser = argparse.ArgumentParser(description="Inspect the run history and check runs for p95 regressions.")
+    parser.add_argument("--db", default=config.get("history_db") or DEFAULT_DB, help="Run-history database")
+    commands = parser.add_subparsers(dest="command", required=True)
+    listing = commands.add_parser("list", help="Show recorded runs, newest first")
+    listing.add_argument("--limit", type=int, default=20)
+    check = commands.add_parser("compare", help="Compare a run with a baseline; exit 1 on a p95 regression")
+    check.add_argument("--run", help="Run to check (default: the latest)")
+    check.add_argument("--baseline", help="Compare with this run instead of the previous runs")
+    check.add_argument("--baseline-runs", type=int, default=5,
+                       help="Previous runs in the same browser and run mode to pool as the baseline")
+    check.add_argument("--threshold", type=float, default=float(config.get("regression_threshold", 0.2)),
+                       help="Allowed p95 growth, as a fraction (0.2 = 20%%)")
+    check.add_argument("--min-delta", type=float, default=float(config.get("regression_min_delta", 0.05)),
+                       help="Ignore p95 increases smaller than this many seconds")
+    check.add_argument("--min-samples", type=int, default=int(config.get("regression_min_samples", 5)),
+                       help="Skip names with fewer samples than this in the checked run")
+    check.add_argument("--kinds", default="step",
+                       help=f"Comma-separated kinds to check: {', '.join(HISTORY_KINDS)}")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f"no run history at {args.db}")
+    with RunHistory(args.db) as history:
+        if args.command == "list":
+            _print_runs(history.runs(limit=args.limit))
+            return 0
+
+        kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+        unknown = set(kinds) - set(HISTORY_KINDS)
+        if unknown:
+            parser.error(f"unknown kinds: {', '.join(sorted(unknown))}")
+        latest = history.runs(limit=1)
+        current = history.run(args.run) if args.run else (latest[0] if latest else None)
+        if current is None:
+            parser.error(f"run {args.run} not found" if args.run else "the run history is empty")
+        if args.baseline:
+            if history.run(args.baseline) is None:
+                parser.error(f"baseline run {args.baseline} not found")
+            baseline_ids = [args.baseline]
+        else:
+            previous = history.runs(current["browser"], current["run_mode"], limit=args.baseline_runs + 50)
+            baseline_ids = [run["run_id"] for run in previous
+                            if run["run_id"] != current["run_id"] and run["recorded"] < current["recorded"]
+                            ][:args.baseline_runs]
+        if not baseline_ids:
+            print(f"No baseline run for {current['browser']}/{current['run_mode']}; nothing to compare.")
+            return 0
+
+        regressions = []
+        for kind in kinds:
+            regressions += compare(kind, history.samples([current["run_id"]], kind),
+                                   history.samples(baseline_ids, kind), args.threshold, args.min_delta,
+                                   args.min_samples)
+
+    print(f"Run {current['run_id']} ({(current['git_commit'] or '-')[:12]}) against "
+          f"{len(baseline_ids)} baseline run(s): {len(regressions)} p95 regression(s) "
+          f"above {args.threshold:.0%} and {args.min_delta}s (names with {args.min_samples}+ samples)")
+    for regression in regressions:
+        print(f"  {regression.kind:9} {regression.baseline_p95:8.3f}s -> {regression.current_p95:8.3f}s "
+              f"({regression.change:+.0%})  {regression.name}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Indexed, typed product catalog for test data.
+
+Scenarios look products up by title (and occasionally by id) many times per
+run. ProductCatalog builds the lookup tables once per session from the
+catalog API:
+- one immutable Product row per product, with the price held in integer cents
+- a title index and an id index over those rows for O(1) lookups
+
+Prices from the UI ("$ 799.00", "$1,399", "799") are parsed into cents with
+`to_cents`. Comparisons are therefore exact, with no float rounding and no
+trimming of ".00".
+"""
+
+import random
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+
+from api.clients.store_client import StoreClient
+
+
+class Product(NamedTuple):
+    """One catalog product."""
+
+    id: int
+    title: str
+    price_cents: int
+    currency: str = "USD"
+
+    @property
+    def price(self) -> Decimal:
+        """Return the price as an exact Decimal, e.g. Decimal("799.00")."""
+        return Decimal(self.price_cents).scaleb(-2)
+
+
+def to_cents(value) -> int:
+    """
+    Convert a price to integer cents.
+
+    Accepts catalog numbers (799, 799.5) and display strings ("$ 799.00",
+    "$1,399", "799.00"). Floats are converted through their shortest repr,
+    so 0.1 becomes 10 cents exactly.
+
+    Raises:
+        ValueError: If the value is not a price or has fractional cents.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"Not a price: {value!r}")
+    if isinstance(value, int):
+        return value * 100
+    text = repr(value) if isinstance(value, float) else str(value)
+    text = text.replace("$", "").replace(",", "").replace(" ", "").strip()
+    try:
+        amount = Decimal(text) * 100
+    except InvalidOperation:
+        raise ValueError(f"Not a price: {value!r}") from None
+    if amount != amount.to_integral_value():
+        raise ValueError(f"Price has fractional cents: {value!r}")
+    return int(amount)
+
+
+def expected_price_cents(value) -> int:
+    """
+    Return an expected price in cents.
+
+    Accepts a Product (its catalog price) or a display/decimal price
+    ("$ 799.00", "799", Decimal("799.00")), parsed with `to_cents`.
+
+    Raises:
+        TypeError: For a bare int, which could mean dollars (as `to_cents`
+            reads it) or cents; pass the Product or a display string instead.
+        ValueError: If the value is not a price.
+    """
+    if isinstance(value, Product):
+        return value.price_cents
+    if isinstance(value, int):
+        raise TypeError(f"Ambiguous expected price {value!r}: pass the Product or a display price such as \"$ 799.00\"")
+    return to_cents(value)
+
+
+def format_price(cents: int, symbol: str = "$ ") -> str:
+    """Return cents formatted like the side cart, e.g. 79900 -> "$ 799.00"."""
+    return f"{symbol}{Decimal(cents).scaleb(-2):.2f}"
+
+
+class ProductCatalog:
+    """Products indexed by title and by id."""
+
+    __slots__ = ("rows", "_by_title", "_by_id")
+
+    def __init__(self, products: Iterable[Product]):
+        self.rows = tuple(products)
+        self._by_title: Dict[str, Product] = {product.title: product for product in self.rows}
+        self._by_id: Dict[int, Product] = {product.id: product for product in self.rows}
+
+    @classmethod
+    def from_payload(cls, products: Iterable[dict]) -> "ProductCatalog":
+        """Build the catalog from product dicts as served by /products."""
+        return cls(
+            Product(int(item["id"]), item["title"], to_cents(item["price"]), item.get("currencyId") or "USD")
+            for item in products
+        )
+
+    @classmethod
+    def from_client(cls, client: StoreClient) -> "ProductCatalog":
+        """
+        Fetch the catalog once and index it.
+
+        Raises:
+            requests.HTTPError: If the catalog could not be fetched.
+        """
+        return cls.from_payload(client.products())
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self.rows)
+
+    def by_title(self, title: str) -> Product:
+        """
+        Return the product with the given title.
+
+        Raises:
+            KeyError: If no product has that title.
+        """
+        try:
+            return self._by_title[title]
+        except KeyError:
+            raise KeyError(f"Product '{title}' not found in catalog") from None
+
+    def by_id(self, product_id: int) -> Product:
+        """
+        Return the product with the given id.
+
+        Raises:
+            KeyError: If no product has that id.
+        """
+        try:
+            return self._by_id[int(product_id)]
+        except KeyError:
+            raise KeyError(f"Product id {product_id} not found in catalog") from None
+
+    def price_cents(self, title: str) -> int:
+        """Return the price of the product with the given title, in cents."""
+        return self.by_title(title).price_cents
+
+    def examples(self, count: int, seed: int = 0) -> List[Product]:
+        """
+        Return `count` products for generated Examples.
+
+        Every product appears before any repeats. The order is a seeded shuffle,
+        so a given (count, seed) always produces the same rows.
+
+        Raises:
+            ValueError: If rows are requested from an empty catalog.
+        """
+        if count <= 0:
+            return []
+        if not self.rows:
+            raise ValueError(f"Cannot generate {count} catalog example(s): the product catalog is empty")
+        order = list(self.rows)
+        random.Random(seed).shuffle(order)
+        return [order[index % len(order)] for index in range(count)]
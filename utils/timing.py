@@ -0,0 +1,134 @@
+"""
+Wall-time instrumentation for steps, page-object actions and WebDriver commands.
+
+A single TimingRecorder per process (i.e. per xdist worker) collects samples
+for three kinds of events:
+- "step": every Given/When/Then step, keyed by its text
+- "action": every BasePage helper call (click, type, get_text, waits, ...)
+- "command": every WebDriver wire command (findElement, clickElement, ...)
+
+Samples are grouped by the test that produced them so reports can show both
+the per-test breakdown and the aggregate per name.
+"""
+
+import functools
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+KINDS = ("step", "action", "command")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest-rank) of the values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def summarise(values: List[float]) -> Dict[str, float]:
+    """Return count, p50, p95, max and total for a list of durations."""
+    return {
+        "count": len(values),
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "max": round(max(values, default=0.0), 4),
+        "total": round(sum(values), 4),
+    }
+
+
+class TimingRecorder:
+    """Collect timing samples for the current process."""
+
+    def __init__(self):
+        self.enabled = True
+        self.current_test: Optional[str] = None
+        self.samples: Dict[str, Dict[str, List[float]]] = {kind: defaultdict(list) for kind in KINDS}
+        self.tests: Dict[str, dict] = {}
+
+    def start_test(self, nodeid: str):
+        """Attribute subsequent samples to the given test."""
+        self.current_test = nodeid
+        self.tests.setdefault(nodeid, {"steps": [], "commands": defaultdict(float), "duration": 0.0})
+
+    def record(self, kind: str, name: str, seconds: float):
+        """
+        Record one sample.
+
+        Args:
+            kind: One of "step", "action" or "command".
+            name: Step text, action name or WebDriver command name.
+            seconds: Wall time of the event.
+        """
+        if not self.enabled:
+            return
+        self.samples[kind][name].append(seconds)
+        test = self.tests.get(self.current_test)
+        if test is None:
+            return
+        if kind == "step":
+            test["steps"].append({"name": name, "seconds": round(seconds, 4)})
+        elif kind == "command":
+            test["commands"][name] += seconds
+
+    def snapshot(self) -> dict:
+        """Return the collected samples as plain, JSON-serialisable data."""
+        return {
+            "samples": {kind: dict(values) for kind, values in self.samples.items()},
+            "tests": {
+                nodeid: {
+                    "duration": round(test["duration"], 4),
+                    "steps": test["steps"],
+                    "commands": {name: round(value, 4) for name, value in test["commands"].items()},
+                }
+                for nodeid, test in self.tests.items()
+            },
+        }
+
+
+recorder = TimingRecorder()
+
+
+@contextmanager
+def timed(kind: str, name: str):
+    """Record the wall time of the enclosed block as one sample."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.record(kind, name, time.perf_counter() - start)
+
+
+def timed_action(method):
+    """Decorator recording the wall time of a BasePage helper as an "action"."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with timed("action", method.__name__):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument_driver(driver):
+    """
+    Record the wall time of every WebDriver command sent by this driver.
+
+    Safe to call repeatedly, e.g. for pooled sessions; the driver is only
+    wrapped once.
+    """
+    if getattr(driver, "_timing_instrumented", False):
+        return driver
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        with timed("command", driver_command):
+            return original(driver_command, params)
+
+    driver.execute = execute
+    driver._timing_instrumented = True  # pylint: disable=protected-access
+    return driver
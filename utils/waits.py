@@ -0,0 +1,151 @@
+"""
+Wait policy and wait/action accounting for WebDriver sessions.
+
+Mixing an implicit wait with explicit WebDriverWait polling makes every poll
+of a negative check block for the implicit timeout. This module owns the wait
+policy of each session (explicit-only by default), offers a context manager
+that temporarily disables the implicit wait for fast-fail checks, and keeps a
+per-session counter of how long tests spend waiting versus acting. Whether
+element waits run in the page (see utils.dom_waits) is decided here too.
+
+State is tracked per driver instance so page objects, which are created fresh
+in every step, share it without extra plumbing.
+"""
+
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+WAIT_POLICIES = ("explicit", "implicit")
+DEFAULT_EXPLICIT_WAIT = 5
+DEFAULT_RETRY_BACKOFF = 0.1
+
+
+@dataclass
+class WaitState:
+    """Wait configuration and accumulated timings for one browser session."""
+
+    policy: str = "explicit"
+    explicit_wait: float = DEFAULT_EXPLICIT_WAIT
+    implicit_wait: float = 0
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF
+    event_waits: bool = True
+    script_timeout: float = 30  # W3C default for new sessions
+    event_failures: int = 0
+    wait_seconds: float = 0.0
+    action_seconds: float = 0.0
+    in_page_waits: int = 0
+    poll_fallbacks: int = 0
+    round_trips_saved: int = 0
+
+    def reset_counters(self):
+        """Zero the wait/action counters, e.g. at the start of a test."""
+        self.wait_seconds = 0.0
+        self.action_seconds = 0.0
+        self.in_page_waits = 0
+        self.poll_fallbacks = 0
+        self.round_trips_saved = 0
+
+
+_states: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def wait_state(driver) -> WaitState:
+    """Return the WaitState for the given driver, creating it on first use."""
+    state = _states.get(driver)
+    if state is None:
+        state = WaitState()
+        _states[driver] = state
+    return state
+
+
+def set_implicit_wait(driver, seconds: float):
+    """
+    Set the implicit wait, skipping the round trip if it is already in effect.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        seconds: Implicit wait in seconds.
+    """
+    state = wait_state(driver)
+    if state.implicit_wait != seconds:
+        driver.implicitly_wait(seconds)
+        state.implicit_wait = seconds
+
+
+def apply_wait_policy(driver, config: dict):
+    """
+    Configure a session according to the `wait_policy` setting.
+
+    "explicit" (default) disables the implicit wait so only WebDriverWait
+    timeouts apply. "implicit" keeps the legacy behaviour of applying
+    `implicit_wait` on top of explicit waits. The base delay between click
+    retries (`click_retry_backoff`) and whether element waits run in the page
+    (`event_waits`) are set here too.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        config: Runtime configuration dictionary.
+
+    Raises:
+        ValueError: If an unknown wait policy is configured.
+    """
+    policy = (config.get("wait_policy") or "explicit").lower()
+    if policy not in WAIT_POLICIES:
+        raise ValueError(f"Unsupported wait_policy '{policy}'. Use: {', '.join(WAIT_POLICIES)}.")
+
+    state = wait_state(driver)
+    state.policy = policy
+    state.explicit_wait = config.get("explicit_wait", DEFAULT_EXPLICIT_WAIT)
+    state.retry_backoff = float(config.get("click_retry_backoff", DEFAULT_RETRY_BACKOFF))
+    state.event_waits = bool(config.get("event_waits", True))
+    state.event_failures = 0
+    # New W3C sessions start with a zero implicit wait, which WaitState mirrors,
+    # so the explicit policy costs no round trip at all.
+    set_implicit_wait(driver, config.get("implicit_wait", 10) if policy == "implicit" else 0)
+
+
+@contextmanager
+def no_implicit_wait(driver):
+    """Temporarily disable the implicit wait for fast-fail lookups."""
+    state = wait_state(driver)
+    previous = state.implicit_wait
+    if not previous:
+        yield
+        return
+    set_implicit_wait(driver, 0)
+    try:
+        yield
+    finally:
+        set_implicit_wait(driver, previous)
+
+
+@contextmanager
+def measure_wait(driver):
+    """Add the time spent inside the block to the session's wait counter."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wait_state(driver).wait_seconds += time.perf_counter() - start
+
+
+@contextmanager
+def measure_action(driver):
+    """
+    Add the time spent inside the block, minus any waiting, to the action counter.
+    """
+    state = wait_state(driver)
+    start = time.perf_counter()
+    waited_before = state.wait_seconds
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        state.action_seconds += max(elapsed - (state.wait_seconds - waited_before), 0.0)